@@ -6,8 +6,10 @@ for the forensics investigation system.
 """
 
 from config.settings import ForensicsConfig, DEFAULT_CONFIG
+from config.logging_setup import configure_logging
 
 __all__ = [
     'ForensicsConfig',
-    'DEFAULT_CONFIG'
+    'DEFAULT_CONFIG',
+    'configure_logging'
 ]
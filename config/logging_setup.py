@@ -0,0 +1,43 @@
+"""
+Logging setup for the Memory Forensics Agent.
+
+This module attaches a console handler to the agent's package loggers so
+diagnostics that used to be printed keep appearing on stdout, while library
+loggers (httpx, openai, ...) are left to their own configuration.
+
+Nothing is configured at import time; entry points call configure_logging().
+The handler writes synchronously, so log lines stay in order with the
+agent's remaining print output.
+"""
+
+import logging
+import sys
+
+# Top-level packages and modules whose loggers share the console handler
+PROJECT_LOGGERS = ("engines", "forensics_agent", "forensics_tools")
+
+_console_handler = None
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Attach a stdout handler to each project logger.
+
+    Safe to call more than once. Does nothing if the application has already
+    configured the root logger, whose handlers then receive these records
+    through normal propagation; project loggers that already have handlers
+    are left untouched as well.
+    """
+    global _console_handler
+    if logging.getLogger().handlers:
+        return
+    if _console_handler is None:
+        _console_handler = logging.StreamHandler(sys.stdout)
+        _console_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    for name in PROJECT_LOGGERS:
+        logger = logging.getLogger(name)
+        if logger.handlers:
+            continue
+        logger.addHandler(_console_handler)
+        logger.setLevel(level)
@@ -6,13 +6,19 @@ parameters and support environment variable overrides.
 """
 
 import os
+import functools
 from dataclasses import dataclass
 from typing import Optional, Union
 from pathlib import Path
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ForensicsConfig:
-    """Configuration class for Memory Forensics Agent settings."""
+    """
+    Configuration class for Memory Forensics Agent settings.
+    
+    Instances are immutable once built; use ``dataclasses.replace()`` to
+    derive a modified copy.
+    """
     
     # Analysis settings
     max_chunk_tokens: int = 20000  # Reduced to stay under rate limits
@@ -39,34 +45,61 @@ class ForensicsConfig:
     # Execution settings
     shell_path: Optional[str] = None  # Shell for command execution (None = system default /bin/sh)
     volatility_timeout: int = 600  # Timeout for volatility commands in seconds
+    triage_parallelism: int = 4  # Max global-triage commands run at once
     
     # Thresholds for deeper analysis
     threat_score_threshold: float = 7.0
     confidence_threshold: float = 0.8
+    disable_deeper_analysis: bool = False  # End the workflow after triage
+    
+    # Context caching
+    force_context_refresh: bool = False  # Ignore cached evidence context and re-read all files
+    disable_os_cache: bool = False  # Re-run OS detection instead of reusing the per-dump cached result
+    
+    # Output formatting
+    pretty_json: bool = True  # Indent top-level analysis result files; chunk artifacts are always compact
+    verbose: bool = True  # Print the start banner and summary even when stdout is not a terminal
+    
+    # Checkpointing
+    checkpoint_db: Optional[str] = None  # SQLite file for workflow checkpoints (None = disabled)
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> 'ForensicsConfig':
-        """Load configuration from environment variables."""
+        """
+        Load configuration from environment variables.
+        
+        The environment is read once and the resulting instance is cached for
+        the lifetime of the process. Call ``ForensicsConfig.from_env.cache_clear()``
+        after changing ``FORENSICS_*`` variables to pick up the new values.
+        """
+        env = dict(os.environ)
         return cls(
-            max_chunk_tokens=int(os.getenv('FORENSICS_MAX_CHUNK_TOKENS', 20000)),
-            max_retries=int(os.getenv('FORENSICS_MAX_RETRIES', 5)),
-            rate_limit_delay=float(os.getenv('FORENSICS_RATE_LIMIT_DELAY', 1.0)),
-            max_rate_limit_delay=float(os.getenv('FORENSICS_MAX_RATE_LIMIT_DELAY', 60.0)),
-            chunk_concurrency=int(os.getenv('FORENSICS_CHUNK_CONCURRENCY', 2)),
-            llm_timeout=int(os.getenv('FORENSICS_LLM_TIMEOUT', 120)),
-            llm_temperature=float(os.getenv('FORENSICS_LLM_TEMPERATURE', 0.0)),
-            llm_max_tokens=int(os.getenv('FORENSICS_LLM_MAX_TOKENS', 4000)),
-            planner_model=os.getenv('FORENSICS_PLANNER_MODEL', 'gpt-4o'),
-            evaluator_model=os.getenv('FORENSICS_EVALUATOR_MODEL', 'gpt-4o-mini'),
-            analyzer_model=os.getenv('FORENSICS_ANALYZER_MODEL', 'gpt-4o'),
-            fallback_analyzer_model=os.getenv('FORENSICS_FALLBACK_ANALYZER_MODEL', 'gpt-4o-mini'),
-            evidence_base_dir=os.getenv('FORENSICS_EVIDENCE_DIR', str(Path(__file__).parent.parent / "forensics_evidence")),
-            shell_path=os.getenv('FORENSICS_SHELL_PATH'),  # e.g., '/bin/zsh', '/bin/bash'
-            volatility_timeout=int(os.getenv('FORENSICS_VOLATILITY_TIMEOUT', 600)),
-            threat_score_threshold=float(os.getenv('FORENSICS_THREAT_THRESHOLD', 7.0)),
-            confidence_threshold=float(os.getenv('FORENSICS_CONFIDENCE_THRESHOLD', 0.8))
+            max_chunk_tokens=int(env.get('FORENSICS_MAX_CHUNK_TOKENS', 20000)),
+            max_retries=int(env.get('FORENSICS_MAX_RETRIES', 5)),
+            rate_limit_delay=float(env.get('FORENSICS_RATE_LIMIT_DELAY', 1.0)),
+            max_rate_limit_delay=float(env.get('FORENSICS_MAX_RATE_LIMIT_DELAY', 60.0)),
+            chunk_concurrency=int(env.get('FORENSICS_CHUNK_CONCURRENCY', 2)),
+            llm_timeout=int(env.get('FORENSICS_LLM_TIMEOUT', 120)),
+            llm_temperature=float(env.get('FORENSICS_LLM_TEMPERATURE', 0.0)),
+            llm_max_tokens=int(env.get('FORENSICS_LLM_MAX_TOKENS', 4000)),
+            planner_model=env.get('FORENSICS_PLANNER_MODEL', 'gpt-4o'),
+            evaluator_model=env.get('FORENSICS_EVALUATOR_MODEL', 'gpt-4o-mini'),
+            analyzer_model=env.get('FORENSICS_ANALYZER_MODEL', 'gpt-4o'),
+            fallback_analyzer_model=env.get('FORENSICS_FALLBACK_ANALYZER_MODEL', 'gpt-4o-mini'),
+            evidence_base_dir=env.get('FORENSICS_EVIDENCE_DIR', str(Path(__file__).parent.parent / "forensics_evidence")),
+            shell_path=env.get('FORENSICS_SHELL_PATH'),  # e.g., '/bin/zsh', '/bin/bash'
+            volatility_timeout=int(env.get('FORENSICS_VOLATILITY_TIMEOUT', 600)),
+            triage_parallelism=int(env.get('FORENSICS_TRIAGE_PARALLELISM', 4)),
+            threat_score_threshold=float(env.get('FORENSICS_THREAT_THRESHOLD', 7.0)),
+            confidence_threshold=float(env.get('FORENSICS_CONFIDENCE_THRESHOLD', 0.8)),
+            disable_deeper_analysis=env.get('FORENSICS_DISABLE_DEEPER_ANALYSIS', '').lower() in ('1', 'true', 'yes'),
+            force_context_refresh=env.get('FORENSICS_FORCE_CONTEXT_REFRESH', '').lower() in ('1', 'true', 'yes'),
+            disable_os_cache=env.get('FORENSICS_DISABLE_OS_CACHE', '').lower() in ('1', 'true', 'yes'),
+            pretty_json=env.get('FORENSICS_PRETTY_JSON', 'true').lower() in ('1', 'true', 'yes'),
+            verbose=env.get('FORENSICS_VERBOSE', 'true').lower() in ('1', 'true', 'yes'),
+            checkpoint_db=env.get('FORENSICS_CHECKPOINT_DB')  # e.g., './forensics_evidence/checkpoints.sqlite'
         )
 
-
 # Default configuration instance
 DEFAULT_CONFIG = ForensicsConfig()
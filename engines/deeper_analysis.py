@@ -8,12 +8,114 @@ triggered when high-threat indicators are detected.
 
 from typing import Dict, Any, List
 import json
+import logging
+import os
 import re
+from types import MappingProxyType
 from langchain_core.messages import SystemMessage, HumanMessage
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is used instead
+    orjson = None
+
 from models.state import ForensicState
 from utils.messages import build_deeper_analysis_system_message, build_deeper_analysis_user_message
 from config.settings import DEFAULT_CONFIG
+from volatility_executor import execute_investigation_plan
+
+
+_log = logging.getLogger(__name__)
+
+# Decoder for pulling the first JSON object out of free-form LLM output
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_plan_json(content: str, start: int) -> Dict[str, Any]:
+    """
+    Decode the JSON object starting at ``start`` in an LLM response.
+    
+    When nothing but whitespace or a closing code fence follows the object,
+    the whole remainder is handed to orjson. Otherwise the stdlib decoder
+    reads the first object and ignores the trailing text.
+    """
+    if orjson is not None:
+        remainder = content[start:].rstrip()
+        if remainder.endswith('```'):
+            remainder = remainder[:-3].rstrip()
+        if remainder.endswith('}'):
+            try:
+                return orjson.loads(remainder)
+            except orjson.JSONDecodeError:
+                pass
+    plan, _ = _JSON_DECODER.raw_decode(content, start)
+    return plan
+
+
+# Patterns used on every fallback pass
+_PID_RE = re.compile(r'pid[:\s]*(\d+)')
+
+# Finding types that always warrant deeper analysis
+_HIGH_PRIORITY = frozenset({"code_injection", "persistence", "network_activity"})
+
+# Command templates for targeted analysis based on finding types.
+# Shared, read-only state: tuples inside a mapping proxy.
+_DEEPER_ANALYSIS_COMMANDS = MappingProxyType({
+    "code_injection": (
+        "windows.malfind",
+        "windows.hollowfind", 
+        "windows.injected",
+        "windows.dumpfiles --pid {pid}"
+    ),
+    "persistence": (
+        "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\Run'",
+        "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\RunOnce'",
+        "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\RunOnceEx'",
+        "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\Policies\\Explorer\\Run'",
+        "windows.registry.printkey --key 'Software\\Microsoft\\Windows NT\\CurrentVersion\\Winlogon'",
+        "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\StartupApproved\\Run'",
+        "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\StartupApproved\\StartupFolder'",
+        "windows.registry.printkey --key 'Software\\Classes\\exefile\\shell\\open\\command'",
+        "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\ShellServiceObjectDelayLoad'",
+        "windows.services.svcscan",
+        "windows.registry.autostart",
+        "windows.scheduled_tasks"
+    ),
+    "network_activity": (
+        "windows.netscan",
+        "windows.netstat", 
+        "windows.connections",
+        "windows.dnsresolver"
+    ),
+    "process_anomalies": (
+        "windows.pslist",
+        "windows.pstree", 
+        "windows.cmdline",
+        "windows.handles --pid {pid}"
+    ),
+    "timeline_analysis": (
+        "timeliner.timeline",
+        "windows.mftscan.mftparser",
+        "windows.shellbags"
+    )
+})
+
+# Templates containing a {pid} placeholder, pre-split into (prefix, suffix)
+_PID_TEMPLATE_SPLITS = MappingProxyType({
+    cmd: tuple(cmd.split("{pid}", 1))
+    for commands in _DEEPER_ANALYSIS_COMMANDS.values()
+    for cmd in commands
+    if "{pid}" in cmd
+})
+
+
+
+def _is_high_priority_finding(finding: Dict[str, Any]) -> bool:
+    """Return True for high severity findings or high-priority finding types."""
+    if finding.get("severity", "").lower() == "high":
+        return True
+    finding_type = finding.get("finding_type", "").lower()
+    return finding_type in _HIGH_PRIORITY or any(hpt in finding_type for hpt in _HIGH_PRIORITY)
 
 
 class DeeperAnalysisEngine:
@@ -25,51 +127,14 @@ class DeeperAnalysisEngine:
     warrant focused investigation.
     """
     
+    DEEPER_ANALYSIS_COMMANDS = _DEEPER_ANALYSIS_COMMANDS
+    
     def __init__(self, parent_agent, config=None):
         """Initialize deeper analysis engine with reference to parent agent."""
         self.parent = parent_agent  # Access to shared LLMs, tools, and state
         self.config = config or DEFAULT_CONFIG
-        
-        # Command templates for targeted analysis based on finding types
-        self.DEEPER_ANALYSIS_COMMANDS = {
-            "code_injection": [
-                "windows.malfind",
-                "windows.hollowfind", 
-                "windows.injected",
-                "windows.dumpfiles --pid {pid}"
-            ],
-            "persistence": [
-                "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\Run'",
-                "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\RunOnce'",
-                "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\RunOnceEx'",
-                "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\Policies\\Explorer\\Run'",
-                "windows.registry.printkey --key 'Software\\Microsoft\\Windows NT\\CurrentVersion\\Winlogon'",
-                "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\StartupApproved\\Run'",
-                "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\StartupApproved\\StartupFolder'",
-                "windows.registry.printkey --key 'Software\\Classes\\exefile\\shell\\open\\command'",
-                "windows.registry.printkey --key 'Software\\Microsoft\\Windows\\CurrentVersion\\ShellServiceObjectDelayLoad'",
-                "windows.services.svcscan",
-                "windows.registry.autostart",
-                "windows.scheduled_tasks"
-            ],
-            "network_activity": [
-                "windows.netscan",
-                "windows.netstat", 
-                "windows.connections",
-                "windows.dnsresolver"
-            ],
-            "process_anomalies": [
-                "windows.pslist",
-                "windows.pstree", 
-                "windows.cmdline",
-                "windows.handles --pid {pid}"
-            ],
-            "timeline_analysis": [
-                "timeliner.timeline",
-                "windows.mftscan.mftparser",
-                "windows.shellbags"
-            ]
-        }
+        # The system prompt is static, so build it once per engine
+        self._system_message = SystemMessage(content=build_deeper_analysis_system_message())
     
     def should_trigger_deeper_analysis(self, analysis_result: Dict[str, Any]) -> bool:
         """
@@ -81,29 +146,16 @@ class DeeperAnalysisEngine:
         Returns:
             bool: True if deeper analysis should be triggered
         """
-        # High threat score threshold
-        threat_score = analysis_result.get("threat_score", 0)
-        if threat_score >= self.config.threat_score_threshold:
-            return True
-            
-        # Low confidence in analysis  
-        confidence = analysis_result.get("analysis_confidence", 1.0)
-        if confidence < self.config.confidence_threshold:
-            return True
-            
-        # Check for specific high-priority finding types
-        findings = analysis_result.get("analysis_results", {}).get("suspicious_findings", [])
-        high_priority_types = {"code_injection", "persistence", "network_activity"}
-        
-        for finding in findings:
-            finding_type = finding.get("finding_type", "").lower()
-            severity = finding.get("severity", "").lower()
-            
-            # High severity findings or specific types warrant deeper analysis
-            if severity == "high" or any(hpt in finding_type for hpt in high_priority_types):
-                return True
-                
-        return False
+        # High threat score, low confidence, or any high-priority finding;
+        # the findings lookup only runs when both thresholds pass
+        return (
+            analysis_result.get("threat_score", 0) >= self.config.threat_score_threshold
+            or analysis_result.get("analysis_confidence", 1.0) < self.config.confidence_threshold
+            or any(
+                _is_high_priority_finding(finding)
+                for finding in analysis_result.get("analysis_results", {}).get("suspicious_findings", [])
+            )
+        )
     
     def generate_deeper_analysis_plan(self, initial_findings: Dict[str, Any], state: ForensicState) -> Dict[str, Any]:
         """
@@ -120,27 +172,26 @@ class DeeperAnalysisEngine:
             Dict containing deeper analysis plan
         """
         try:
-            # Create system and user messages
-            system_message = build_deeper_analysis_system_message()
+            # Only the user message depends on the findings
             user_message = build_deeper_analysis_user_message(initial_findings, state)
             
-            planning_messages = [
-                SystemMessage(content=system_message),
+            planning_messages = (
+                self._system_message,
                 HumanMessage(content=user_message)
-            ]
+            )
             
-            print("🧠 Generating intelligent deeper analysis plan...")
+            _log.info("🧠 Generating intelligent deeper analysis plan...")
             llm_response = self.parent.planner_llm.invoke(planning_messages)
             
             # Parse LLM response to extract plan
             try:
-                # Extract JSON from LLM response
+                # Decode the first JSON object in the response, ignoring any
+                # surrounding prose or trailing text after its closing brace
                 response_content = llm_response.content
-                json_match = re.search(r'\{.*\}', response_content, re.DOTALL)
+                json_start = response_content.find('{')
                 
-                if json_match:
-                    plan_json = json_match.group()
-                    plan = json.loads(plan_json)
+                if json_start != -1:
+                    plan = _decode_plan_json(response_content, json_start)
                     
                     # Extract just the command strings for execution
                     command_list = []
@@ -163,19 +214,19 @@ class DeeperAnalysisEngine:
                         "success_criteria": plan.get("success_criteria", "Enhanced threat understanding")
                     }
                     
-                    print(f"✅ LLM generated plan with {len(command_list)} targeted commands")
+                    _log.info("✅ LLM generated plan with %d targeted commands", len(command_list))
                     return final_plan
                     
                 else:
-                    print("⚠️ Could not extract JSON from LLM response, falling back to rule-based")
+                    _log.warning("⚠️ Could not extract JSON from LLM response, falling back to rule-based")
                     return self._fallback_rule_based_plan(initial_findings.get("analysis_results", {}).get("suspicious_findings", []), state)
                     
             except (json.JSONDecodeError, KeyError) as e:
-                print(f"⚠️ Error parsing LLM plan: {e}, falling back to rule-based")
+                _log.warning("⚠️ Error parsing LLM plan: %s, falling back to rule-based", e)
                 return self._fallback_rule_based_plan(initial_findings.get("analysis_results", {}).get("suspicious_findings", []), state)
                 
         except Exception as e:
-            print(f"❌ Error generating LLM plan: {e}, falling back to rule-based")
+            _log.error("❌ Error generating LLM plan: %s, falling back to rule-based", e)
             return self._fallback_rule_based_plan(initial_findings.get("analysis_results", {}).get("suspicious_findings", []), state)
     
     def _fallback_rule_based_plan(self, findings: List[Dict], state: ForensicState) -> Dict[str, Any]:
@@ -196,8 +247,10 @@ class DeeperAnalysisEngine:
         for finding in findings:
             finding_type = finding.get("finding_type", "").lower()
             description = finding.get("description", "").lower()
+            evidence = finding.get("evidence", "").lower()
             
-            if "injection" in description or "inject" in description:
+            # Plain substring checks: faster than any regex over the description
+            if "inject" in description:
                 analysis_categories.add("code_injection")
             elif "persistence" in description or "registry" in description:
                 analysis_categories.add("persistence") 
@@ -207,26 +260,28 @@ class DeeperAnalysisEngine:
                 analysis_categories.add("process_anomalies")
                 
             # Extract PIDs if mentioned
-            evidence = finding.get("evidence", "")
-            pid_matches = re.findall(r'pid[:\s]*(\d+)', evidence.lower())
+            pid_matches = _PID_RE.findall(evidence)
             target_pids.extend(pid_matches)
         
-        # Generate commands using templates
-        deeper_commands = []
+        # Generate commands using templates; a dict keeps first-seen order
+        # while dropping duplicates that would re-run the same plugin
+        deeper_commands: Dict[str, None] = {}
         for category in analysis_categories:
-            commands = self.DEEPER_ANALYSIS_COMMANDS.get(category, [])
+            commands = _DEEPER_ANALYSIS_COMMANDS.get(category, ())
             for cmd in commands[:3]:  # Limit to avoid explosion
-                if "{pid}" in cmd and target_pids:
+                pid_split = _PID_TEMPLATE_SPLITS.get(cmd)
+                if pid_split and target_pids:
+                    prefix, suffix = pid_split
                     for pid in target_pids[:2]:
-                        deeper_commands.append(cmd.format(pid=pid))
+                        deeper_commands[prefix + pid + suffix] = None
                 else:
-                    deeper_commands.append(cmd)
+                    deeper_commands[cmd] = None
         
         return {
             "plan_version": "fallback_v1.0",
             "analysis_type": "rule_based_fallback",
             "focus_areas": list(analysis_categories),
-            "targeted_commands": deeper_commands[:8],  # Limit commands
+            "targeted_commands": list(deeper_commands)[:8],  # Limit commands
             "investigation_strategy": "Rule-based fallback analysis"
         }
     
@@ -238,26 +293,26 @@ class DeeperAnalysisEngine:
         to drill down into specific threats identified in initial analysis.
         """
         try:
-            print("🔬 Starting Deeper Analysis Phase")
+            _log.info("🔬 Starting Deeper Analysis Phase")
             
             # Get initial findings from triage
             analysis_results = state.get("analysis_results")
             if not analysis_results:
-                print("⚠️ No triage results available for deeper analysis")
+                _log.warning("⚠️ No triage results available for deeper analysis")
                 return {"investigation_stage": "deeper_analysis_skipped"}
             
             # Generate deeper analysis plan
             deeper_plan = self.generate_deeper_analysis_plan(analysis_results, state)
             
-            print(f"📋 Generated deeper analysis plan: {deeper_plan.get('analysis_type', 'unknown')}")
-            print(f"🎯 Focus areas: {', '.join(deeper_plan.get('focus_areas', []))}")
-            print(f"📋 Executing {len(deeper_plan.get('targeted_commands', []))} specialized commands")
+            _log.info("📋 Generated deeper analysis plan: %s", deeper_plan.get('analysis_type', 'unknown'))
+            _log.info("🎯 Focus areas: %s", ', '.join(deeper_plan.get('focus_areas', [])))
+            _log.info("📋 Executing %d specialized commands", len(deeper_plan.get('targeted_commands', [])))
             
             # Display LLM reasoning if available
             if "threat_assessment" in deeper_plan:
-                print(f"🧠 LLM Assessment: {deeper_plan['threat_assessment']}")
+                _log.info("🧠 LLM Assessment: %s", deeper_plan['threat_assessment'])
             if "investigation_strategy" in deeper_plan:
-                print(f"📈 Strategy: {deeper_plan['investigation_strategy']}")
+                _log.info("📈 Strategy: %s", deeper_plan['investigation_strategy'])
             
             # Convert deeper analysis plan to execution format
             execution_plan = {
@@ -276,14 +331,11 @@ class DeeperAnalysisEngine:
             }
             
             # Execute deeper analysis using existing execution infrastructure
-            import os
-            from volatility_executor import execute_investigation_plan
-            
             evidence_directory = state.get("evidence_directory", "")
             deeper_evidence_dir = os.path.join(evidence_directory, "deeper_analysis")
             os.makedirs(deeper_evidence_dir, exist_ok=True)
             
-            print("🔄 Executing deeper analysis commands...")
+            _log.info("🔄 Executing deeper analysis commands...")
             execution_results = execute_investigation_plan(execution_plan, deeper_evidence_dir)
             
             # Return comprehensive results
@@ -295,7 +347,7 @@ class DeeperAnalysisEngine:
             }
             
         except Exception as e:
-            print(f"❌ Deeper analysis error: {e}")
+            _log.error("❌ Deeper analysis error: %s", e)
             return {
                 "deeper_analysis_error": str(e),
                 "investigation_stage": "deeper_analysis_failed"
@@ -6,29 +6,553 @@ It integrates all the modular components into a cohesive investigation workflow.
 """
 
 import asyncio
+import functools
+import itertools
+import hashlib
+import json
+import logging
+import mmap
+import os
 import random
-from typing import Dict, Any, List
+import re
+import sys
+import threading
+from collections import deque
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 
+import httpx
 from langchain_openai import ChatOpenAI
+from pydantic import TypeAdapter
+from openai import RateLimitError
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
 from langchain_community.tools import ShellTool
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableConfig
+from langgraph.cache.memory import InMemoryCache
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.graph import StateGraph, START, END
+from langgraph.types import CachePolicy, Command, Send
 from dotenv import load_dotenv
 
+try:
+    import h2  # noqa: F401  # enables HTTP/2 in httpx
+    _HTTP2 = True
+except ImportError:  # httpx then pools HTTP/1.1 keep-alive connections
+    _HTTP2 = False
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; appends are then unlocked
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is used instead
+    orjson = None
+
+# Parses str or bytes, preferring the faster orjson decoder
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    _ORJSON_INDENT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _json_dumps_bytes(obj: Any, indent: bool = False, default=None, newline: bool = False) -> bytes:
+    """
+    Serialize ``obj`` to UTF-8 JSON bytes, preferring orjson when installed.
+    
+    With ``newline`` the trailing newline is emitted by the encoder itself, so
+    the result can go out in one write without another bytes copy.
+    """
+    if orjson is not None:
+        option = _ORJSON_INDENT_OPTIONS if indent else _ORJSON_OPTIONS
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, default=default, option=option)
+    text = json.dumps(obj, indent=2 if indent else None, default=default)
+    return (text + "\n" if newline else text).encode('utf-8')
+
 # Import our modular components
-from models import ForensicState, EvaluatorOutput, AnalysisOutput
-from config import ForensicsConfig
+from models import ForensicState, EvaluatorOutput, AnalysisOutput, SuspiciousFinding
+from config import ForensicsConfig, configure_logging
 from nodes import (
     detect_os_node,
+    FALLBACK_PLAN_VERSION,
     planner_node, validate_investigation_plan,
     evaluator_node, route_based_on_evaluation,
-    execution_node, route_after_execution
+    execution_node, execute_phase_node, finish_execution_node, route_after_execution
 )
 from engines import DeeperAnalysisEngine
-from utils import count_tokens
+from utils import count_tokens, count_tokens_batch, build_analysis_user_message_vars
+from utils.messages import ANALYSIS_SYSTEM_MESSAGE, ANALYSIS_USER_TEMPLATE
 from forensics_tools import forensics_tools
 
 load_dotenv(override=True)
 
+# Named explicitly so the logger is still configured when run as __main__
+_log = logging.getLogger("forensics_agent")
+
+
+# Per-evidence-directory cache of the gathered file samples
+CONTEXT_CACHE_FILENAME = ".context_cache.json"
+
+# Append-only log of analyzed chunks, one JSON record per line
+CHUNK_RESULTS_FILENAME = "chunks_results.jsonl"
+
+# Per-chunk result files written before the results log was introduced
+LEGACY_CHUNK_RESULT_SUFFIX = "_result.json"
+_LEGACY_CHUNK_RESULT_SUFFIX_LEN = len(LEGACY_CHUNK_RESULT_SUFFIX)
+
+# Lines tokenized per batch while splitting context into chunks
+TOKEN_COUNT_BATCH_LINES = 1024
+
+
+# Chunk-analysis prompt, parsed once and filled per chunk
+_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", ANALYSIS_SYSTEM_MESSAGE),
+    ("human", ANALYSIS_USER_TEMPLATE)
+])
+
+
+# Dumps a whole findings list in one validated pass
+_FINDINGS_ADAPTER = TypeAdapter(List[SuspiciousFinding])
+
+
+# Evidence outputs are named "<YYYYMMDD_HHMMSS>_<plugin>.txt"
+_EVIDENCE_TIMESTAMP_PREFIX = re.compile(r'^\d{8}_\d{6}_')
+
+
+def _list_unique_plugin_files(directory: str) -> List[str]:
+    """
+    Return one .txt evidence file per plugin below ``directory``.
+    
+    Walks top-down with os.scandir, which reuses directory-entry types instead
+    of stat-ing each path, and deduplicates while walking: some plugins are run
+    multiple times, and only the first output found for each is kept.
+    """
+    seen_plugins = set()
+    selected_files = []
+    
+    def scan(path: str):
+        subdirs = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.txt') and entry.is_file():
+                    plugin_name = _EVIDENCE_TIMESTAMP_PREFIX.sub('', entry.name)
+                    if plugin_name not in seen_plugins:
+                        seen_plugins.add(plugin_name)
+                        selected_files.append(entry.path)
+        for subdir in subdirs:
+            scan(subdir)
+    
+    scan(directory)
+    return selected_files
+
+
+def _count_context_tokens(parts: List[str]) -> int:
+    """Count the tokens of ``parts`` joined by newlines, each newline counted as one token."""
+    return sum(count_tokens_batch(parts)) + max(len(parts) - 1, 0)
+
+
+def _drain_context_lines(parts: deque) -> Iterator[str]:
+    """
+    Yield the lines of ``"\\n".join(parts)`` while emptying ``parts``.
+    
+    Each part is dropped from the deque before its lines are produced, so the
+    gathered context is released as the splitter consumes it.
+    """
+    while parts:
+        yield from parts.popleft().split('\n')
+
+
+def _read_file_bytes(path: str) -> bytes:
+    """
+    Read a whole file as bytes.
+    
+    Uses a raw descriptor and a read sized by fstat, so a typical file is
+    loaded in one read plus the EOF check, without the buffered I/O layer.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        parts = []
+        while True:
+            data = os.read(fd, max(size, 1 << 16))
+            if not data:
+                break
+            parts.append(data)
+    finally:
+        os.close(fd)
+    return b"".join(parts)
+
+
+def _read_text_file(path: str) -> str:
+    """Read a text evidence file, ignoring undecodable bytes."""
+    return _read_file_bytes(path).decode('utf-8', errors='ignore')
+
+
+# Raw descriptors for whole-buffer writes; the extra flags are absent on some platforms
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+
+def _write_all(fd: int, data: bytes):
+    """Write all of ``data`` to ``fd``, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+_JSON_NATIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def _jsonable(obj: Any) -> Any:
+    """
+    Return ``obj`` with every value a JSON encoder handles natively.
+    
+    Dates become ISO strings, paths become strings and any other unknown
+    object its ``str()``; containers are copied only along the way.
+    """
+    if isinstance(obj, _JSON_NATIVE_TYPES):
+        return obj
+    if isinstance(obj, dict):
+        return {key: _jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(item) for item in obj]
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, os.PathLike):
+        return os.fspath(obj)
+    return str(obj)
+
+
+def _write_bytes_file(path: str, data: bytes):
+    """Replace ``path`` with ``data`` through an unbuffered descriptor."""
+    fd = os.open(path, _WRITE_FLAGS | os.O_TRUNC, 0o644)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_text_file(path: str, content: str):
+    """Write ``content`` to ``path`` as UTF-8."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def _evidence_signature(paths: List[str]) -> str:
+    """Hash the (path, mtime, size) of each evidence file into a cache key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(paths):
+        try:
+            st = os.stat(path)
+            digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        except OSError:
+            digest.update(f"{path}\0missing\n".encode())
+    return digest.hexdigest()
+
+
+def _load_context_cache(cache_path: str, signature: str):
+    """Return the cached sample context if it matches ``signature``, else None."""
+    try:
+        # The cache holds every sampled file, so it is fetched in one sized read
+        cache = _json_loads(_read_file_bytes(cache_path))
+    except (OSError, ValueError):
+        return None
+    if cache.get("signature") != signature:
+        return None
+    return cache.get("sample_context")
+
+
+# Records are written as {"chunk_id": ..., "result": ...}, so the id leads each line
+_CHUNK_RECORD_ID = re.compile(rb'\{\s*"chunk_id"\s*:\s*"([^"\\]+)"')
+
+
+class LazyChunkResults(Mapping):
+    """
+    Read-only mapping of saved chunk results that parses payloads on demand.
+    
+    Only each chunk id and the location of its record are kept in memory, so
+    membership checks cost no I/O and a resumed run holds just the payloads
+    it actually looks up.
+    """
+    
+    def __init__(self, locations: Dict[str, Tuple[str, int, int]]):
+        # chunk_id -> (path, offset, length); a negative length means the whole file
+        self._locations = locations
+    
+    def __getitem__(self, chunk_id: str) -> Dict[str, Any]:
+        path, offset, length = self._locations[chunk_id]
+        try:
+            if length < 0:
+                return _json_loads(_read_file_bytes(path))
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                return _json_loads(f.read(length))["result"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            _log.warning("⚠️ Skipping unreadable chunk result %s: %s", chunk_id, e)
+            raise KeyError(chunk_id) from e
+    
+    def __contains__(self, chunk_id: object) -> bool:
+        # Mapping's default would read and parse the record
+        return chunk_id in self._locations
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._locations)
+    
+    def __len__(self) -> int:
+        return len(self._locations)
+
+
+def _index_legacy_chunk_results(chunks_directory: str) -> Dict[str, Tuple[str, int, int]]:
+    """Locate ``chunk_XXX_result.json`` files left in ``chunks_directory`` by older runs."""
+    try:
+        with os.scandir(chunks_directory) as entries:
+            return {
+                entry.name[:-_LEGACY_CHUNK_RESULT_SUFFIX_LEN]: (entry.path, 0, -1)
+                for entry in entries
+                if entry.name.startswith("chunk_") and entry.name.endswith(LEGACY_CHUNK_RESULT_SUFFIX)
+            }
+    except OSError:
+        return {}
+
+
+def _index_chunk_results_log(results_file: str) -> Dict[str, Tuple[str, int, int]]:
+    """
+    Locate the latest record for each chunk in a results log.
+    
+    The log is memory-mapped and only the leading chunk id of each line is
+    matched; payloads are left unparsed until looked up.
+    """
+    locations = {}
+    try:
+        f = open(results_file, 'rb')
+    except FileNotFoundError:
+        return locations
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return locations
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            line_number = 0
+            while start < size:
+                line_number += 1
+                end = mm.find(b"\n", start)
+                if end < 0:
+                    # A torn final line from an interrupted run is expected
+                    _log.warning("⚠️ Skipping unterminated chunk result on line %s", line_number)
+                    break
+                match = _CHUNK_RECORD_ID.match(mm, start, end)
+                if match:
+                    locations[match.group(1).decode()] = (results_file, start, end - start)
+                elif mm[start:end].strip():
+                    _log.warning("⚠️ Skipping unreadable chunk result on line %s", line_number)
+                start = end + 1
+    return locations
+
+
+def _agent_from_config(config: RunnableConfig) -> "MemoryForensicsAgent":
+    """Return the agent that started the current graph run."""
+    return config["configurable"]["agent"]
+
+
+def _goto(route: str) -> str:
+    """Translate a router's "END" sentinel into the graph's END node."""
+    return END if route == "END" else route
+
+
+async def _planner_step(state: ForensicState, config: RunnableConfig) -> Dict[str, Any]:
+    return await _agent_from_config(config)._planner_wrapper(state)
+
+
+async def _evaluator_step(state: ForensicState, config: RunnableConfig) -> Command:
+    # Route in the same step as the state write instead of via a conditional edge
+    agent = _agent_from_config(config)
+    update = await agent._evaluator_wrapper(state)
+    route = route_based_on_evaluation({**state, **update}, agent.config.max_retries)
+    return Command(update=update, goto=_goto(route))
+
+
+async def _gather_context_step(state: ForensicState, config: RunnableConfig) -> Command:
+    return await _agent_from_config(config)._prepare_triage(state)
+
+
+async def _analyze_chunk_step(task: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+    return await _agent_from_config(config)._analyze_chunk_task(task)
+
+
+async def _triage_step(state: ForensicState, config: RunnableConfig) -> Command:
+    agent = _agent_from_config(config)
+    update = await agent._triage_wrapper(state)
+    route = agent._route_after_analysis({**state, **update})
+    return Command(update=update, goto=_goto(route))
+
+
+async def _triage_final_step(state: ForensicState, config: RunnableConfig) -> Dict[str, Any]:
+    # Used when deeper analysis is disabled: triage always ends the run
+    return await _agent_from_config(config)._triage_wrapper(state)
+
+
+async def _deeper_analysis_step(state: ForensicState, config: RunnableConfig) -> Dict[str, Any]:
+    return await _agent_from_config(config)._deeper_analysis_wrapper(state)
+
+
+def _is_degraded_write(write: Tuple[str, Any]) -> bool:
+    """Whether a node write is a fallback result: an undetected OS or the rule-based plan."""
+    channel, value = write
+    if channel == "os_hint":
+        return value == "unknown"
+    if channel == "investigation_plan":
+        return isinstance(value, dict) and value.get("plan_version") == FALLBACK_PLAN_VERSION
+    return False
+
+
+class _NodeCache(InMemoryCache):
+    """
+    Node cache that never stores degraded outputs.
+    
+    LangGraph caches whatever a node returns unless it raises, but OS
+    detection and planning fall back instead of raising. Entries whose
+    writes include a fallback result are dropped, so the next run retries.
+    """
+    
+    def set(self, keys):
+        super().set({
+            full_key: entry for full_key, entry in keys.items()
+            if not any(map(_is_degraded_write, entry[0]))
+        })
+    
+    async def aset(self, keys):
+        self.set(keys)
+
+
+# Node-level cache shared by every compiled graph in the process: OS detection
+# and planning are replayed for identical inputs instead of re-run
+_NODE_CACHE_TTL = 3600
+_node_cache = _NodeCache()
+
+
+def _detect_os_cache_key(state: ForensicState) -> str:
+    """Key OS detection on the dump's identity, so a replaced dump is re-detected."""
+    dump_path = state.get("memory_dump_path")
+    try:
+        st = os.stat(dump_path) if dump_path else None
+    except OSError:
+        st = None
+    identity = (st.st_size, st.st_mtime_ns) if st else None
+    return json.dumps([dump_path, state.get("os_hint"), identity])
+
+
+def _planner_identity(config: ForensicsConfig) -> Tuple[str, float, int]:
+    """The planner settings that change its output for the same prompt."""
+    return (config.planner_model, config.llm_temperature, config.llm_max_tokens)
+
+
+def _planner_cache_key(identity: Tuple[str, float, int], state: ForensicState) -> str:
+    """Key planning on the planner model settings, everything that feeds its prompt, and the retry count it returns."""
+    return json.dumps([
+        identity, state.get("memory_dump_path"), state.get("os_hint"), state.get("user_prompt"),
+        state.get("evaluation_feedback"), state.get("retry_count", 0)
+    ], default=str)
+
+
+def _graph_builder(allow_replanning: bool = True, deeper_analysis: bool = True,
+                   cache_os_detection: bool = True,
+                   planner_identity: Tuple[str, float, int] = ("", 0.0, 0)) -> StateGraph:
+    """
+    Build the investigation workflow graph.
+    
+    The graph holds no agent state; LLMs and configuration are resolved per
+    run through ``config["configurable"]["agent"]``. Branches the config rules
+    out are left out of the topology instead of being re-checked every run.
+    
+    Args:
+        allow_replanning: Whether the evaluator may send the plan back to the planner
+        deeper_analysis: Whether triage may hand off to deeper analysis
+        cache_os_detection: Whether detect_os results may be replayed from the node cache
+        planner_identity: Planner model settings, part of the planner's cache key
+    """
+    graph_builder = StateGraph(ForensicState)
+    
+    # Register nodes
+    detect_os_cache = CachePolicy(key_func=_detect_os_cache_key, ttl=_NODE_CACHE_TTL) if cache_os_detection else None
+    graph_builder.add_node("detect_os", detect_os_node, cache_policy=detect_os_cache)  # New: OS detection
+    planner_cache = CachePolicy(key_func=functools.partial(_planner_cache_key, planner_identity), ttl=_NODE_CACHE_TTL)
+    graph_builder.add_node("planner", _planner_step, cache_policy=planner_cache)
+    graph_builder.add_node("validate_plan", validate_investigation_plan)
+    evaluator_destinations = ("planner", "execution", END) if allow_replanning else ("execution", END)
+    graph_builder.add_node("evaluator", _evaluator_step, destinations=evaluator_destinations)
+    graph_builder.add_node("execution", execution_node, destinations=("execute_phase", "finish_execution"))
+    graph_builder.add_node("execute_phase", execute_phase_node)
+    graph_builder.add_node("finish_execution", finish_execution_node)
+    graph_builder.add_node("gather_context", _gather_context_step, destinations=("analyze_chunk", "triage"))
+    graph_builder.add_node("analyze_chunk", _analyze_chunk_step)
+    if deeper_analysis:
+        graph_builder.add_node("triage", _triage_step, destinations=("deeper_analysis", END))
+        graph_builder.add_node("deeper_analysis", _deeper_analysis_step)
+    else:
+        graph_builder.add_node("triage", _triage_final_step)
+    
+    # Define the flow: START → detect_os → planner → validate_plan → evaluator → execution
+    #   → gather_context → analyze_chunk (one task per chunk) → triage → deeper_analysis → END
+    graph_builder.add_edge(START, "detect_os")  # New: Start with OS detection
+    graph_builder.add_edge("detect_os", "planner")  # New: OS detection before planning
+    graph_builder.add_edge("planner", "validate_plan")
+    graph_builder.add_edge("validate_plan", "evaluator")
+    
+    # evaluator and triage route themselves by returning a Command
+    
+    # execution fans plan phases out to execute_phase with Send;
+    # finish_execution runs once every phase task has finished
+    graph_builder.add_edge("execute_phase", "finish_execution")
+    
+    # Conditional routing from execution to triage
+    graph_builder.add_conditional_edges(
+        "finish_execution",
+        route_after_execution,
+        {"triage": "gather_context", "END": END}
+    )
+    
+    # gather_context fans chunks out to analyze_chunk with Send; triage
+    # runs once every chunk task of that step has finished
+    graph_builder.add_edge("analyze_chunk", "triage")
+    
+    if deeper_analysis:
+        # Deeper analysis always routes to END when complete
+        graph_builder.add_edge("deeper_analysis", END)
+    else:
+        graph_builder.add_edge("triage", END)
+    
+    return graph_builder
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_graph(allow_replanning: bool = True, deeper_analysis: bool = True,
+                    cache_os_detection: bool = True,
+                    planner_identity: Tuple[str, float, int] = ("", 0.0, 0)):
+    """Compile the workflow graph once per topology, without a checkpointer."""
+    return _graph_builder(
+        allow_replanning, deeper_analysis, cache_os_detection, planner_identity
+    ).compile(cache=_node_cache)
+
+
+def _investigation_thread_id(memory_dump_path: str, os_hint: str, user_prompt: str) -> str:
+    """Derive a stable checkpoint thread id from the investigation inputs."""
+    key = f"{memory_dump_path}\0{os_hint}\0{user_prompt}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
 
 class MemoryForensicsAgent:
     """
@@ -47,12 +571,34 @@ class MemoryForensicsAgent:
         """
         self.config = config or ForensicsConfig.from_env()
         
+        # Console banners are only worth formatting for an interactive reader
+        self._show_console_output = self.config.verbose or sys.stdout.isatty()
+        
         # LLM instances will be initialized in setup_llm()
         self.planner_llm = None
         self.evaluator_llm = None  
         self.analyzer_llm = None
         self.graph = None
         self.tools = None
+        self._http_client = None
+        self._http_async_client = None
+        self._checkpointer = None
+        self._checkpointer_cm = None
+        
+        # Open append descriptors for chunk results logs, keyed by path
+        self._chunk_results_fds: Dict[str, int] = {}
+        self._chunk_results_lock = threading.Lock()
+        
+        # Output directories already created by this agent
+        self._ensured_dirs: set[str] = set()
+        self._results_prefixes: Dict[str, str] = {}
+        
+        # Disambiguates result files saved within the same second
+        self._save_seq = itertools.count()
+        
+        # Bounds concurrent chunk-analysis LLM calls; rebuilt per event loop
+        self._chunk_semaphore: Optional[asyncio.Semaphore] = None
+        self._chunk_semaphore_loop = None
         
         # Initialize specialized analysis engine
         self.deeper_analysis_engine = DeeperAnalysisEngine(self, self.config)
@@ -62,9 +608,22 @@ class MemoryForensicsAgent:
         # Get forensics tools
         self.tools = await forensics_tools()
         
-        planning_tools = [t for t in self.tools if getattr(t, "name", "") in {}]
         deeper_tools = [ShellTool()]
         
+        # One connection pool shared by every LLM: concurrent chunk analyses
+        # reuse warm TLS connections instead of each model opening its own
+        limits = httpx.Limits(
+            max_connections=self.config.chunk_concurrency + 2,
+            max_keepalive_connections=self.config.chunk_concurrency + 2
+        )
+        timeout = httpx.Timeout(self.config.llm_timeout)
+        self._http_client = httpx.Client(http2=_HTTP2, limits=limits, timeout=timeout)
+        self._http_async_client = httpx.AsyncClient(http2=_HTTP2, limits=limits, timeout=timeout)
+        http_clients = {
+            "http_client": self._http_client,
+            "http_async_client": self._http_async_client
+        }
+        
         # Initialize LLMs with configuration
         self.planner_llm = ChatOpenAI(
             model=self.config.planner_model,
@@ -72,87 +631,85 @@ class MemoryForensicsAgent:
             max_tokens=self.config.llm_max_tokens,
             timeout=self.config.llm_timeout,
             max_retries=1,
-        ).bind_tools(planning_tools)
+            **http_clients
+        ).bind_tools([])
         
         self.evaluator_llm = ChatOpenAI(
             model=self.config.evaluator_model,
-            temperature=self.config.llm_temperature
+            temperature=self.config.llm_temperature,
+            **http_clients
         ).with_structured_output(EvaluatorOutput, method="function_calling")
         
         self.analyzer_llm = ChatOpenAI(
             model=self.config.analyzer_model,
             temperature=0.1,
-            max_tokens=2000
+            max_tokens=2000,
+            max_retries=self.config.max_retries,
+            **http_clients
         ).with_structured_output(AnalysisOutput, method="function_calling")
         
         await self.build_graph()
         
-
-        
+    async def aclose(self):
+        """Close the HTTP connection pools, the checkpoint database and open result logs."""
+        with self._chunk_results_lock:
+            for fd in self._chunk_results_fds.values():
+                os.close(fd)
+            self._chunk_results_fds.clear()
+        if self._checkpointer_cm is not None:
+            await self._checkpointer_cm.__aexit__(None, None, None)
+            self._checkpointer_cm = None
+            self._checkpointer = None
+        if self._http_async_client is not None:
+            await self._http_async_client.aclose()
+            self._http_async_client = None
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
         
     async def build_graph(self):
-        """Build the investigation workflow graph."""
-        graph_builder = StateGraph(ForensicState)
-        
-        # Register nodes with LLM binding
-        graph_builder.add_node("detect_os", detect_os_node)  # New: OS detection
-        graph_builder.add_node("planner", self._planner_wrapper)
-        graph_builder.add_node("validate_plan", validate_investigation_plan)
-        graph_builder.add_node("evaluator", self._evaluator_wrapper)
-        graph_builder.add_node("execution", execution_node)
-        graph_builder.add_node("triage", self._triage_wrapper)
-        graph_builder.add_node("deeper_analysis", self._deeper_analysis_wrapper)
-        
-        # Define the flow: START → detect_os → planner → validate_plan → evaluator → execution → triage → deeper_analysis → END
-        graph_builder.add_edge(START, "detect_os")  # New: Start with OS detection
-        graph_builder.add_edge("detect_os", "planner")  # New: OS detection before planning
-        graph_builder.add_edge("planner", "validate_plan")
-        graph_builder.add_edge("validate_plan", "evaluator")
-        
-        # Conditional routing from evaluator
-        graph_builder.add_conditional_edges(
-            "evaluator", 
-            lambda state: route_based_on_evaluation(state, self.config.max_retries),
-            {"planner": "planner", "execution": "execution", "END": END}
-        )
-        
-        # Conditional routing from execution to triage
-        graph_builder.add_conditional_edges(
-            "execution",
-            route_after_execution,
-            {"triage": "triage", "END": END}
-        )
+        """
+        Attach the investigation workflow graph.
         
-        # Conditional routing from triage to deeper analysis or end
-        graph_builder.add_conditional_edges(
-            "triage",
-            self._route_after_analysis,
-            {"deeper_analysis": "deeper_analysis", "END": END}
-        )
+        The compiled graph is shared by every agent in the process; nodes find
+        this agent through the ``configurable`` run config passed by investigate().
+        When ``checkpoint_db`` is set, the graph is compiled with a SQLite
+        checkpointer so interrupted investigations resume where they stopped.
+        """
+        # With no retries the evaluator can never send the plan back to the planner
+        topology = {
+            "allow_replanning": self.config.max_retries > 0,
+            "deeper_analysis": not self.config.disable_deeper_analysis,
+            "cache_os_detection": not self.config.disable_os_cache,
+            "planner_identity": _planner_identity(self.config)
+        }
         
-        # Deeper analysis always routes to END when complete
-        graph_builder.add_edge("deeper_analysis", END)
+        if not self.config.checkpoint_db:
+            self.graph = _compiled_graph(**topology)
+            return
         
-        # Set entry point
-        graph_builder.set_entry_point("detect_os")  # New: Start with detection
-        self.graph = graph_builder.compile()
+        # A checkpointer is bound at compile time, so this graph is per agent
+        if self._checkpointer is None:
+            self._checkpointer_cm = AsyncSqliteSaver.from_conn_string(self.config.checkpoint_db)
+            self._checkpointer = await self._checkpointer_cm.__aenter__()
+        self.graph = _graph_builder(**topology).compile(checkpointer=self._checkpointer, cache=_node_cache)
         
-    def _planner_wrapper(self, state: ForensicState) -> Dict[str, Any]:
+    async def _planner_wrapper(self, state: ForensicState) -> Dict[str, Any]:
         """Wrapper to inject LLM into planner node."""
-        return planner_node(state, self.planner_llm)
+        return await planner_node(state, self.planner_llm)
         
-    def _evaluator_wrapper(self, state: ForensicState) -> Dict[str, Any]:
+    async def _evaluator_wrapper(self, state: ForensicState) -> Dict[str, Any]:
         """Wrapper to inject LLM into evaluator node."""
-        return evaluator_node(state, self.evaluator_llm)
+        return await evaluator_node(state, self.evaluator_llm)
         
-    def _triage_wrapper(self, state: ForensicState) -> Dict[str, Any]:
+    async def _triage_wrapper(self, state: ForensicState) -> Dict[str, Any]:
         """Wrapper for triage analysis node."""
-        return self._triage_node(state)
+        return await self._finalize_triage(state)
         
-    def _deeper_analysis_wrapper(self, state: ForensicState) -> Dict[str, Any]:
+    async def _deeper_analysis_wrapper(self, state: ForensicState) -> Dict[str, Any]:
         """Wrapper for deeper analysis node with chunked analysis."""
-        # Execute the deeper analysis plan
-        deeper_results = self.deeper_analysis_engine.deeper_analysis_node(state)
+        # Execute the deeper analysis plan (blocking Volatility runs go to a worker thread)
+        deeper_results = await asyncio.to_thread(self.deeper_analysis_engine.deeper_analysis_node, state)
         
         # If execution was successful, perform chunked analysis on results
         if (deeper_results.get("investigation_stage") == "deeper_analysis_completed" 
@@ -161,20 +718,27 @@ class MemoryForensicsAgent:
             execution_results = deeper_results["deeper_analysis_results"]
             deeper_evidence_dir = deeper_results.get("deeper_evidence_directory", "")
             
-            # Gather analysis context from deeper execution results
-            analysis_context = self._gather_analysis_context(execution_results, deeper_evidence_dir)
+            # Gather analysis context from deeper execution results, counting
+            # its tokens per part so the joined text is never re-tokenized
+            context_parts = await self._gather_analysis_parts(execution_results, deeper_evidence_dir)
+            context_tokens = _count_context_tokens(context_parts)
+            analysis_context = "\n".join(context_parts)
+            del context_parts
             
             # Perform chunked analysis on deeper results
-            enhanced_analysis = self._perform_chunked_analysis(
-                analysis_context, state, "deeper_completed", execution_results, deeper_evidence_dir
+            enhanced_analysis = await self._perform_chunked_analysis(
+                analysis_context, state, "deeper_completed", execution_results, deeper_evidence_dir,
+                context_tokens=context_tokens
             )
             
             # Correlate with initial findings for comprehensive report
             if enhanced_analysis and enhanced_analysis.get("analysis_results"):
-                print(f"🎯 Deeper analysis complete - Enhanced threat score: {enhanced_analysis.get('threat_score', 0):.1f}")
+                _log.info("🎯 Deeper analysis complete - Enhanced threat score: %.1f", enhanced_analysis.get('threat_score', 0))
                 
                 # Save enhanced results
-                self._save_single_analysis_result(enhanced_analysis, deeper_evidence_dir, state)
+                await asyncio.to_thread(
+                    self._save_single_analysis_result, enhanced_analysis, deeper_evidence_dir, state, kind="deeper"
+                )
                 
                 # Merge the enhanced analysis with deeper results
                 return {
@@ -193,7 +757,7 @@ class MemoryForensicsAgent:
         threat_score = state.get("threat_score", 0)
         
         if investigation_stage != "analysis_completed":
-            print("⚠️ Analysis incomplete - ending workflow")
+            _log.warning("⚠️ Analysis incomplete - ending workflow")
             return "END"
             
         # Check if deeper analysis should be triggered
@@ -204,27 +768,43 @@ class MemoryForensicsAgent:
         }
         
         if self.deeper_analysis_engine.should_trigger_deeper_analysis(analysis_result):
-            print(f"🔍 Triggering deeper analysis (threat score: {threat_score}/10)")
-            print("   - High threat indicators detected")
-            print("   - Initiating targeted investigation...")
+            _log.info("🔍 Triggering deeper analysis (threat score: %s/10)", threat_score)
+            _log.info("   - High threat indicators detected")
+            _log.info("   - Initiating targeted investigation...")
             return "deeper_analysis"
         else:
-            print(f"✅ Analysis completed with threat score: {threat_score}/10")
-            print("🏁 Memory forensics investigation workflow complete")
+            _log.info("✅ Analysis completed with threat score: %s/10", threat_score)
+            _log.info("🏁 Memory forensics investigation workflow complete")
             return "END"
     
-    def _triage_node(self, state: ForensicState) -> Dict[str, Any]:
+    def _failed_triage_update(self, reason: str) -> Dict[str, Any]:
+        """State update for a triage pass that produced no analysis."""
+        return {
+            "analysis_results": None,
+            "analysis_confidence": 0.0,
+            "threat_score": 0.0,
+            "key_indicators": [],
+            "recommended_actions": [reason],
+            "investigation_stage": "analysis_failed"
+        }
+    
+    async def _prepare_triage(self, state: ForensicState) -> Command:
         """
-        Analyze the execution results to identify suspicious findings and generate threat intelligence.
+        Gather the triage context and fan its chunks out as parallel graph tasks.
+        
+        Each chunk that still needs analysis becomes a ``Send`` to the
+        ``analyze_chunk`` node; results resumed from a previous run are written
+        straight to ``chunk_results``. When nothing is left to analyze the
+        workflow continues directly to ``triage``.
         
         Args:
             state: Current forensic state containing execution results and evidence directory
             
         Returns:
-            Dict containing analysis results, threat scores, and recommendations
+            Command carrying the chunking metadata and the chunk fan-out
         """
         try:
-            print("🔍 Starting Results Analysis Phase")
+            _log.info("🔍 Starting Results Analysis Phase")
             
             # Get execution results and evidence directory
             execution_results = state.get("execution_results")
@@ -232,27 +812,191 @@ class MemoryForensicsAgent:
             execution_status = state.get("execution_status")
             
             if not execution_results or execution_status not in ["completed", "partial"]:
-                return {
-                    "analysis_results": None,
-                    "analysis_confidence": 0.0,
-                    "threat_score": 0.0,
-                    "key_indicators": [],
-                    "recommended_actions": ["Investigation execution incomplete - no results to analyze"],
-                    "investigation_stage": "analysis_failed"
-                }
+                return Command(
+                    update=self._failed_triage_update("Investigation execution incomplete - no results to analyze"),
+                    goto=END
+                )
             
             # Parse execution results to gather file outputs
-            analysis_context = self._gather_analysis_context(execution_results, evidence_directory)
+            context_parts = deque(await self._gather_analysis_parts(execution_results, evidence_directory))
             
             # Check if we need chunked analysis due to token limits
-            analysis_result = self._perform_chunked_analysis(
-                analysis_context, state, execution_status, execution_results, evidence_directory
+            total_tokens = _count_context_tokens(list(context_parts))
+            max_chunk_tokens = self.config.max_chunk_tokens
+            
+            if total_tokens <= max_chunk_tokens:
+                # Single analysis - context fits in one request
+                _log.info("📊 Performing single analysis (%d tokens)", total_tokens)
+                chunked = False
+                chunks = [("\n".join(context_parts), total_tokens)]
+                chunk_metadata = {"chunks_directory": "", "total_chunks": 1}
+                existing_results = {}
+            else:
+                chunked = True
+                # Stream lines out of the parts, releasing each part once consumed
+                chunks = self._split_analysis_context(_drain_context_lines(context_parts), max_chunk_tokens)
+                
+                # Save chunks to files for resumability and debugging
+                chunk_metadata = await self._save_chunks_to_files(chunks, evidence_directory, state)
+                
+                if _log.isEnabledFor(logging.INFO):
+                    _log.info("📊 Performing parallel chunked analysis:")
+                    _log.info("   - Total context: %d tokens", total_tokens)
+                    _log.info("   - Number of chunks: %s", len(chunks))
+                    _log.info("   - Max chunk size: %d tokens", max_chunk_tokens)
+                    _log.info("   - Concurrency limit: %s", self.config.chunk_concurrency)
+                    _log.info("   - Chunks saved to: %s", chunk_metadata.get('chunks_directory', 'N/A'))
+                
+                # Check for existing results from previous runs
+                existing_results = await asyncio.to_thread(
+                    self._load_existing_chunk_results, chunk_metadata.get('chunks_directory', '')
+                )
+            
+            resumed_results = []
+            chunk_tasks = []
+            for i, (chunk, chunk_tokens) in enumerate(chunks, 1):
+                chunk_id = f"chunk_{i:03d}"
+                
+                # Check if this chunk was already analyzed; unreadable records come back as None
+                existing_result = existing_results.get(chunk_id)
+                if existing_result is not None:
+                    _log.info("♻️  Chunk %s/%s already analyzed - loading existing results...", i, len(chunks))
+                    resumed_results.append({**existing_result, "chunk_index": i})
+                    continue
+                
+                chunk_tasks.append(Send("analyze_chunk", self._chunk_task(
+                    state, chunk, chunk_tokens, i, len(chunks), chunked, chunk_metadata.get('chunks_directory', '')
+                )))
+            
+            return Command(
+                update={
+                    "triage_chunks": {"chunked": chunked, "chunk_metadata": chunk_metadata},
+                    "analysis_context_tokens": total_tokens,
+                    "chunk_results": resumed_results
+                },
+                goto=chunk_tasks or "triage"
             )
             
-            # Save the analysis results
-            self._save_single_analysis_result(analysis_result, evidence_directory, state)
+        except Exception as e:
+            _log.error("❌ Triage analysis error: %s", e)
+            return Command(update=self._failed_triage_update(f"Triage analysis failed: {e}"), goto=END)
+    
+    def _chunk_limit(self) -> asyncio.Semaphore:
+        """Semaphore bounding chunk-analysis LLM calls to ``config.chunk_concurrency`` on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._chunk_semaphore_loop is not loop:
+            self._chunk_semaphore = asyncio.Semaphore(self.config.chunk_concurrency)
+            self._chunk_semaphore_loop = loop
+        return self._chunk_semaphore
+    
+    @staticmethod
+    def _chunk_task(state: ForensicState, chunk: str, chunk_tokens: int, chunk_index: int,
+                    total_chunks: int, chunked: bool, chunks_directory: str) -> Dict[str, Any]:
+        """Payload for ``_analyze_chunk_task``."""
+        return {
+            "state": state,
+            "chunk": chunk,
+            "chunk_tokens": chunk_tokens,
+            "chunk_index": chunk_index,
+            "chunk_id": f"chunk_{chunk_index:03d}",
+            "total_chunks": total_chunks,
+            "chunked": chunked,
+            "chunks_directory": chunks_directory
+        }
+    
+    async def _analyze_chunk_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze one chunk dispatched by ``_prepare_triage`` or ``_perform_chunked_analysis``.
+        
+        LLM calls across chunk tasks are bounded by ``config.chunk_concurrency``;
+        other graph tasks, such as investigation phases, are not held back by it.
+        
+        Args:
+            task: Send payload with the chunk text, its position, and the triage state
+            
+        Returns:
+            State update appending this chunk's result to ``chunk_results``
+        """
+        i = task["chunk_index"]
+        total_chunks = task["total_chunks"]
+        state = task["state"]
+        chunk_info = None
+        
+        try:
+            async with self._chunk_limit():
+                if task["chunked"]:
+                    # Add jittered delay to prevent rate limit bursts
+                    # Jitter range: 0.5s to 1.5s
+                    jitter_delay = random.uniform(0.5, 1.5)
+                    _log.info("🔍 Analyzing chunk %s/%s (%d tokens) [delay: %.1fs]...", i, total_chunks, task['chunk_tokens'], jitter_delay)
+                    await asyncio.sleep(jitter_delay)
+                    chunk_info = f"chunk {i} of {total_chunks}"
+                
+                chunk_result = await self._analyze_single_chunk_async(
+                    task["chunk"], state, state.get("execution_status"), state.get("execution_results"),
+                    state.get("evidence_directory"), chunk_info=chunk_info
+                )
+            
+            if task["chunked"]:
+                if chunk_result.get("analysis_results"):
+                    # Save individual chunk result for resumability
+                    await asyncio.to_thread(self._save_chunk_result, chunk_result, task["chunk_id"], task["chunks_directory"])
+                    _log.info("   ✅ Chunk %s completed - Threat Score: %.1f", i, chunk_result.get('threat_score', 0))
+                else:
+                    _log.warning("   ⚠️ Chunk %s failed", i)
+            
+        except Exception as e:
+            _log.error("   ❌ Chunk %s raised exception: %s", i, e)
+            chunk_result = {"analysis_results": None}
+        
+        return {"chunk_results": [{**chunk_result, "chunk_index": i}]}
+    
+    async def _finalize_triage(self, state: ForensicState) -> Dict[str, Any]:
+        """
+        Combine the fanned-out chunk results into the triage analysis.
+        
+        Args:
+            state: Current forensic state with ``triage_chunks`` and ``chunk_results``
+            
+        Returns:
+            Dict containing analysis results, threat scores, and recommendations
+        """
+        try:
+            evidence_directory = state.get("evidence_directory")
+            triage_chunks = state.get("triage_chunks") or {}
+            # One timestamp shared by every file this triage writes
+            now = datetime.now()
+            chunk_results = sorted(state.get("chunk_results") or [], key=lambda r: r.get("chunk_index", 0))
+            
+            if not triage_chunks.get("chunked"):
+                analysis_result = chunk_results[0] if chunk_results else {"analysis_results": None}
+            else:
+                successful_results = [r for r in chunk_results if r.get("analysis_results")]
+                if successful_results:
+                    _log.info("🔗 Combining analysis results from all chunks...")
+                    analysis_result = self._combine_chunk_results(successful_results, state, evidence_directory)
+                    
+                    # Save combined results metadata
+                    await asyncio.to_thread(
+                        self._save_chunked_analysis_metadata,
+                        triage_chunks.get("chunk_metadata", {}), analysis_result, evidence_directory, now=now
+                    )
+                else:
+                    _log.error("❌ All chunks failed analysis")
+                    analysis_result = {
+                        "analysis_results": None,
+                        "analysis_confidence": 0.0,
+                        "threat_score": 0.0,
+                        "key_indicators": [],
+                        "recommended_actions": ["All analysis chunks failed"]
+                    }
+            
+            # Save the analysis results off the event loop
+            await asyncio.to_thread(
+                self._save_single_analysis_result, analysis_result, evidence_directory, state, kind="triage", now=now
+            )
             
-            print("✅ Triage analysis completed")
+            _log.info("✅ Triage analysis completed")
             return {
                 "analysis_results": analysis_result.get("analysis_results"),
                 "analysis_confidence": analysis_result.get("analysis_confidence", 0.8),
@@ -263,22 +1007,18 @@ class MemoryForensicsAgent:
             }
             
         except Exception as e:
-            print(f"❌ Triage analysis error: {e}")
-            return {
-                "analysis_results": None,
-                "analysis_confidence": 0.0,
-                "threat_score": 0.0,
-                "key_indicators": [],
-                "recommended_actions": [f"Triage analysis failed: {e}"],
-                "investigation_stage": "analysis_failed"
-            }
+            _log.error("❌ Triage analysis error: %s", e)
+            return self._failed_triage_update(f"Triage analysis failed: {e}")
     
-    def _perform_chunked_analysis(self, analysis_context: str, state: ForensicState, 
+    async def _perform_chunked_analysis(self, analysis_context: str, state: ForensicState, 
                                  execution_status: str, execution_results: Dict[str, Any], 
-                                 evidence_directory: str) -> Dict[str, Any]:
+                                 evidence_directory: str, context_tokens: Optional[int] = None) -> Dict[str, Any]:
         """
         Perform analysis with chunking if context is too large.
-        Uses async parallel processing for chunks to improve performance.
+        
+        Used for deeper analysis results, outside the triage fan-out. Chunks
+        run through the same ``_analyze_chunk_task`` as triage, so they share
+        its resumability and ``config.chunk_concurrency`` limit.
         
         Args:
             analysis_context: Full analysis context string
@@ -286,62 +1026,81 @@ class MemoryForensicsAgent:
             execution_status: Status of execution
             execution_results: Results from execution
             evidence_directory: Path to evidence directory
+            context_tokens: Token count of ``analysis_context`` if already known
             
         Returns:
             Combined analysis results from all chunks
         """
         try:
-            from utils.tokens import count_tokens
-            
-            # Check token count for the full context
-            total_tokens = count_tokens(analysis_context)
+            # Check token count for the full context, reusing a known count
+            total_tokens = context_tokens if context_tokens is not None else count_tokens(analysis_context)
             max_chunk_tokens = self.config.max_chunk_tokens
             
+            # Chunk tasks read the execution results from their state
+            chunk_state = {
+                **state,
+                "execution_status": execution_status,
+                "execution_results": execution_results,
+                "evidence_directory": evidence_directory
+            }
+            
             if total_tokens <= max_chunk_tokens:
                 # Single analysis - context fits in one request
-                print(f"📊 Performing single analysis ({total_tokens:,} tokens)")
-                # For single chunk, use async but run it synchronously
-                return asyncio.run(
-                    self._analyze_single_chunk_async(
-                        analysis_context, state, execution_status, execution_results, evidence_directory
-                    )
+                _log.info("📊 Performing single analysis (%d tokens)", total_tokens)
+                update = await self._analyze_chunk_task(
+                    self._chunk_task(chunk_state, analysis_context, total_tokens, 1, 1, False, "")
                 )
+                result = update["chunk_results"][0]
+                del result["chunk_index"]
+                return result
             
-            # Chunked analysis needed - run async parallel processing
+            # Chunked analysis needed - run async parallel processing.
+            # Each chunk carries its token count so it is never re-tokenized.
             chunks = self._split_analysis_context(analysis_context, max_chunk_tokens)
             
             # Save chunks to files for resumability and debugging
-            chunk_metadata = self._save_chunks_to_files(chunks, evidence_directory, state)
+            chunk_metadata = await self._save_chunks_to_files(chunks, evidence_directory, state)
+            chunks_directory = chunk_metadata.get('chunks_directory', '')
             
-            print(f"📊 Performing parallel chunked analysis:")
-            print(f"   - Total context: {total_tokens:,} tokens")
-            print(f"   - Number of chunks: {len(chunks)}")
-            print(f"   - Max chunk size: {max_chunk_tokens:,} tokens")
-            print(f"   - Concurrency limit: {self.config.chunk_concurrency}")
-            print(f"   - Chunks saved to: {chunk_metadata.get('chunks_directory', 'N/A')}")
+            if _log.isEnabledFor(logging.INFO):
+                _log.info("📊 Performing parallel chunked analysis:")
+                _log.info("   - Total context: %d tokens", total_tokens)
+                _log.info("   - Number of chunks: %s", len(chunks))
+                _log.info("   - Max chunk size: %d tokens", max_chunk_tokens)
+                _log.info("   - Concurrency limit: %s", self.config.chunk_concurrency)
+                _log.info("   - Chunks saved to: %s", chunks_directory or 'N/A')
             
             # Check for existing results from previous runs
-            existing_results = self._load_existing_chunk_results(chunk_metadata.get('chunks_directory', ''))
+            existing_results = await asyncio.to_thread(self._load_existing_chunk_results, chunks_directory)
+            
+            chunk_results = []
+            pending = []
+            for i, (chunk, chunk_tokens) in enumerate(chunks, 1):
+                # Check if this chunk was already analyzed; unreadable records come back as None
+                existing_result = existing_results.get(f"chunk_{i:03d}")
+                if existing_result is not None:
+                    _log.info("♻️  Chunk %s/%s already analyzed - loading existing results...", i, len(chunks))
+                    chunk_results.append(existing_result)
+                    continue
+                pending.append(self._analyze_chunk_task(
+                    self._chunk_task(chunk_state, chunk, chunk_tokens, i, len(chunks), True, chunks_directory)
+                ))
             
-            # Run async parallel chunk analysis
-            chunk_results = asyncio.run(
-                self._analyze_chunks_parallel(
-                    chunks, state, execution_status, execution_results,
-                    evidence_directory, chunk_metadata, existing_results
-                )
-            )
+            for update in await asyncio.gather(*pending):
+                chunk_results.extend(update["chunk_results"])
+            chunk_results = [r for r in chunk_results if r.get("analysis_results")]
             
             # Combine results from all chunks
             if chunk_results:
-                print("🔗 Combining analysis results from all chunks...")
+                _log.info("🔗 Combining analysis results from all chunks...")
                 combined_result = self._combine_chunk_results(chunk_results, state, evidence_directory)
                 
                 # Save combined results metadata
-                self._save_chunked_analysis_metadata(chunk_metadata, combined_result, evidence_directory)
+                await asyncio.to_thread(self._save_chunked_analysis_metadata, chunk_metadata, combined_result, evidence_directory)
                 
                 return combined_result
             else:
-                print("❌ All chunks failed analysis")
+                _log.error("❌ All chunks failed analysis")
                 return {
                     "analysis_results": None,
                     "analysis_confidence": 0.0,
@@ -351,7 +1110,7 @@ class MemoryForensicsAgent:
                 }
                 
         except Exception as e:
-            print(f"❌ Chunked analysis error: {e}")
+            _log.error("❌ Chunked analysis error: %s", e)
             return {
                 "analysis_results": None,
                 "analysis_confidence": 0.0,
@@ -360,111 +1119,39 @@ class MemoryForensicsAgent:
                 "recommended_actions": [f"Analysis error: {str(e)}"]
             }
     
-    async def _analyze_chunks_parallel(
-        self,
-        chunks: List[str],
-        state: ForensicState,
-        execution_status: str,
-        execution_results: Dict[str, Any],
-        evidence_directory: str,
-        chunk_metadata: Dict[str, Any],
-        existing_results: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    def _split_analysis_context(self, context: Union[str, Iterable[str]], max_chunk_tokens: int) -> List[Tuple[str, int]]:
         """
-        Analyze multiple chunks in parallel with semaphore-based concurrency control.
+        Split analysis context into manageable chunks on line boundaries.
         
         Args:
-            chunks: List of analysis context chunks
-            state: Current forensic state
-            execution_status: Status of execution
-            execution_results: Results from execution
-            evidence_directory: Path to evidence directory
-            chunk_metadata: Metadata about chunks
-            existing_results: Previously analyzed chunk results
-            
+            context: Full context string, or an iterable of its lines
+            max_chunk_tokens: Token budget per chunk
+        
         Returns:
-            List of analysis results from all chunks
+            List of (chunk text, token count) pairs; the count is the sum of the
+            per-line counts gathered while splitting
         """
-        from utils.tokens import count_tokens
-        
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(self.config.chunk_concurrency)
-        
-        async def analyze_chunk_with_limit(i: int, chunk: str) -> Dict[str, Any]:
-            """Analyze a single chunk with concurrency limit and jittered delay."""
-            chunk_tokens = count_tokens(chunk)
-            chunk_id = f"chunk_{i:03d}"
-            
-            # Check if this chunk was already analyzed
-            if chunk_id in existing_results:
-                print(f"♻️  Chunk {i}/{len(chunks)} already analyzed - loading existing results...")
-                return existing_results[chunk_id]
-            
-            async with semaphore:
-                # Add jittered delay to prevent rate limit bursts
-                # Jitter range: 0.5s to 1.5s
-                jitter_delay = random.uniform(0.5, 1.5)
-                print(f"🔍 Analyzing chunk {i}/{len(chunks)} ({chunk_tokens:,} tokens) [delay: {jitter_delay:.1f}s]...")
-                await asyncio.sleep(jitter_delay)
-                
-                # Analyze the chunk
-                chunk_result = await self._analyze_single_chunk_async(
-                    chunk, state, execution_status, execution_results,
-                    evidence_directory, chunk_info=f"chunk {i} of {len(chunks)}"
-                )
-                
-                if chunk_result.get("analysis_results"):
-                    # Save individual chunk result for resumability
-                    self._save_chunk_result(chunk_result, chunk_id, chunk_metadata.get('chunks_directory', ''))
-                    print(f"   ✅ Chunk {i} completed - Threat Score: {chunk_result.get('threat_score', 0):.1f}")
-                    return chunk_result
-                else:
-                    print(f"   ⚠️ Chunk {i} failed")
-                    return chunk_result
-        
-        # Create tasks for all chunks
-        tasks = [
-            analyze_chunk_with_limit(i, chunk)
-            for i, chunk in enumerate(chunks, 1)
-        ]
-        
-        # Run all tasks in parallel with graceful error handling
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter out exceptions and failed results
-        successful_results = []
-        for i, result in enumerate(results, 1):
-            if isinstance(result, Exception):
-                print(f"   ❌ Chunk {i} raised exception: {result}")
-            elif result and result.get("analysis_results"):
-                successful_results.append(result)
-        
-        return successful_results
-    
-    def _split_analysis_context(self, context: str, max_chunk_tokens: int) -> List[str]:
-        """Split analysis context into manageable chunks."""
-        from utils.tokens import count_tokens
-        
-        lines = context.split('\n')
+        lines = iter(context.split('\n')) if isinstance(context, str) else iter(context)
         chunks = []
         current_chunk = []
         current_tokens = 0
         
-        for line in lines:
-            line_tokens = count_tokens(line)
-            
-            if current_tokens + line_tokens > max_chunk_tokens and current_chunk:
-                # Start new chunk
-                chunks.append('\n'.join(current_chunk))
-                current_chunk = [line]
-                current_tokens = line_tokens
-            else:
-                current_chunk.append(line)
-                current_tokens += line_tokens
+        # Count lines in fixed-size batches so arbitrarily long inputs stream
+        # through the batch tokenizer without being materialized as one list
+        while batch := list(itertools.islice(lines, TOKEN_COUNT_BATCH_LINES)):
+            for line, line_tokens in zip(batch, count_tokens_batch(batch)):
+                if current_tokens + line_tokens > max_chunk_tokens and current_chunk:
+                    # Start new chunk
+                    chunks.append(('\n'.join(current_chunk), current_tokens))
+                    current_chunk = [line]
+                    current_tokens = line_tokens
+                else:
+                    current_chunk.append(line)
+                    current_tokens += line_tokens
         
         # Add final chunk
         if current_chunk:
-            chunks.append('\n'.join(current_chunk))
+            chunks.append(('\n'.join(current_chunk), current_tokens))
         
         return chunks
     
@@ -481,6 +1168,10 @@ class MemoryForensicsAgent:
         Async version of _analyze_single_chunk.
         Analyze a single chunk of context with rate limiting and retry logic.
         
+        The OpenAI client retries transient failures itself (honoring
+        Retry-After); rate-limit errors that survive those retries are retried
+        here with jittered exponential backoff.
+        
         Args:
             analysis_context: The context chunk to analyze
             state: Current forensic state
@@ -492,74 +1183,61 @@ class MemoryForensicsAgent:
         Returns:
             Dict containing analysis results, threat score, indicators, and actions
         """
-        from utils.messages import build_analysis_system_message, build_analysis_user_message
-        from langchain_core.messages import SystemMessage, HumanMessage
-        import re
+        max_retries = self.config.max_retries
         
-        for attempt in range(self.config.max_retries):
-            try:
-                system_message = build_analysis_system_message()
-                user_message = build_analysis_user_message(
-                    state, execution_status, execution_results, evidence_directory,
-                    analysis_context, chunk_info
-                )
-                
-                analysis_messages = [
-                    SystemMessage(content=system_message),
-                    HumanMessage(content=user_message)
-                ]
-                
-                # Use async invoke for non-blocking LLM call
-                analysis_result: AnalysisOutput = await self.analyzer_llm.ainvoke(analysis_messages)
-                
-                return {
-                    "analysis_results": {
-                        "suspicious_findings": [finding.model_dump() for finding in analysis_result.suspicious_findings],
-                        "executive_summary": analysis_result.executive_summary
-                    },
-                    "threat_score": analysis_result.threat_score,
-                    "key_indicators": analysis_result.key_indicators,
-                    "recommended_actions": analysis_result.recommended_actions,
-                    "analysis_confidence": analysis_result.analysis_confidence
-                }
-                
-            except Exception as e:
-                error_str = str(e)
-                
-                # Check if it's a rate limit error
-                if "429" in error_str and "rate_limit_exceeded" in error_str:
-                    # Extract wait time from error message
-                    wait_match = re.search(r'Please try again in (\d+(?:\.\d+)?)s', error_str)
-                    if wait_match:
-                        wait_time = float(wait_match.group(1))
-                    else:
-                        # Exponential backoff with jitter
-                        base_wait = self.config.rate_limit_delay * (2 ** attempt)
-                        jitter = random.uniform(0, base_wait * 0.1)  # 10% jitter
-                        wait_time = min(base_wait + jitter, self.config.max_rate_limit_delay)
-                    
-                    print(f"⏳ Rate limit hit, waiting {wait_time:.1f}s before retry {attempt + 1}/{self.config.max_retries}")
-                    await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    # Non-rate-limit error
-                    print(f"❌ Analysis error (chunk: {chunk_info}): {e}")
-                    return {
-                        "analysis_results": {"error": str(e)},
-                        "threat_score": 0.0,
-                        "key_indicators": [],
-                        "recommended_actions": [f"Analysis failed: {e}"],
-                        "analysis_confidence": 0.0
-                    }
+        def log_retry(retry_state: RetryCallState):
+            _log.info("⏳ Rate limit hit, waiting %.1fs before retry %s/%s",
+                      retry_state.next_action.sleep, retry_state.attempt_number, max_retries)
+        
+        try:
+            analysis_messages = _ANALYSIS_PROMPT.format_messages(**build_analysis_user_message_vars(
+                state, execution_status, execution_results, evidence_directory,
+                analysis_context, chunk_info
+            ))
+            
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception_type(RateLimitError),
+                wait=wait_exponential_jitter(
+                    initial=self.config.rate_limit_delay, max=self.config.max_rate_limit_delay
+                ),
+                stop=stop_after_attempt(max(max_retries, 1)),
+                before_sleep=log_retry,
+                reraise=True
+            ):
+                with attempt:
+                    # Use async invoke for non-blocking LLM call
+                    analysis_result: AnalysisOutput = await self.analyzer_llm.ainvoke(analysis_messages)
+            
+        except RateLimitError:
+            # All retries exhausted
+            _log.error("❌ Analysis failed after %s attempts due to rate limiting (chunk: %s)", max_retries, chunk_info)
+            return {
+                "analysis_results": {"error": f"Rate limit exceeded after {max_retries} retries"},
+                "threat_score": 0.0,
+                "key_indicators": [],
+                "recommended_actions": ["Rate limit exceeded - consider reducing chunk size or using different model"],
+                "analysis_confidence": 0.0
+            }
+        except Exception as e:
+            # Non-rate-limit error
+            _log.error("❌ Analysis error (chunk: %s): %s", chunk_info, e)
+            return {
+                "analysis_results": {"error": str(e)},
+                "threat_score": 0.0,
+                "key_indicators": [],
+                "recommended_actions": [f"Analysis failed: {e}"],
+                "analysis_confidence": 0.0
+            }
         
-        # All retries exhausted
-        print(f"❌ Analysis failed after {self.config.max_retries} attempts due to rate limiting (chunk: {chunk_info})")
         return {
-            "analysis_results": {"error": f"Rate limit exceeded after {self.config.max_retries} retries"},
-            "threat_score": 0.0,
-            "key_indicators": [],
-            "recommended_actions": ["Rate limit exceeded - consider reducing chunk size or using different model"],
-            "analysis_confidence": 0.0
+            "analysis_results": {
+                "suspicious_findings": _FINDINGS_ADAPTER.dump_python(analysis_result.suspicious_findings),
+                "executive_summary": analysis_result.executive_summary
+            },
+            "threat_score": analysis_result.threat_score,
+            "key_indicators": analysis_result.key_indicators,
+            "recommended_actions": analysis_result.recommended_actions,
+            "analysis_confidence": analysis_result.analysis_confidence
         }
     
     def _combine_chunk_results(self, chunk_results: List[Dict[str, Any]], 
@@ -572,38 +1250,39 @@ class MemoryForensicsAgent:
         if not chunk_results:
             return {"analysis_results": None, "threat_score": 0.0}
         
-        # Combine all findings
+        # Combine all findings in a single pass; indicators and actions are
+        # deduplicated as they arrive (dicts keep first-seen order)
         all_findings = []
-        all_indicators = []
-        all_actions = []
-        threat_scores = []
-        confidence_scores = []
-        
-        for result in chunk_results:
+        unique_indicators: Dict[str, None] = {}
+        unique_actions: Dict[str, None] = {}
+        max_threat_score = float("-inf")
+        min_threat_score = float("inf")
+        max_threat_idx = -1
+        confidence_sum = 0.0
+        
+        for idx, result in enumerate(chunk_results):
             analysis_results = result.get("analysis_results", {})
             if isinstance(analysis_results, dict) and "suspicious_findings" in analysis_results:
                 all_findings.extend(analysis_results["suspicious_findings"])
             
-            all_indicators.extend(result.get("key_indicators", []))
-            all_actions.extend(result.get("recommended_actions", []))
-            threat_scores.append(result.get("threat_score", 0.0))
-            confidence_scores.append(result.get("analysis_confidence", 0.0))
-        
-        # Calculate overall scores
-        # Use MAX for threat score (worst-case wins in security analysis)
-        max_threat_score = max(threat_scores) if threat_scores else 0.0
-        max_threat_idx = threat_scores.index(max_threat_score) if threat_scores else -1
+            # Interning lets repeated IOC strings from different chunks share
+            # one object, so dedup hits compare by identity
+            unique_indicators.update(dict.fromkeys(map(sys.intern, result.get("key_indicators", []))))
+            unique_actions.update(dict.fromkeys(map(sys.intern, result.get("recommended_actions", []))))
+            
+            # Use MAX for threat score (worst-case wins in security analysis)
+            threat_score = result.get("threat_score", 0.0)
+            if threat_score > max_threat_score:
+                max_threat_score = threat_score
+                max_threat_idx = idx
+            min_threat_score = min(min_threat_score, threat_score)
+            confidence_sum += result.get("analysis_confidence", 0.0)
         
         # Use AVERAGE for confidence (represents overall certainty)
-        avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.0
+        avg_confidence = confidence_sum / len(chunk_results)
         
         # Log threat score details
-        if max_threat_idx >= 0:
-            print(f"   📊 Threat Score Range: {min(threat_scores):.1f} - {max_threat_score:.1f} (using MAX from chunk {max_threat_idx + 1})")
-        
-        # Remove duplicates
-        unique_indicators = list(set(all_indicators))
-        unique_actions = list(set(all_actions))
+        _log.info("   📊 Threat Score Range: %.1f - %.1f (using MAX from chunk %s)", min_threat_score, max_threat_score, max_threat_idx + 1)
         
         # Build comprehensive executive summary
         executive_summary = (
@@ -618,12 +1297,12 @@ class MemoryForensicsAgent:
                 "executive_summary": executive_summary
             },
             "threat_score": max_threat_score,  # Changed from avg to max
-            "key_indicators": unique_indicators,
-            "recommended_actions": unique_actions,
+            "key_indicators": list(unique_indicators),
+            "recommended_actions": list(unique_actions),
             "analysis_confidence": avg_confidence
         }
     
-    def _gather_analysis_context(self, execution_results: Dict[str, Any], evidence_directory: str) -> str:
+    async def _gather_analysis_context(self, execution_results: Dict[str, Any], evidence_directory: str) -> str:
         """
         Gather relevant context from execution results and evidence files for analysis.
         
@@ -634,8 +1313,24 @@ class MemoryForensicsAgent:
         Returns:
             Formatted string with analysis context
         """
-        import os
+        return "\n".join(await self._gather_analysis_parts(execution_results, evidence_directory))
+    
+    async def _gather_analysis_parts(self, execution_results: Dict[str, Any], evidence_directory: str) -> List[str]:
+        """
+        Gather the analysis context as a list of parts that join with newlines.
+        
+        Keeping the parts separate lets the chunk splitter consume them one at a
+        time instead of materializing the whole context as a single string. The
+        directory walk and file reads run in worker threads so the event loop
+        stays free while evidence is loaded.
         
+        Args:
+            execution_results: Results from the execution phase
+            evidence_directory: Path to evidence directory with output files
+            
+        Returns:
+            Context parts; ``"\\n".join(parts)`` is the full analysis context
+        """
         context_parts = []
         
         # Add global triage summary
@@ -661,39 +1356,52 @@ class MemoryForensicsAgent:
         if evidence_directory and os.path.exists(evidence_directory):
             context_parts.append("\n**SAMPLE OUTPUT FILES:**")
             
-            # Look for key output files and include samples
-            sample_files = []
-            for root, dirs, files in os.walk(evidence_directory):
-                for file in files:  
-                    if file.endswith('.txt'):  # Include all .txt files for analysis
-                        sample_files.append(os.path.join(root, file))
-            deduplicated_sample_files = []
-            for sample_file in sample_files:  # Include all files for comprehensive analysis
-
-                plugin_name = sample_file.split("_")[-1]
-                #some of the plugins might have been run multiple times, so we need to deduplicate them
-                if plugin_name not in deduplicated_sample_files:    
-                    deduplicated_sample_files.append(plugin_name)
+            # Include one .txt output per plugin for comprehensive analysis
+            selected_files = await asyncio.to_thread(_list_unique_plugin_files, evidence_directory)
+            
+            # Reuse the previous sample context when no evidence file changed
+            cache_path = os.path.join(evidence_directory, CONTEXT_CACHE_FILENAME)
+            signature = await asyncio.to_thread(_evidence_signature, selected_files)
+            cached_samples = None
+            if not self.config.force_context_refresh:
+                cached_samples = await asyncio.to_thread(_load_context_cache, cache_path, signature)
+            
+            if cached_samples is not None:
+                _log.info("♻️  Reusing cached evidence context (%s files, %d chars)", len(selected_files), len(cached_samples))
+                if cached_samples:
+                    context_parts.append(cached_samples)
+                return context_parts
+            
+            # Read the selected files concurrently
+            contents = await asyncio.gather(
+                *(asyncio.to_thread(_read_text_file, sample_file) for sample_file in selected_files),
+                return_exceptions=True
+            )
+            
+            sample_parts = []
+            for sample_file, content in zip(selected_files, contents):
+                relative_path = os.path.relpath(sample_file, evidence_directory)
+                if isinstance(content, Exception):
+                    sample_parts.append(f"- {relative_path}: Could not read file ({content})")
                 else:
-                    continue
-                    
-                try:
-                    relative_path = os.path.relpath(sample_file, evidence_directory)
-                    with open(sample_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()  
-                    context_parts.append(f"\n--- {relative_path} (sample) ---")
-                    context_parts.append(content)
-                except Exception as e:
-                    context_parts.append(f"- {relative_path}: Could not read file ({e})")
+                    sample_parts.append(f"\n--- {relative_path} (sample) ---")
+                    sample_parts.append(content)
+            context_parts.extend(sample_parts)
+            
+            try:
+                cache_data = json.dumps({"signature": signature, "sample_context": "\n".join(sample_parts)})
+                await asyncio.to_thread(_write_text_file, cache_path, cache_data)
+            except Exception as e:
+                _log.warning("⚠️ Could not write context cache: %s", e)
         
-        return "\n".join(context_parts)
+        return context_parts
 
-    def _save_chunks_to_files(self, chunks: List[str], evidence_directory: str, state: ForensicState) -> Dict[str, Any]:
+    async def _save_chunks_to_files(self, chunks: List[Tuple[str, int]], evidence_directory: str, state: ForensicState) -> Dict[str, Any]:
         """
         Save analysis chunks to individual files for resumability and debugging.
         
         Args:
-            chunks: List of context chunks
+            chunks: List of (chunk text, token count) pairs
             evidence_directory: Base evidence directory
             state: Current forensic state
             
@@ -701,14 +1409,9 @@ class MemoryForensicsAgent:
             Dictionary with chunk metadata including file paths
         """
         try:
-            import os
-            import json
-            from datetime import datetime
-            from utils.tokens import count_tokens
-            
             # Create chunks subdirectory
             chunks_dir = os.path.join(evidence_directory, "analysis_chunks")
-            os.makedirs(chunks_dir, exist_ok=True)
+            self._ensure_dir(chunks_dir)
             
             # Create metadata for this chunked analysis
             chunk_metadata = {
@@ -721,111 +1424,163 @@ class MemoryForensicsAgent:
                 "chunk_files": []
             }
             
-            # Save each chunk to a separate file
-            for i, chunk in enumerate(chunks, 1):
+            # Save each chunk to a separate file, writing them concurrently
+            chunk_files = [
+                os.path.join(chunks_dir, f"chunk_{i:03d}.txt")
+                for i in range(1, len(chunks) + 1)
+            ]
+            await asyncio.gather(*(
+                asyncio.to_thread(_write_text_file, chunk_file, chunk)
+                for chunk_file, (chunk, _) in zip(chunk_files, chunks)
+            ))
+            
+            for i, (chunk_file, (chunk, chunk_tokens)) in enumerate(zip(chunk_files, chunks), 1):
                 chunk_id = f"chunk_{i:03d}"
-                chunk_file = os.path.join(chunks_dir, f"{chunk_id}.txt")
-                
-                with open(chunk_file, 'w', encoding='utf-8') as f:
-                    f.write(chunk)
                 
                 chunk_info = {
                     "chunk_id": chunk_id,
                     "file_path": chunk_file,
-                    "token_count": count_tokens(chunk),
+                    "token_count": chunk_tokens,
                     "character_count": len(chunk)
                 }
                 chunk_metadata["chunk_files"].append(chunk_info)
             
             # Save chunk metadata
             metadata_file = os.path.join(chunks_dir, "chunks_metadata.json")
-            with open(metadata_file, 'w') as f:
-                json.dump(chunk_metadata, f, indent=2)
+            # Chunk-local artifact, read back by tools rather than people
+            await asyncio.to_thread(_write_bytes_file, metadata_file, _json_dumps_bytes(chunk_metadata, newline=True))
             
-            print(f"💾 Saved {len(chunks)} chunks to: {chunks_dir}")
+            _log.info("💾 Saved %s chunks to: %s", len(chunks), chunks_dir)
             return chunk_metadata
             
         except Exception as e:
-            print(f"⚠️ Error saving chunks: {e}")
+            _log.warning("⚠️ Error saving chunks: %s", e)
             return {"chunks_directory": "", "total_chunks": len(chunks)}
 
-    def _load_existing_chunk_results(self, chunks_directory: str) -> Dict[str, Dict[str, Any]]:
+    def _load_existing_chunk_results(self, chunks_directory: str) -> Mapping:
         """
         Load existing chunk analysis results for resumability.
         
+        Indexes the chunk results log, where later records for the same chunk
+        override earlier ones, plus any per-chunk result files from older runs.
+        Payloads are only read and parsed when a chunk is looked up.
+        
         Args:
             chunks_directory: Directory containing chunk results
             
         Returns:
-            Dictionary mapping chunk_id to analysis results
+            Mapping from chunk_id to analysis results
         """
         try:
-            import os
-            import json
-            
-            existing_results = {}
+            if not chunks_directory:
+                return {}
             
-            if not chunks_directory or not os.path.exists(chunks_directory):
-                return existing_results
+            locations = _index_legacy_chunk_results(chunks_directory)
+            locations.update(_index_chunk_results_log(os.path.join(chunks_directory, CHUNK_RESULTS_FILENAME)))
             
-            # Look for existing chunk result files
-            for file in os.listdir(chunks_directory):
-                if file.startswith("chunk_") and file.endswith("_result.json"):
-                    chunk_id = file.replace("_result.json", "")
-                    result_file = os.path.join(chunks_directory, file)
-                    
-                    try:
-                        with open(result_file, 'r') as f:
-                            chunk_result = json.load(f)
-                            existing_results[chunk_id] = chunk_result
-                    except Exception as e:
-                        print(f"⚠️ Error loading chunk result {file}: {e}")
+            if locations:
+                _log.info("♻️  Found %s existing chunk results", len(locations))
             
-            if existing_results:
-                print(f"♻️  Found {len(existing_results)} existing chunk results")
-            
-            return existing_results
+            return LazyChunkResults(locations)
             
         except Exception as e:
-            print(f"⚠️ Error loading existing chunk results: {e}")
+            _log.warning("⚠️ Error loading existing chunk results: %s", e)
             return {}
 
-    def _save_chunk_result(self, chunk_result: Dict[str, Any], chunk_id: str, chunks_directory: str):
+    def _save_chunk_result(self, chunk_result: Dict[str, Any], chunk_id: str, chunks_directory: str,
+                           *, now: Optional[datetime] = None):
         """
-        Save individual chunk analysis result for resumability.
+        Append an individual chunk analysis result to the results log.
+        
+        Each record is written with a single O_APPEND write under an advisory
+        lock, so concurrent chunks never interleave partial lines. The log's
+        descriptor stays open for the agent's lifetime.
         
         Args:
             chunk_result: Analysis result for this chunk
             chunk_id: Unique identifier for the chunk
             chunks_directory: Directory to save chunk results
+            now: Timestamp to record; callers saving a batch pass one shared value
         """
         try:
-            import os
-            import json
-            from datetime import datetime
-            
             if not chunks_directory:
                 return
             
-            result_file = os.path.join(chunks_directory, f"{chunk_id}_result.json")
-            
             # Add metadata to chunk result
             chunk_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": (now or datetime.now()).isoformat(),
                 "chunk_id": chunk_id,
                 "analysis_results": chunk_result.get("analysis_results"),
                 "threat_score": chunk_result.get("threat_score"),
                 "analysis_confidence": chunk_result.get("analysis_confidence")
             }
-            
-            with open(result_file, 'w') as f:
-                json.dump(chunk_data, f, indent=2)
+            line = _json_dumps_bytes({"chunk_id": chunk_id, "result": chunk_data}, newline=True)
+            
+            fd = self._chunk_results_fd(chunks_directory)
+            # flock keeps other processes out; the thread lock keeps out the
+            # other save threads, which share this descriptor
+            with self._chunk_results_lock:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    _write_all(fd, line)
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
             
         except Exception as e:
-            print(f"⚠️ Error saving chunk result {chunk_id}: {e}")
+            _log.warning("⚠️ Error saving chunk result %s: %s", chunk_id, e)
+
+    def _flush_chunk_results(self):
+        """
+        Flush the open chunk results logs to stable storage.
+        
+        Appends are not fsynced one by one; the logs and their directories are
+        synced once per investigation instead. A crash mid-run can lose the
+        latest records, which only costs re-analyzing those chunks on resume.
+        """
+        with self._chunk_results_lock:
+            paths = list(self._chunk_results_fds.items())
+        for results_file, fd in paths:
+            try:
+                os.fsync(fd)
+                dir_fd = os.open(os.path.dirname(results_file), os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError as e:
+                # Directories cannot be opened or synced on some platforms
+                _log.debug("Could not fsync %s: %s", results_file, e)
+
+    def _results_prefix(self, evidence_directory: str) -> str:
+        """Return ``<evidence_directory>/analysis_results/``, creating the directory on first use."""
+        prefix = self._results_prefixes.get(evidence_directory)
+        if prefix is None:
+            results_dir = os.path.join(evidence_directory, "analysis_results")
+            self._ensure_dir(results_dir)
+            prefix = self._results_prefixes[evidence_directory] = results_dir + os.sep
+        return prefix
+
+    def _ensure_dir(self, path: str):
+        """Create ``path`` if needed, skipping the syscalls for directories already made."""
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+
+    def _chunk_results_fd(self, chunks_directory: str) -> int:
+        """Return the append descriptor for a directory's results log, opening it once."""
+        results_file = os.path.join(chunks_directory, CHUNK_RESULTS_FILENAME)
+        with self._chunk_results_lock:
+            fd = self._chunk_results_fds.get(results_file)
+            if fd is None:
+                fd = os.open(results_file, _WRITE_FLAGS | os.O_APPEND, 0o644)
+                self._chunk_results_fds[results_file] = fd
+            return fd
 
     def _save_chunked_analysis_metadata(self, chunk_metadata: Dict[str, Any], 
-                                       combined_result: Dict[str, Any], evidence_directory: str):
+                                       combined_result: Dict[str, Any], evidence_directory: str,
+                                       *, now: Optional[datetime] = None):
         """
         Save metadata about the chunked analysis process.
         
@@ -833,44 +1588,48 @@ class MemoryForensicsAgent:
             chunk_metadata: Metadata from chunk creation
             combined_result: Final combined analysis result
             evidence_directory: Evidence directory path
+            now: Timestamp to record; defaults to the current time
         """
         try:
-            import os
-            import json
-            from datetime import datetime
+            now = now or datetime.now()
             
             # Create analysis results directory
-            results_dir = os.path.join(evidence_directory, "analysis_results")
-            os.makedirs(results_dir, exist_ok=True)
+            results_prefix = self._results_prefix(evidence_directory)
+            
+            # Read each nested field once; empty tuples avoid throwaway lists
+            analysis_results = combined_result.get("analysis_results") or {}
+            findings = analysis_results.get("suspicious_findings") or ()
+            key_indicators = combined_result.get("key_indicators") or ()
+            recommended_actions = combined_result.get("recommended_actions") or ()
             
             # Prepare combined metadata
             metadata = {
                 "analysis_type": "chunked_analysis",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "chunk_metadata": chunk_metadata,
                 "combined_results": {
                     "threat_score": combined_result.get("threat_score"),
                     "analysis_confidence": combined_result.get("analysis_confidence"),
-                    "total_findings": len(combined_result.get("analysis_results", {}).get("suspicious_findings", [])),
-                    "key_indicators_count": len(combined_result.get("key_indicators", [])),
-                    "recommended_actions_count": len(combined_result.get("recommended_actions", []))
+                    "total_findings": len(findings),
+                    "key_indicators_count": len(key_indicators),
+                    "recommended_actions_count": len(recommended_actions)
                 }
             }
             
             # Save metadata
-            timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-            metadata_file = os.path.join(results_dir, f"chunked_analysis_metadata_{timestamp_str}.json")
+            timestamp_str = now.strftime("%Y%m%d_%H%M%S")
+            metadata_file = f"{results_prefix}chunked_analysis_metadata_{timestamp_str}_{next(self._save_seq):06d}.json"
             
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            _write_bytes_file(metadata_file, _json_dumps_bytes(metadata, indent=self.config.pretty_json, newline=True))
             
-            print(f"💾 Chunked analysis metadata saved to: {metadata_file}")
+            _log.info("💾 Chunked analysis metadata saved to: %s", metadata_file)
             
         except Exception as e:
-            print(f"⚠️ Error saving chunked analysis metadata: {e}")
+            _log.warning("⚠️ Error saving chunked analysis metadata: %s", e)
     
     def _save_single_analysis_result(self, analysis_result: Dict[str, Any], 
-                                   evidence_directory: str, state: ForensicState):
+                                   evidence_directory: str, state: ForensicState,
+                                   *, kind: Optional[str] = None, now: Optional[datetime] = None):
         """
         Save analysis result to a JSON file with metadata.
         Works for both triage and deeper analysis results.
@@ -879,27 +1638,23 @@ class MemoryForensicsAgent:
             analysis_result: Complete analysis result dictionary
             evidence_directory: Directory to save the results in
             state: Current forensic state for context
+            kind: "triage" or "deeper"; inferred from the evidence directory if omitted
+            now: Timestamp to record; defaults to the current time
         """
-        import json
-        import os
-        from datetime import datetime
+        now = now or datetime.now()
         
         try:
             # Create analysis results directory
-            analysis_dir = os.path.join(evidence_directory, "analysis_results")
-            os.makedirs(analysis_dir, exist_ok=True)
+            results_prefix = self._results_prefix(evidence_directory)
             
-            # Determine analysis type based on evidence directory path
-            if "deeper" in evidence_directory.lower():
-                analysis_type = "deeper_analysis"
-                filename_prefix = "deeper_analysis"
-            else:
-                analysis_type = "triage_analysis"
-                filename_prefix = "triage_analysis"
+            # Determine analysis type, falling back to the evidence directory path
+            if kind is None:
+                kind = "deeper" if "deeper" in evidence_directory.lower() else "triage"
+            analysis_type = filename_prefix = f"{kind}_analysis"
             
             # Prepare result data with metadata
             result_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "analysis_type": analysis_type,
                 "memory_dump_path": state.get('memory_dump_path', 'Unknown'),
                 "os_hint": state.get('os_hint', 'Unknown'),
@@ -912,17 +1667,17 @@ class MemoryForensicsAgent:
                 "investigation_stage": analysis_result.get("investigation_stage")
             }
             
-            # Save with timestamp in filename for uniqueness
-            timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-            result_file = os.path.join(analysis_dir, f"{filename_prefix}_{timestamp_str}.json")
+            # Timestamp for readability, sequence number for uniqueness within a second
+            timestamp_str = now.strftime("%Y%m%d_%H%M%S")
+            result_file = f"{results_prefix}{filename_prefix}_{timestamp_str}_{next(self._save_seq):06d}.json"
             
-            with open(result_file, 'w') as f:
-                json.dump(result_data, f, indent=2, default=str)
+            # Normalized up front so the encoder never calls back into Python
+            _write_bytes_file(result_file, _json_dumps_bytes(_jsonable(result_data), indent=self.config.pretty_json, newline=True))
             
-            print(f"📄 Analysis results saved to: {result_file}")
+            _log.info("📄 Analysis results saved to: %s", result_file)
             
         except Exception as e:
-            print(f"⚠️ Failed to save analysis results: {e}")
+            _log.warning("⚠️ Failed to save analysis results: %s", e)
         
     async def investigate(
         self, 
@@ -953,15 +1708,40 @@ class MemoryForensicsAgent:
             retry_count=0
         )
         
-        print(f"🔍 Starting Memory Forensics Investigation")
-        print(f"📁 Memory Dump: {memory_dump_path}")
-        print(f"🖥️ OS Hint: {os_hint or 'Auto-detect'}")
-        print(f"🎯 Investigation Context: {user_prompt or 'General analysis'}")
-        print(f"{'='*60}")
+        if self._show_console_output:
+            print(f"🔍 Starting Memory Forensics Investigation")
+            print(f"📁 Memory Dump: {memory_dump_path}")
+            print(f"🖥️ OS Hint: {os_hint or 'Auto-detect'}")
+            print(f"🎯 Investigation Context: {user_prompt or 'General analysis'}")
+            print(f"{'='*60}")
+        
+        # Chunk-analysis LLM calls are bounded by their own semaphore, so the
+        # run-wide task limit doesn't also throttle the investigation phases
+        run_config = {
+            "configurable": {"agent": self}
+        }
         
         try:
+            graph_input = initial_state
+            if self._checkpointer is not None:
+                thread_id = _investigation_thread_id(memory_dump_path, os_hint, user_prompt)
+                run_config["configurable"]["thread_id"] = thread_id
+                # An unfinished run of the same investigation resumes from its
+                # last checkpoint; finished chunk tasks are not re-run
+                snapshot = await self.graph.aget_state(run_config)
+                if snapshot.next:
+                    _log.info("♻️ Resuming interrupted investigation at: %s", ", ".join(snapshot.next))
+                    graph_input = None
+                elif snapshot.values:
+                    # A completed run starts over; its accumulated chunk
+                    # results must not leak into the new one
+                    await self._checkpointer.adelete_thread(thread_id)
+            
             # Run the complete workflow
-            final_state = await self.graph.ainvoke(initial_state)
+            final_state = await self.graph.ainvoke(graph_input, config=run_config)
+            
+            # One durability barrier for every chunk result appended this run
+            await asyncio.to_thread(self._flush_chunk_results)
             
             # Extract results
             results = {
@@ -992,6 +1772,9 @@ class MemoryForensicsAgent:
             
     def _print_investigation_summary(self, results: Dict[str, Any]):
         """Print a summary of the investigation results."""
+        if not self._show_console_output:
+            return
+        
         print(f"\n{'='*60}")
         print(f"🎉 INVESTIGATION COMPLETE")
         print(f"{'='*60}")
@@ -1037,8 +1820,12 @@ async def run_investigation(
     Returns:
         Investigation results
     """
+    configure_logging()
     agent = MemoryForensicsAgent(config)
-    return await agent.investigate(memory_dump_path, os_hint, user_prompt)
+    try:
+        return await agent.investigate(memory_dump_path, os_hint, user_prompt)
+    finally:
+        await agent.aclose()
 
 
 # Example usage and testing
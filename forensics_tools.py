@@ -7,41 +7,124 @@ functionality.
 """
 
 from dotenv import load_dotenv
+import asyncio
+import functools
+import hashlib
+import io
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
+import threading
+import time
 import json
+import logging
+import queue
+import re
+import selectors
 import shlex
+import signal
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from datetime import datetime
-from langchain.agents import Tool
-from langchain.tools import StructuredTool
-from pydantic import BaseModel, Field
-from langchain_community.agent_toolkits import FileManagementToolkit
-from langchain_experimental.tools import PythonREPLTool
-from langchain_community.tools import ShellTool
-from langchain_openai import ChatOpenAI
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
+# The LangChain tool, toolkit and OpenAI modules are imported where they are
+# first used, so importing this module for validate_memory_dump stays cheap
+if TYPE_CHECKING:
+    from langchain.agents import Tool
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is used instead
+    orjson = None
+
 
 load_dotenv(override=True)
 pushover_token = os.getenv("PUSHOVER_TOKEN")
 pushover_user = os.getenv("PUSHOVER_USER")
 pushover_url = "https://api.pushover.net/1/messages.json"
+_log = logging.getLogger("forensics_tools")
+
+# Parses str or bytes, preferring the faster orjson decoder
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps_indented(obj: Any) -> str:
+    """Serialize ``obj`` as 2-space indented JSON text, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# Keep-alive session so repeated alerts reuse one TLS connection
+_pushover_session = requests.Session()
+_pushover_session.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.2)  # POST is only retried on connection failures
+))
+
+# On-disk cache of successful Volatility runs, keyed by dump fingerprint + argv;
+# least recently used results are evicted once it grows past its byte budget
+_vol_cache_dir = Path(os.path.expanduser(os.getenv("FORENSICS_VOL_CACHE_DIR", "~/.achilles/vol_cache")))
+_VOL_CACHE_MAX_BYTES = int(os.getenv("FORENSICS_VOL_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+_vol_cache_lock = threading.Lock()
+# Plugins and options whose real output is files written to disk; replaying
+# their stdout from the cache would leave those files missing
+_VOL_FILE_OUTPUT_RE = re.compile(r"dump", re.IGNORECASE)
+_VOL_OUTPUT_DIR_FLAGS = ("-o", "--output-dir")
+# Bytes hashed from each end of a dump when fingerprinting it
+_DUMP_FINGERPRINT_SPAN = 1024 * 1024
+# Volatility binary and dump flag used by the OS probes
+_VOL_PREFIX = ("vol", "-f")
+# Kernel banner signatures that identify the OS in banners.Banners output
+_BANNER_OS_PATTERNS = (
+    ("linux", re.compile(r"Linux version")),
+    ("mac", re.compile(r"Darwin Kernel")),
+    ("windows", re.compile(r"Windows NT"))
+)
+# High-signal tokens; small outputs without any skip the LLM IOC analysis
+_IOC_PREFILTER = re.compile(
+    r"\b(?:\d{1,3}\.){3}\d{1,3}\b|\\Temp\\|\\AppData\\|cmd\.exe|powershell|rundll32|\.(?:scr|hta|bat)\b|mimikatz|cobalt",
+    re.IGNORECASE
+)
+# Shell metacharacters rejected in Volatility arguments
+_DANGEROUS_RE = re.compile(r"[&|;`$\n\r><]")
+# Volatility output kept per stream; the command is stopped once stdout exceeds it
+_VOL_MAX_OUTPUT_BYTES = int(os.getenv("FORENSICS_VOL_MAX_OUTPUT_BYTES", str(2 * 1024 * 1024)))
+# Run plain `vol -f <dump> <plugin>` commands through the volatility3 library
+_VOL_IN_PROCESS = os.getenv("FORENSICS_VOL_IN_PROCESS", "false").lower() in ("1", "true", "yes")
+_vol_framework = None
+_vol_framework_lock = threading.Lock()
+# Set once an in-process run times out; the hung run would hold the framework
+# lock, so the rest of the process uses the CLI
+_vol_in_process_disabled = False
+# Same limit the vol CLI path enforces
+_VOL_TIMEOUT = 300
 
 # Initialize LLM for IOC analysis
 _ioc_llm = None
+_structured_ioc_llm = None
 
 def get_ioc_llm():
     """Get or initialize the LLM for IOC analysis."""
     global _ioc_llm
     if _ioc_llm is None:
+        from langchain_openai import ChatOpenAI
         _ioc_llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
     return _ioc_llm
 
 
+def get_structured_ioc_llm():
+    """Get or initialize the IOC LLM bound to the IOCAnalysis output schema."""
+    global _structured_ioc_llm
+    if _structured_ioc_llm is None:
+        _structured_ioc_llm = get_ioc_llm().with_structured_output(IOCAnalysis)
+    return _structured_ioc_llm
+
+
 
 class IOCAnalysis(BaseModel):
     """Structured output for IOC analysis."""
@@ -56,6 +139,212 @@ class IOCAnalysis(BaseModel):
     summary: str = Field(description="Brief summary of the most critical findings")
 
 
+# IOC report sections, in display order: (heading, IOCAnalysis field)
+_IOC_CATEGORIES = (
+    ("🚨 Suspicious Processes", "suspicious_processes"),
+    ("🌐 Network Indicators", "network_indicators"),
+    ("📁 File Indicators", "file_indicators"),
+    ("⚙️ Registry Indicators", "registry_indicators"),
+    ("🦠 Malware Signatures", "malware_signatures"),
+    ("🔄 Persistence Mechanisms", "persistence_mechanisms"),
+    ("🔍 Behavioral Indicators", "behavioral_indicators")
+)
+
+# System prompts are built once and shared by every call
+_IOC_SYSTEM_PROMPT = """You are a senior digital forensics analyst specializing in memory analysis and IOC identification. 
+        Your task is to analyze Volatility 3 output and extract potential Indicators of Compromise (IOCs) with high accuracy.
+
+        ANALYSIS GUIDELINES:
+        1. Look for processes with suspicious characteristics:
+           - Unusual process names or locations
+           - Processes running from temp directories
+           - Packed or obfuscated executables
+           - Processes with no parent or unusual parents
+           - Command-line arguments indicating malicious activity
+        
+        2. Identify network indicators:
+           - Connections to suspicious IPs or domains
+           - Unusual ports or protocols
+           - C2 communication patterns
+           - Large data transfers
+        
+        3. Find file system indicators:
+           - Files in suspicious locations (%TEMP%, %APPDATA%, etc.)
+           - Files with suspicious names or extensions
+           - Hidden or system files in user directories
+           - Recently created files in system directories
+        
+        4. Detect behavioral indicators:
+           - Process injection techniques
+           - Code hollowing or process replacement
+           - Unusual process relationships
+           - Privilege escalation attempts
+        
+        5. Registry and persistence mechanisms:
+           - Autostart registry keys
+           - Scheduled tasks
+           - Service installations
+           - DLL hijacking attempts
+        
+        Be specific in your findings - include PIDs, file paths, IP addresses, and other relevant details.
+        Focus on HIGH-CONFIDENCE indicators that warrant investigation.
+        Provide context for why each finding is suspicious.
+        
+        Rate your overall confidence in the analysis from 1-10 (10 being highest confidence)."""
+
+_PLAN_SYSTEM_PROMPT = """You are a senior digital forensics investigator and memory analysis expert. 
+        Your task is to create a comprehensive, adaptive investigation plan for memory dump analysis.
+
+        PLANNING PRINCIPLES:
+        1. **Adaptive Methodology**: Tailor the investigation based on the specific OS, incident type, and available context
+        2. **Prioritization**: Order steps by criticality and potential evidence value
+        3. **Efficiency**: Balance thoroughness with investigation timeline constraints
+        4. **Volatility Expertise**: Generate appropriate Volatility 3 commands for each OS type
+        5. **Evidence Preservation**: Ensure proper forensics methodology throughout
+
+        INVESTIGATION TYPES TO CONSIDER:
+        - Malware Analysis: Focus on processes, injection, persistence, network IOCs
+        - Incident Response: Timeline reconstruction, lateral movement, data access patterns
+        - Data Exfiltration: Network analysis, file access, encryption, compression activities
+        - Insider Threat: User activity, file access patterns, credential usage
+        - APT Investigation: Persistence mechanisms, C2 communications, tool artifacts
+        - Compliance: Data handling, access controls, audit trail reconstruction
+
+        OS-SPECIFIC CONSIDERATIONS:
+        - Windows: Registry analysis, Windows services, NTFS artifacts, Windows APIs
+        - Linux: Process trees, kernel modules, shared libraries, system calls
+        - macOS: LaunchAgents/Daemons, kernel extensions, system integrity
+
+        VOLATILITY 3 COMMAND CATEGORIES:
+        - System Info: windows.info, linux.banner, mac.banner
+        - Process Analysis: windows.pslist/psscan/pstree, linux.pslist, mac.pslist
+        - Network: windows.netscan, linux.netstat, mac.netstat  
+        - Malware Detection: windows.malfind, linux.check_afinfo, mac.check_syscalls
+        - Memory Regions: windows.memmap, linux.proc.maps, mac.proc.maps
+        - Registry: windows.registry.*, windows.hivelist
+        - Files: windows.filescan, linux.lsmod, mac.lsmod
+
+        OUTPUT FORMAT: Return a detailed JSON investigation plan with:
+        {
+          "investigation_summary": "Brief overview of the investigation approach",
+          "priority_level": "High/Medium/Low based on investigation type",
+          "estimated_duration": "Estimated time to complete",
+          "investigation_phases": [
+            {
+              "phase": "Phase name",
+              "description": "What this phase accomplishes",
+              "steps": [
+                {
+                  "step_number": 1,
+                  "task": "Specific task description",
+                  "command": "Complete Volatility command with proper syntax",
+                  "rationale": "Why this step is important",
+                  "expected_artifacts": "What evidence this might reveal",
+                  "priority": "High/Medium/Low"
+                }
+              ]
+            }
+          ],
+          "success_criteria": "How to determine if investigation goals are met",
+          "follow_up_recommendations": "Additional analysis that might be needed"
+        }"""
+
+
+def _kill_probe(process: subprocess.Popen):
+    """Kill a probe process and, on POSIX, any helpers it started."""
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass  # Already exited
+
+
+def _probe_dump_os(dump_path: str, os_name: Optional[str], command: str, timeout: float,
+                   processes: List[subprocess.Popen], stop: threading.Event) -> Optional[Tuple[str, str]]:
+    """
+    Run one Volatility OS probe against a memory dump.
+    
+    Args:
+        dump_path (str): Path to the memory dump file
+        os_name (Optional[str]): OS this probe identifies, or None to classify
+            the output with _BANNER_OS_PATTERNS
+        command (str): Volatility plugin to run
+        timeout (float): Seconds before the probe is abandoned
+        processes (List[subprocess.Popen]): Shared list the probe registers its process in
+        stop (threading.Event): Set once another probe has already succeeded
+        
+    Returns:
+        Optional[Tuple[str, str]]: (os_name, plugin output) on success, otherwise None
+    """
+    if stop.is_set():
+        return None
+    
+    # Build safe argv (no shell=True)
+    argv = [*_VOL_PREFIX, dump_path, command]
+    process = subprocess.Popen(
+        argv,  # List of arguments
+        shell=False,  # SAFE: No shell interpretation
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=(os.name == "posix")  # Own process group, so helpers die with it
+    )
+    processes.append(process)
+    if stop.is_set():
+        # Another probe won while this one was starting
+        _kill_probe(process)
+    
+    try:
+        stdout, _ = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_probe(process)
+        process.communicate()
+        return None
+    
+    if process.returncode != 0 or not stdout.strip():
+        return None
+    if os_name is not None:
+        return os_name, stdout
+    for detected, pattern in _BANNER_OS_PATTERNS:
+        if pattern.search(stdout):
+            return detected, stdout
+    return None
+
+
+# Cheap plugins that still make Volatility resolve and cache a dump's kernel
+# symbols. Windows needs none: the windows.info OS probe already resolved them.
+_WARMUP_PLUGINS = {"linux": "linux.lsmod", "mac": "mac.lsmod"}
+
+# Dumps whose symbols are already being warmed in the background
+_warm_set = set()
+_warm_lock = threading.Lock()
+
+
+def _warm_symbols(dump_path: str, plugin: str):
+    """Run a cheap plugin once so Volatility resolves and caches the dump's symbols."""
+    # Only the side effect matters: the output is discarded and never cached, so
+    # the plan's own commands don't wait on or duplicate this run
+    try:
+        _run_bounded([*_VOL_PREFIX, dump_path, plugin], _VOL_TIMEOUT, 64 * 1024)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        _log.debug("Symbol warm-up for %s failed: %s", dump_path, e)
+
+
+def _start_symbol_warmup(dump_path: str, os_name: str):
+    """Warm a dump's symbols on a daemon thread, once per dump, while the agent plans."""
+    plugin = _WARMUP_PLUGINS.get(os_name)
+    if plugin is None:
+        return
+    key = os.path.realpath(dump_path)
+    with _warm_lock:
+        if key in _warm_set:
+            return
+        _warm_set.add(key)
+    threading.Thread(target=_warm_symbols, args=(dump_path, plugin), name="vol-warmup", daemon=True).start()
+
+
 def validate_memory_dump(dump_path: str) -> str:
     """
     Validate if a file is a valid memory dump and extract basic metadata.
@@ -67,12 +356,14 @@ def validate_memory_dump(dump_path: str) -> str:
         str: Validation result with basic metadata or error message
     """
     try:
-        path = Path(dump_path)
-        if not path.exists():
+        # One stat call both checks existence and gives the size
+        try:
+            st = os.stat(dump_path)
+        except FileNotFoundError:
             return f"Error: Memory dump file not found at {dump_path}"
         
         # Check file size (memory dumps are typically large)
-        file_size = path.stat().st_size
+        file_size = st.st_size
         size_mb = file_size / (1024 * 1024)
         
         # Basic file validation
@@ -83,36 +374,39 @@ def validate_memory_dump(dump_path: str) -> str:
         os_detected = None
         basic_info = ""
         
-        # Test different OS types in order of likelihood
+        # OS probes in priority order, all launched at once. windows.info
+        # confirms Windows; one banners carve covers Linux and macOS. The carve
+        # usually finishes first, but a stray kernel banner string can turn up
+        # in a Windows dump, so its result only counts once windows.info fails.
         os_commands = [
-            ("windows", "windows.info"),
-            ("linux", "linux.banner"), 
-            ("mac", "mac.banner")
+            ("windows", "windows.info", 30),
+            (None, "banners.Banners", 45)
         ]
         
-        for os_name, command in os_commands:
+        processes = []
+        stop = threading.Event()
+        with ThreadPoolExecutor(max_workers=len(os_commands)) as executor:
+            futures = [
+                executor.submit(_probe_dump_os, dump_path, os_name, command, timeout, processes, stop)
+                for os_name, command, timeout in os_commands
+            ]
             try:
-                # Build safe argv (no shell=True)
-                argv = ["vol", "-f", dump_path, command]
-                
-                result = subprocess.run(
-                    argv,  # List of arguments
-                    shell=False,  # SAFE: No shell interpretation
-                    capture_output=True,
-                    text=True,
-                    timeout=30  # Shorter timeout per attempt
-                )
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    os_detected = os_name
-                    basic_info = result.stdout
-                    break  # Found working OS type
-                    
-            except subprocess.TimeoutExpired:
-                continue  # Try next OS type
+                # The highest-priority probe that succeeds wins
+                for future in futures:
+                    detected = future.result()
+                    if detected:
+                        os_detected, basic_info = detected
+                        break
+            finally:
+                # Kill the probes still running so the pool can shut down
+                stop.set()
+                for process in list(processes):
+                    if process.poll() is None:
+                        _kill_probe(process)
         
         # Return results with clear OS indication
         if os_detected:
+            _start_symbol_warmup(dump_path, os_detected)
             return f"Valid {os_detected.title()} memory dump detected!\nSize: {size_mb:.2f} MB\nOS Type: {os_detected}\nBasic Info:\n{basic_info}"
         else:
             return f"Memory dump file located (Size: {size_mb:.2f} MB). OS type could not be determined automatically."
@@ -121,6 +415,305 @@ def validate_memory_dump(dump_path: str) -> str:
         return f"Error validating memory dump: {str(e)}"
 
 
+@functools.lru_cache(maxsize=32)
+def _dump_fingerprint(dump_path: str, size: int, mtime_ns: int) -> bytes:
+    """
+    Fingerprint a memory dump from its size, mtime and head/tail bytes.
+    
+    Keyed on size and mtime as well as the path, so a replaced dump is
+    hashed again instead of reusing a stale fingerprint.
+    """
+    digest = hashlib.blake2b(f"{size}:{mtime_ns}".encode())
+    with open(dump_path, "rb") as f:
+        digest.update(f.read(_DUMP_FINGERPRINT_SPAN))
+        if size > 2 * _DUMP_FINGERPRINT_SPAN:
+            f.seek(-_DUMP_FINGERPRINT_SPAN, os.SEEK_END)
+            digest.update(f.read(_DUMP_FINGERPRINT_SPAN))
+    return digest.digest()
+
+
+def _vol_writes_files(argv: List[str]) -> bool:
+    """Whether a Volatility argv names a dump plugin, a --dump option, or an output directory."""
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in ("-f", "--file"):
+            next(args, None)  # The dump path may well contain "dump"
+            continue
+        if arg in _VOL_OUTPUT_DIR_FLAGS or arg.startswith("--output-dir=") or _VOL_FILE_OUTPUT_RE.search(arg):
+            return True
+    return False
+
+
+def _vol_cache_path(argv: List[str]) -> Optional[Path]:
+    """
+    Return the cache file for a Volatility argv, or None if it cannot be cached.
+    
+    The dump passed with -f/--file is canonicalized and fingerprinted, so the
+    same query against the same dump hits the cache however the path was spelled.
+    Commands that write files (dump plugins, --dump options, an output
+    directory) are never cached.
+    """
+    if _vol_writes_files(argv):
+        return None
+    argv = list(argv)
+    dump_path = None
+    for i, arg in enumerate(argv[:-1]):
+        if arg in ("-f", "--file"):
+            dump_path = argv[i + 1] = os.path.realpath(argv[i + 1])
+            break
+    if dump_path is None:
+        return None
+    
+    try:
+        st = os.stat(dump_path)
+        fingerprint = _dump_fingerprint(dump_path, st.st_size, st.st_mtime_ns)
+    except OSError:
+        return None
+    
+    key = hashlib.blake2b(fingerprint + b"|" + "\x00".join(argv[1:]).encode()).hexdigest()
+    return _vol_cache_dir / f"{key}.out"
+
+
+def _read_vol_cache(cache_path: Path) -> Optional[str]:
+    """Return a cached Volatility result, marking it recently used; None on a miss."""
+    try:
+        output = cache_path.read_text(encoding="utf-8")
+        os.utime(cache_path)  # mtime orders eviction
+        return output
+    except OSError:
+        return None
+
+
+def _store_vol_cache(cache_path: Path, output: str):
+    """Write a cached Volatility result atomically, then evict past the byte budget; failures are ignored."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(output, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+        _prune_vol_cache()
+    except OSError:
+        pass
+
+
+def _prune_vol_cache():
+    """Delete the least recently used cache entries until the cache fits _VOL_CACHE_MAX_BYTES."""
+    with _vol_cache_lock:
+        entries = []
+        for entry in os.scandir(_vol_cache_dir):
+            if entry.name.endswith(".out"):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= _VOL_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+def _run_bounded(argv: List[str], timeout: float, max_bytes: int) -> Tuple[int, str, str, bool]:
+    """
+    Run a command, streaming its output and stopping it once stdout exceeds max_bytes.
+    
+    Args:
+        argv (List[str]): Command to execute (no shell)
+        timeout (float): Seconds before the command is killed
+        max_bytes (int): Most bytes kept from each of stdout and stderr
+        
+    Returns:
+        Tuple[int, str, str, bool]: (returncode, stdout, stderr, truncated)
+        
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout
+    """
+    process = subprocess.Popen(
+        argv,
+        shell=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=(os.name == "posix")
+    )
+    
+    if os.name != "posix":
+        # Pipes cannot be polled with selectors on Windows
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_probe(process)
+            process.communicate()
+            raise
+        truncated = len(stdout) > max_bytes
+        return (process.returncode, stdout[:max_bytes].decode(errors="replace"),
+                stderr[:max_bytes].decode(errors="replace"), truncated)
+    
+    buffers = {process.stdout: bytearray(), process.stderr: bytearray()}
+    deadline = time.monotonic() + timeout
+    truncated = False
+    try:
+        with selectors.DefaultSelector() as selector:
+            for pipe in buffers:
+                selector.register(pipe, selectors.EVENT_READ)
+            while selector.get_map() and not truncated:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(argv, timeout)
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        continue
+                    buffer = buffers[key.fileobj]
+                    if len(buffer) < max_bytes:
+                        buffer += chunk
+                    if len(buffers[process.stdout]) > max_bytes:
+                        truncated = True
+    finally:
+        if process.poll() is None and (truncated or time.monotonic() >= deadline):
+            _kill_probe(process)
+        process.stdout.close()
+        process.stderr.close()
+        process.wait()
+    
+    return (process.returncode, bytes(buffers[process.stdout][:max_bytes]).decode(errors="replace"),
+            bytes(buffers[process.stderr][:max_bytes]).decode(errors="replace"), truncated)
+
+
+class _VolOutputBudgetExceeded(Exception):
+    """Raised from the in-process renderer once the output cap is reached."""
+
+
+def _load_vol_framework() -> Optional[Tuple[Dict[str, Any], Any]]:
+    """
+    Import volatility3 and discover its plugins once per process.
+    
+    Returns:
+        Optional[Tuple[Dict[str, Any], Any]]: (plugin classes by name, cell formatter),
+        or None if volatility3 is not importable
+    """
+    global _vol_framework
+    if _vol_framework is None:
+        try:
+            import volatility3.plugins
+            from volatility3 import framework
+            from volatility3.framework import interfaces
+            from volatility3.framework.renderers import format_hints
+            framework.require_interface_version(2, 0, 0)
+            framework.import_files(volatility3.plugins, True)
+            
+            def format_cell(value: Any) -> str:
+                if isinstance(value, interfaces.renderers.BaseAbsentValue):
+                    return "-"
+                if isinstance(value, format_hints.Hex):
+                    return hex(value)
+                if isinstance(value, bytes):
+                    return value.hex()
+                return str(value)
+            
+            _vol_framework = (framework.list_plugins(), format_cell)
+        except Exception:
+            _vol_framework = False
+    return _vol_framework or None
+
+
+def _render_vol_plugin(dump_path: str, plugin: Any, format_cell: Any) -> str:
+    """Construct and run a Volatility plugin against a dump, rendering rows as tab-separated text."""
+    from volatility3.framework import automagic, contexts, plugins
+    from volatility3.framework.automagic import stacker
+    from volatility3.framework.configuration import requirements
+    
+    # Same setup the vol CLI performs for `-f <dump> <plugin>`
+    ctx = contexts.Context()
+    ctx.config["automagic.LayerStacker.single_location"] = requirements.URIRequirement.location_from_file(dump_path)
+    automagics = automagic.choose_automagic(automagic.available(ctx), plugin)
+    ctx.config["automagic.LayerStacker.stackers"] = stacker.choose_os_stackers(plugin)
+    # No file handler: a plugin that tries to write files fails and falls back to the CLI
+    constructed = plugins.construct_plugin(ctx, automagics, plugin, "plugins", None, None)
+    grid = constructed.run()
+    
+    output = io.StringIO()
+    output.write("\t".join(column.name for column in grid.columns))
+    
+    def visitor(node, accumulator):
+        accumulator.write("\n" + "*" * max(0, node.path_depth - 1) + ("" if node.path_depth <= 1 else " "))
+        accumulator.write("\t".join(format_cell(value) for value in node.values))
+        if accumulator.tell() > _VOL_MAX_OUTPUT_BYTES:
+            raise _VolOutputBudgetExceeded
+        return accumulator
+    
+    try:
+        if not grid.populated:
+            grid.populate(visitor, output)
+        else:
+            grid.visit(node=None, function=visitor, initial_accumulator=output)
+    except _VolOutputBudgetExceeded:
+        output.write(f"\n[TRUNCATED AT {_VOL_MAX_OUTPUT_BYTES // 1024} KiB]")
+    return output.getvalue()
+
+
+def _run_volatility_in_process(argv: List[str], timeout: float = _VOL_TIMEOUT) -> Optional[str]:
+    """
+    Run `vol -f <dump> <plugin>` through the volatility3 library.
+    
+    Reuses the imported framework and plugin registry across calls instead of
+    paying the vol start-up for every command. Runs are serialized, since the
+    framework keeps process-wide state, and bounded by the same timeout as the
+    CLI path. A call that finds another run in progress goes straight to the
+    CLI instead of waiting for it. A run that times out disables the
+    in-process path for the rest of the process.
+    
+    Returns:
+        Optional[str]: Rendered plugin output, or None to fall back to the vol CLI
+        (plugin options, file-writing or unknown plugins, volatility3 not
+        importable, a busy framework, a timeout, or any failure)
+    """
+    global _vol_in_process_disabled
+    if _vol_in_process_disabled:
+        return None
+    if len(argv) != 4 or argv[1] not in ("-f", "--file") or _vol_writes_files(argv):
+        return None
+    dump_path, plugin_name = argv[2], argv[3]
+    
+    if not _vol_framework_lock.acquire(blocking=False):
+        return None
+    result: Dict[str, str] = {}
+    done = threading.Event()
+    
+    def run():
+        # Releases the lock itself, so an abandoned run still holds it until it ends
+        try:
+            loaded = _load_vol_framework()
+            if loaded is None:
+                return
+            plugin_list, format_cell = loaded
+            plugin = plugin_list.get(plugin_name)
+            if plugin is None:
+                # The CLI accepts unambiguous prefixes such as windows.pslist
+                matches = [name for name in plugin_list if name.startswith(plugin_name + ".")]
+                if len(matches) != 1:
+                    return
+                plugin = plugin_list[matches[0]]
+            result["output"] = _render_vol_plugin(dump_path, plugin, format_cell)
+        except Exception as e:
+            _log.debug("In-process Volatility run failed, using the vol CLI: %s", e)
+        finally:
+            _vol_framework_lock.release()
+            done.set()
+    
+    threading.Thread(target=run, name="vol-in-process", daemon=True).start()
+    if not done.wait(timeout):
+        _vol_in_process_disabled = True
+        _log.warning("⚠️ In-process Volatility run exceeded %ss; using the vol CLI from now on", timeout)
+        return None
+    return result.get("output")
+
+
 def run_volatility_command(command: str) -> str:
     """
     Execute a Volatility 3 command safely with proper error handling.
@@ -149,27 +742,40 @@ def run_volatility_command(command: str) -> str:
             return "Error: Command must start with 'vol' or 'vol3'"
         
         # Check for shell metacharacters in arguments
-        dangerous_chars = ['&', '|', ';', '`', '$', '\n', '\r', '>', '<']
         for arg in argv:
-            if any(char in arg for char in dangerous_chars):
+            if _DANGEROUS_RE.search(arg):
                 return f"Error: Suspicious character in argument: {arg}"
         
-        # Execute the command safely (no shell)
-        result = subprocess.run(
-            argv,  # List of arguments
-            shell=False,  # SAFE: No shell interpretation
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout for longer operations
-        )
-        
-        if result.returncode != 0:
-            return f"Volatility Error (exit code {result.returncode}):\n{result.stderr.strip()}"
+        # Identical queries against an unchanged dump are served from disk
+        cache_path = _vol_cache_path(argv)
+        if cache_path is not None:
+            cached = _read_vol_cache(cache_path)
+            if cached is not None:
+                return cached
         
-        output = result.stdout.strip()
+        output = _run_volatility_in_process(argv) if _VOL_IN_PROCESS and not _vol_in_process_disabled else None
+        if output is not None:
+            # Library rendering differs from the CLI's; only CLI output is cached
+            cache_path = None
+            output = output.strip()
+        else:
+            # Execute the command safely (no shell), keeping at most
+            # _VOL_MAX_OUTPUT_BYTES of output; 5 minute timeout for longer operations
+            returncode, stdout, stderr, truncated = _run_bounded(argv, _VOL_TIMEOUT, _VOL_MAX_OUTPUT_BYTES)
+            
+            if truncated:
+                # Partial output must not be replayed as if it were complete
+                cache_path = None
+                output = f"{stdout}\n[TRUNCATED AT {_VOL_MAX_OUTPUT_BYTES // 1024} KiB]"
+            elif returncode != 0:
+                return f"Volatility Error (exit code {returncode}):\n{stderr.strip()}"
+            else:
+                output = stdout.strip()
         if not output:
             return "Command executed successfully but produced no output"
-            
+        
+        if cache_path is not None:
+            _store_vol_cache(cache_path, output)
         return output
         
     except subprocess.TimeoutExpired:
@@ -178,6 +784,90 @@ def run_volatility_command(command: str) -> str:
         return f"Error executing Volatility command: {str(e)}"
 
 
+async def run_volatility_batch(commands: List[str]) -> Dict[str, str]:
+    """
+    Execute several independent Volatility 3 commands concurrently.
+    
+    Each command goes through run_volatility_command, so it gets the same
+    validation, output cap and result cache; at most one command per CPU
+    runs at a time.
+    
+    Args:
+        commands (List[str]): Volatility commands to execute (each should start with 'vol')
+        
+    Returns:
+        Dict[str, str]: Output or error message for each distinct command
+    """
+    semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+    
+    async def run_one(command: str) -> str:
+        async with semaphore:
+            return await asyncio.to_thread(run_volatility_command, command)
+    
+    unique_commands = list(dict.fromkeys(commands))
+    outputs = await asyncio.gather(*(run_one(command) for command in unique_commands))
+    return dict(zip(unique_commands, outputs))
+
+
+def run_volatility_batch_sync(commands: List[str]) -> Dict[str, str]:
+    """Synchronous counterpart of run_volatility_batch for non-async callers."""
+    unique_commands = list(dict.fromkeys(commands))
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        return dict(zip(unique_commands, executor.map(run_volatility_command, unique_commands)))
+
+
+@functools.lru_cache(maxsize=256)
+def _analyze_iocs(volatility_output: str) -> str:
+    """
+    Run the LLM IOC analysis on already-truncated output and format the findings.
+    
+    Cached on the output text, since agents often feed the same plugin output
+    back in; failures raise and are not cached.
+    """
+    structured_llm = get_structured_ioc_llm()
+    
+    human_prompt = f"""Analyze the following Volatility forensics output and extract all potential IOCs:
+
+    VOLATILITY OUTPUT:
+    {volatility_output}
+    
+    Please identify and categorize all suspicious indicators with detailed explanations."""
+    
+    messages = [
+        SystemMessage(content=_IOC_SYSTEM_PROMPT),
+        HumanMessage(content=human_prompt)
+    ]
+    
+    # Get structured IOC analysis from LLM
+    ioc_analysis = structured_llm.invoke(messages)
+    
+    # Format the results for display
+    parts = [
+        "🔍 **LLM-POWERED IOC ANALYSIS**\n",
+        "=" * 50 + "\n\n",
+        # Summary
+        f"**📋 ANALYSIS SUMMARY** (Confidence: {ioc_analysis.confidence_score}/10)\n",
+        f"{ioc_analysis.summary}\n\n"
+    ]
+    
+    # Detailed findings by category
+    found_any = False
+    for category_name, field_name in _IOC_CATEGORIES:
+        indicators = getattr(ioc_analysis, field_name)
+        if indicators:
+            found_any = True
+            parts.append(f"**{category_name}:**\n")
+            parts.extend(f"  • {indicator}\n" for indicator in indicators)
+            parts.append("\n")
+    
+    # If no IOCs found
+    if not found_any:
+        parts.append("✅ **No significant IOCs detected** in the provided output.\n")
+        parts.append("This could indicate either a clean system or that additional analysis is needed.\n")
+    
+    return "".join(parts)
+
+
 def extract_iocs_from_output(volatility_output: str) -> str:
     """
     Extract potential Indicators of Compromise (IOCs) from Volatility output using LLM analysis.
@@ -201,102 +891,37 @@ def extract_iocs_from_output(volatility_output: str) -> str:
         if len(volatility_output) > max_chars:
             volatility_output = volatility_output[:max_chars] + "\n[...OUTPUT TRUNCATED...]"
         
-        llm = get_ioc_llm()
-        structured_llm = llm.with_structured_output(IOCAnalysis)
-        
-        system_prompt = """You are a senior digital forensics analyst specializing in memory analysis and IOC identification. 
-        Your task is to analyze Volatility 3 output and extract potential Indicators of Compromise (IOCs) with high accuracy.
-
-        ANALYSIS GUIDELINES:
-        1. Look for processes with suspicious characteristics:
-           - Unusual process names or locations
-           - Processes running from temp directories
-           - Packed or obfuscated executables
-           - Processes with no parent or unusual parents
-           - Command-line arguments indicating malicious activity
-        
-        2. Identify network indicators:
-           - Connections to suspicious IPs or domains
-           - Unusual ports or protocols
-           - C2 communication patterns
-           - Large data transfers
-        
-        3. Find file system indicators:
-           - Files in suspicious locations (%TEMP%, %APPDATA%, etc.)
-           - Files with suspicious names or extensions
-           - Hidden or system files in user directories
-           - Recently created files in system directories
-        
-        4. Detect behavioral indicators:
-           - Process injection techniques
-           - Code hollowing or process replacement
-           - Unusual process relationships
-           - Privilege escalation attempts
-        
-        5. Registry and persistence mechanisms:
-           - Autostart registry keys
-           - Scheduled tasks
-           - Service installations
-           - DLL hijacking attempts
-        
-        Be specific in your findings - include PIDs, file paths, IP addresses, and other relevant details.
-        Focus on HIGH-CONFIDENCE indicators that warrant investigation.
-        Provide context for why each finding is suspicious.
-        
-        Rate your overall confidence in the analysis from 1-10 (10 being highest confidence)."""
-        
-        human_prompt = f"""Analyze the following Volatility forensics output and extract all potential IOCs:
-
-        VOLATILITY OUTPUT:
-        {volatility_output}
-        
-        Please identify and categorize all suspicious indicators with detailed explanations."""
-        
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=human_prompt)
-        ]
+        # Small outputs with no high-signal tokens are not worth an LLM call
+        if len(volatility_output) < 500 and not _IOC_PREFILTER.search(volatility_output):
+            return ("🔍 **FAST-PATH IOC SCAN**\n"
+                    "✅ **No significant IOCs detected** in the provided output (LLM analysis skipped).\n")
         
-        # Get structured IOC analysis from LLM
-        ioc_analysis = structured_llm.invoke(messages)
-        
-        # Format the results for display
-        result = "🔍 **LLM-POWERED IOC ANALYSIS**\n"
-        result += "=" * 50 + "\n\n"
-        
-        # Summary
-        result += f"**📋 ANALYSIS SUMMARY** (Confidence: {ioc_analysis.confidence_score}/10)\n"
-        result += f"{ioc_analysis.summary}\n\n"
-        
-        # Detailed findings by category
-        categories = [
-            ("🚨 Suspicious Processes", ioc_analysis.suspicious_processes),
-            ("🌐 Network Indicators", ioc_analysis.network_indicators),
-            ("📁 File Indicators", ioc_analysis.file_indicators),
-            ("⚙️ Registry Indicators", ioc_analysis.registry_indicators),
-            ("🦠 Malware Signatures", ioc_analysis.malware_signatures),
-            ("🔄 Persistence Mechanisms", ioc_analysis.persistence_mechanisms),
-            ("🔍 Behavioral Indicators", ioc_analysis.behavioral_indicators)
-        ]
-        
-        for category_name, indicators in categories:
-            if indicators:
-                result += f"**{category_name}:**\n"
-                for indicator in indicators:
-                    result += f"  • {indicator}\n"
-                result += "\n"
-        
-        # If no IOCs found
-        if not any(indicators for _, indicators in categories):
-            result += "✅ **No significant IOCs detected** in the provided output.\n"
-            result += "This could indicate either a clean system or that additional analysis is needed.\n"
-        
-        return result
+        return _analyze_iocs(volatility_output)
         
     except Exception as e:
         return f"❌ **Error in LLM IOC analysis:** {str(e)}\n\nFalling back to basic pattern analysis..."
 
 
+@functools.lru_cache(maxsize=128)
+def _request_investigation_plan(human_prompt: str) -> str:
+    """
+    Request an investigation plan from the LLM for a fully rendered user prompt.
+    
+    Cached on the prompt text (the system prompt is fixed), so an agent that
+    asks for the same plan again does not pay for another LLM call; failures
+    raise and are not cached.
+    """
+    messages = [
+        SystemMessage(content=_PLAN_SYSTEM_PROMPT),
+        HumanMessage(content=human_prompt)
+    ]
+    
+    # Get intelligent plan from LLM
+    response = get_ioc_llm().invoke(messages)
+    _log.debug("Investigation plan response: %s", response)
+    return response.content
+
+
 def generate_investigation_plan(dump_path: str, investigation_goal: str = "malware analysis", detected_os: str = "unknown", additional_context: str = "") -> str:
     """
     Generate an intelligent, LLM-driven investigation plan for memory dump analysis.
@@ -315,65 +940,6 @@ def generate_investigation_plan(dump_path: str, investigation_goal: str = "malwa
         str: Comprehensive investigation plan with adaptive steps and commands
     """
     try:
-        llm = get_ioc_llm()
-        
-        system_prompt = """You are a senior digital forensics investigator and memory analysis expert. 
-        Your task is to create a comprehensive, adaptive investigation plan for memory dump analysis.
-
-        PLANNING PRINCIPLES:
-        1. **Adaptive Methodology**: Tailor the investigation based on the specific OS, incident type, and available context
-        2. **Prioritization**: Order steps by criticality and potential evidence value
-        3. **Efficiency**: Balance thoroughness with investigation timeline constraints
-        4. **Volatility Expertise**: Generate appropriate Volatility 3 commands for each OS type
-        5. **Evidence Preservation**: Ensure proper forensics methodology throughout
-
-        INVESTIGATION TYPES TO CONSIDER:
-        - Malware Analysis: Focus on processes, injection, persistence, network IOCs
-        - Incident Response: Timeline reconstruction, lateral movement, data access patterns
-        - Data Exfiltration: Network analysis, file access, encryption, compression activities
-        - Insider Threat: User activity, file access patterns, credential usage
-        - APT Investigation: Persistence mechanisms, C2 communications, tool artifacts
-        - Compliance: Data handling, access controls, audit trail reconstruction
-
-        OS-SPECIFIC CONSIDERATIONS:
-        - Windows: Registry analysis, Windows services, NTFS artifacts, Windows APIs
-        - Linux: Process trees, kernel modules, shared libraries, system calls
-        - macOS: LaunchAgents/Daemons, kernel extensions, system integrity
-
-        VOLATILITY 3 COMMAND CATEGORIES:
-        - System Info: windows.info, linux.banner, mac.banner
-        - Process Analysis: windows.pslist/psscan/pstree, linux.pslist, mac.pslist
-        - Network: windows.netscan, linux.netstat, mac.netstat  
-        - Malware Detection: windows.malfind, linux.check_afinfo, mac.check_syscalls
-        - Memory Regions: windows.memmap, linux.proc.maps, mac.proc.maps
-        - Registry: windows.registry.*, windows.hivelist
-        - Files: windows.filescan, linux.lsmod, mac.lsmod
-
-        OUTPUT FORMAT: Return a detailed JSON investigation plan with:
-        {
-          "investigation_summary": "Brief overview of the investigation approach",
-          "priority_level": "High/Medium/Low based on investigation type",
-          "estimated_duration": "Estimated time to complete",
-          "investigation_phases": [
-            {
-              "phase": "Phase name",
-              "description": "What this phase accomplishes",
-              "steps": [
-                {
-                  "step_number": 1,
-                  "task": "Specific task description",
-                  "command": "Complete Volatility command with proper syntax",
-                  "rationale": "Why this step is important",
-                  "expected_artifacts": "What evidence this might reveal",
-                  "priority": "High/Medium/Low"
-                }
-              ]
-            }
-          ],
-          "success_criteria": "How to determine if investigation goals are met",
-          "follow_up_recommendations": "Additional analysis that might be needed"
-        }"""
-        
         human_prompt = f"""Create a comprehensive investigation plan for the following memory dump analysis:
 
         **INVESTIGATION DETAILS:**
@@ -391,29 +957,21 @@ def generate_investigation_plan(dump_path: str, investigation_goal: str = "malwa
 
         Focus on creating an intelligent, context-aware plan rather than a generic template."""
         
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=human_prompt)
-        ]
-        
-        # Get intelligent plan from LLM
-        response = llm.invoke(messages)
-        print(response)
-        plan_content = response.content
+        plan_content = _request_investigation_plan(human_prompt)
         
         # Try to parse as JSON to validate structure, but return the full content
         try:
-            parsed_plan = json.loads(plan_content)
-            return json.dumps(parsed_plan, indent=2)
-        except json.JSONDecodeError:
+            parsed_plan = _json_loads(plan_content)
+            return _json_dumps_indented(parsed_plan)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
             # If not valid JSON, wrap in a basic structure
             fallback_plan = {
                 "investigation_summary": f"LLM-generated plan for {investigation_goal}",
                 "plan_content": plan_content,
-                "generated_timestamp": str(datetime.now()),
+                "generated_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
                 "note": "Generated by AI forensics planner"
             }
-            return json.dumps(fallback_plan, indent=2)
+            return _json_dumps_indented(fallback_plan)
         
     except Exception as e:
         # Fallback to a basic plan if LLM fails
@@ -439,67 +997,119 @@ def generate_investigation_plan(dump_path: str, investigation_goal: str = "malwa
             "note": "Generated using fallback planning due to LLM error"
         }
         
-        return json.dumps(fallback_plan, indent=2)
+        return _json_dumps_indented(fallback_plan)
+
+
+# Pending notifications, drained by a daemon worker started on first use
+_push_q = queue.Queue(maxsize=256)
+_push_worker_lock = threading.Lock()
+_push_worker_started = False
+
+
+def _push_worker():
+    """Send queued notifications one by one, logging failures."""
+    while True:
+        text = _push_q.get()
+        try:
+            response = _pushover_session.post(pushover_url, data={
+                "token": pushover_token, 
+                "user": pushover_user, 
+                "message": f"[Forensics] {text}"
+            }, timeout=(3, 5))
+            if response.status_code != 200:
+                _log.warning("⚠️ Failed to send push notification: %s", response.status_code)
+        except Exception as e:
+            _log.warning("⚠️ Error sending push notification: %s", e)
+        finally:
+            _push_q.task_done()
 
 
 def push(text: str) -> str:
     """
-    Send a push notification to the user about investigation progress.
+    Queue a push notification to the user about investigation progress.
+    
+    The notification is sent by a background thread, so the caller never
+    waits on Pushover; delivery failures are logged rather than returned.
     
     Args:
         text (str): Message to send
         
     Returns:
-        str: Success or error message
+        str: Queued or error message
     """
+    global _push_worker_started
+    if not pushover_token or not pushover_user:
+        return "Push notifications not configured (missing tokens)"
+    
+    if not _push_worker_started:
+        with _push_worker_lock:
+            if not _push_worker_started:
+                threading.Thread(target=_push_worker, name="pushover", daemon=True).start()
+                _push_worker_started = True
+    
     try:
-        if not pushover_token or not pushover_user:
-            return "Push notifications not configured (missing tokens)"
-            
-        response = requests.post(pushover_url, data={
-            "token": pushover_token, 
-            "user": pushover_user, 
-            "message": f"[Forensics] {text}"
-        })
-        
-        if response.status_code == 200:
-            return "Push notification sent successfully"
-        else:
-            return f"Failed to send push notification: {response.status_code}"
-            
-    except Exception as e:
-        return f"Error sending push notification: {str(e)}"
+        _push_q.put_nowait(text)
+    except queue.Full:
+        # Drop rather than block the investigation on a backlog of alerts
+        _log.warning("⚠️ Push notification queue full, dropping: %s", text)
+        return "Push notification dropped (queue full)"
+    return "Push notification queued"
 
 
-def get_file_tools() -> List[Tool]:
+def get_file_tools() -> List["Tool"]:
     """
     Get file management tools configured for forensics work.
     
     Returns:
         List[Tool]: File management tools
     """
+    from langchain_community.agent_toolkits import FileManagementToolkit
+    
     # Use sandbox directory for forensics outputs
     toolkit = FileManagementToolkit(root_dir="sandbox")
     return toolkit.get_tools()
 
 
-def get_shell_tools() -> List[Tool]:
+def get_shell_tools() -> List["Tool"]:
     """
     Get shell tools for system operations.
     
     Returns:
         List[Tool]: Shell command tools
     """
+    from langchain_community.tools import ShellTool
     return [ShellTool()]
 
 
-async def forensics_tools() -> List[Tool]:
+# Tool set shared by every agent in the process, built on first request
+_forensics_tools = None
+_forensics_tools_lock = asyncio.Lock()
+
+
+async def forensics_tools() -> List["Tool"]:
     """
     Get all forensics-specific tools for memory dump analysis.
     
+    The tools are built once per process; later calls return the cached set.
+    
     Returns:
         List[Tool]: Complete set of forensics tools
     """
+    global _forensics_tools
+    if _forensics_tools is None:
+        async with _forensics_tools_lock:
+            if _forensics_tools is None:
+                _forensics_tools = _build_forensics_tools()
+    # Copy so callers can extend their list without touching the cache
+    return list(_forensics_tools)
+
+
+def _build_forensics_tools() -> List["Tool"]:
+    """Construct the forensics tool set."""
+    from langchain.agents import Tool
+    from langchain.tools import StructuredTool
+    from langchain_experimental.tools import PythonREPLTool
+    
     # Core forensics tools
     dump_validator = Tool(
         name="validate_memory_dump",
@@ -513,6 +1123,17 @@ async def forensics_tools() -> List[Tool]:
         description="Execute Volatility 3 commands for memory analysis. Command must start with 'vol'. Example: 'vol -f /path/to/dump windows.pslist'"
     )
     
+    class VolatilityBatchInput(BaseModel):
+        commands: List[str] = Field(description="Independent Volatility commands against the same dump, each starting with 'vol'")
+    
+    volatility_batch_runner = StructuredTool(
+        name="run_volatility_batch",
+        func=run_volatility_batch_sync,
+        coroutine=run_volatility_batch,
+        args_schema=VolatilityBatchInput,
+        description="Execute several independent Volatility 3 commands in parallel and return each command's output keyed by command. Use for triage bundles such as pslist, psscan, netscan and malfind. Example: ['vol -f /path/to/dump windows.pslist', 'vol -f /path/to/dump windows.netscan']"
+    )
+    
     ioc_extractor = Tool(
         name="extract_iocs",
         func=extract_iocs_from_output,
@@ -550,6 +1171,7 @@ async def forensics_tools() -> List[Tool]:
     all_tools = [
         dump_validator,
         volatility_runner,
+        volatility_batch_runner,
         ioc_extractor,
         plan_generator,
         push_tool,
@@ -7,17 +7,20 @@ used throughout the forensics investigation workflow.
 
 from models.state import (
     ForensicState,
+    ForensicView,
     EvaluatorOutput,
     SuspiciousFinding,
     AnalysisOutput
 )
 
-from models.schemas import VOL3_PLAN_SCHEMA
+from models.schemas import VOL3_PLAN_SCHEMA, validate_vol3_plan
 
 __all__ = [
     'ForensicState',
+    'ForensicView',
     'EvaluatorOutput',
     'SuspiciousFinding',
     'AnalysisOutput',
-    'VOL3_PLAN_SCHEMA'
+    'VOL3_PLAN_SCHEMA',
+    'validate_vol3_plan'
 ]
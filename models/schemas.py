@@ -5,9 +5,14 @@ This module contains the JSON schema for Volatility 3 investigation plans
 and other validation schemas used throughout the system.
 """
 
-from typing import Dict, Any
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
-VOL3_PLAN_SCHEMA: Dict[str, Any] = {
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
+
+_VOL3_PLAN_SCHEMA_SOURCE: Dict[str, Any] = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "title": "Volatility3 Memory Investigation Plan",
     "type": "object",
@@ -125,3 +130,40 @@ VOL3_PLAN_SCHEMA: Dict[str, Any] = {
         }
     }
 }
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples, interning strings."""
+    if isinstance(obj, dict):
+        return MappingProxyType({sys.intern(key): _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    return obj
+
+
+# Checked once at import; jsonschema.validate() re-checks the schema and
+# builds a new validator on every call. The meta-schema only accepts plain
+# dicts, so the validator is built from the source before it is frozen.
+Draft202012Validator.check_schema(_VOL3_PLAN_SCHEMA_SOURCE)
+_VOL3_PLAN_VALIDATOR = Draft202012Validator(_VOL3_PLAN_SCHEMA_SOURCE)
+
+# Read-only view of the plan schema; serialize with json.dumps(..., default=dict)
+VOL3_PLAN_SCHEMA: Mapping[str, Any] = _freeze(_VOL3_PLAN_SCHEMA_SOURCE)
+
+
+def validate_vol3_plan(plan: Dict[str, Any]) -> None:
+    """
+    Validate an investigation plan against VOL3_PLAN_SCHEMA.
+    
+    Args:
+        plan: Parsed investigation plan
+        
+    Raises:
+        jsonschema.ValidationError: The most relevant schema violation, as
+            reported by jsonschema.validate()
+    """
+    error = best_match(_VOL3_PLAN_VALIDATOR.iter_errors(plan))
+    if error is not None:
+        raise error
@@ -5,12 +5,14 @@ This module contains the TypedDict state definition and all Pydantic models
 used throughout the forensics investigation workflow.
 """
 
+import operator
+from dataclasses import dataclass, fields
 from typing import Annotated, List, Any, Optional, Dict, TypedDict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from langgraph.graph.message import add_messages
 
 
-class ForensicState(TypedDict): 
+class ForensicState(TypedDict, total=False): 
     """State dictionary for the forensics investigation workflow."""
     messages: Annotated[List[Any], add_messages]
     memory_dump_path: Optional[str]
@@ -26,6 +28,7 @@ class ForensicState(TypedDict):
     retry_count: Optional[int]  # Track retry attempts for plan generation
     execution_status: Optional[str]  # "completed" | "partial" | "failed" | "skipped"
     execution_results: Optional[Dict[str, Any]]  # Detailed execution results
+    phase_results: Annotated[List[Dict[str, Any]], operator.add]  # Per-phase results from the execution fan-out
     execution_error: Optional[str]  # Execution error message
     evidence_directory: Optional[str]  # Path to evidence directory
     execution_summary: Optional[Dict[str, Any]]  # Execution statistics summary
@@ -34,10 +37,60 @@ class ForensicState(TypedDict):
     threat_score: Optional[float]  # Overall threat score
     key_indicators: Optional[List[str]]  # Key indicators found
     recommended_actions: Optional[List[str]]  # Recommended next steps
+    triage_chunks: Optional[Dict[str, Any]]  # Chunking metadata for the current triage pass
+    analysis_context_tokens: Optional[int]  # Token count of the gathered triage context
+    chunk_results: Annotated[List[Dict[str, Any]], operator.add]  # Per-chunk results from the triage fan-out
+
+
+
+@dataclass(slots=True, frozen=True)
+class ForensicView:
+    """
+    Read-only, slotted snapshot of a ForensicState for nodes that read many
+    fields: attribute access instead of repeated string-keyed .get() calls.
+    
+    Mirrors ForensicState field for field; keep the two in step.
+    """
+    messages: Optional[List[Any]] = None
+    memory_dump_path: Optional[str] = None
+    investigation_plan: Optional[str] = None
+    investigation_stage: Optional[str] = None
+    validation_status: Optional[str] = None
+    validation_error: Optional[str] = None
+    user_prompt: Optional[str] = None
+    os_hint: Optional[str] = None
+    evaluation_feedback: Optional[str] = None
+    success_criteria_met: Optional[bool] = None
+    user_input_needed: Optional[bool] = None
+    retry_count: Optional[int] = None
+    execution_status: Optional[str] = None
+    execution_results: Optional[Dict[str, Any]] = None
+    phase_results: Optional[List[Dict[str, Any]]] = None
+    execution_error: Optional[str] = None
+    evidence_directory: Optional[str] = None
+    execution_summary: Optional[Dict[str, Any]] = None
+    analysis_results: Optional[Dict[str, Any]] = None
+    analysis_confidence: Optional[float] = None
+    threat_score: Optional[float] = None
+    key_indicators: Optional[List[str]] = None
+    recommended_actions: Optional[List[str]] = None
+    triage_chunks: Optional[Dict[str, Any]] = None
+    analysis_context_tokens: Optional[int] = None
+    chunk_results: Optional[List[Dict[str, Any]]] = None
+    
+    @classmethod
+    def from_state(cls, state: ForensicState) -> "ForensicView":
+        """Copy every field out of ``state`` once; missing keys become None."""
+        return cls(*map(state.get, _VIEW_FIELDS))
+
+
+_VIEW_FIELDS = tuple(field.name for field in fields(ForensicView))
 
 
 class EvaluatorOutput(BaseModel):
     """Output model for the evaluator node."""
+    model_config = ConfigDict(frozen=True)
+    
     feedback: str = Field(description="Detailed feedback on Volatility 3 command validity and any issues found")
     success_criteria_met: bool = Field(description="True only if ALL Volatility 3 commands and plugins are valid and executable")
     user_input_needed: bool = Field(description="True if invalid commands require user clarification or plan regeneration")
@@ -45,6 +98,8 @@ class EvaluatorOutput(BaseModel):
 
 class SuspiciousFinding(BaseModel):
     """Individual suspicious finding with structured details."""
+    model_config = ConfigDict(frozen=True)
+    
     finding_type: str = Field(description="Type of finding (process, network, persistence, memory, etc.)")
     description: str = Field(description="Detailed description of the suspicious activity")
     severity: str = Field(description="Severity level: low, medium, high, critical")
@@ -54,6 +109,8 @@ class SuspiciousFinding(BaseModel):
 
 class AnalysisOutput(BaseModel):
     """Analysis results from the output analysis node."""
+    model_config = ConfigDict(frozen=True)
+    
     suspicious_findings: List[SuspiciousFinding] = Field(description="List of suspicious findings with details and severity")
     threat_score: float = Field(description="Overall threat score from 0.0 to 10.0")
     key_indicators: List[str] = Field(description="Key indicators of compromise or malicious activity")
@@ -5,9 +5,9 @@ This package contains all the individual workflow nodes that make up
 the forensics investigation pipeline.
 """
 
-from nodes.planner import planner_node, validate_investigation_plan, create_fallback_plan
-from nodes.evaluator import evaluator_node, route_based_on_evaluation
-from nodes.execution import execution_node, route_after_execution
+from nodes.planner import planner_node, validate_investigation_plan, create_fallback_plan, FALLBACK_PLAN_VERSION
+from nodes.evaluator import evaluator_node, evaluate_plans, route_based_on_evaluation
+from nodes.execution import execution_node, execute_phase_node, finish_execution_node, route_after_execution
 from nodes.os_detection import detect_os_node, fast_os_detection
 
 __all__ = [
@@ -19,12 +19,16 @@ __all__ = [
     'planner_node',
     'validate_investigation_plan', 
     'create_fallback_plan',
+    'FALLBACK_PLAN_VERSION',
     
     # Evaluator nodes
     'evaluator_node',
+    'evaluate_plans',
     'route_based_on_evaluation',
     
     # Execution nodes
     'execution_node',
+    'execute_phase_node',
+    'finish_execution_node',
     'route_after_execution'
 ]
@@ -5,14 +5,121 @@ This module contains the evaluation functionality that assesses
 the quality and completeness of investigation plans.
 """
 
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, List, Sequence
+import hashlib
+import json
 from langchain_core.messages import SystemMessage, HumanMessage
 
-from models.state import ForensicState, EvaluatorOutput
+from models.state import ForensicState, ForensicView, EvaluatorOutput
 from utils.messages import build_evaluator_system_message, build_evaluator_user_message
 
+# Verdicts for plans already evaluated in this process. Replanning often
+# reproduces an identical plan, which then skips the LLM round trip.
+_EVAL_CACHE_SIZE = 128
+_eval_cache: "OrderedDict[str, EvaluatorOutput]" = OrderedDict()
 
-def evaluator_node(state: ForensicState, evaluator_llm_with_output) -> Dict[str, Any]:
+
+def _evaluator_identity(evaluator_llm_with_output) -> List[Any]:
+    """Model name and temperature of the chat model behind a structured-output runnable."""
+    model = evaluator_llm_with_output
+    # with_structured_output wraps the model as sequence -> binding -> chat model
+    for attr in ("first", "bound"):
+        model = getattr(model, attr, model)
+    model_name = getattr(model, "model_name", None) or getattr(model, "model", None)
+    if model_name is None:
+        # Unidentifiable evaluators never share verdicts with each other
+        return [f"{type(evaluator_llm_with_output).__qualname__}@{id(evaluator_llm_with_output):x}", None]
+    return [model_name, getattr(model, "temperature", None)]
+
+
+def _evaluation_key(
+    investigation_plan: Any,
+    validation_status: Any,
+    os_hint: Any,
+    user_prompt: Any,
+    evaluator_identity: Sequence[Any] = ()
+) -> str:
+    """Hash everything that goes into the evaluator prompt, with the plan canonicalized, plus the evaluator model."""
+    plan_text = json.dumps(investigation_plan, sort_keys=True, default=str)
+    payload = json.dumps([plan_text, validation_status, os_hint, user_prompt, list(evaluator_identity)], default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _evaluator_messages(investigation_plan: Any, validation_status: Any, os_hint: str, user_prompt: str) -> List[Any]:
+    """Build the system/user message pair that asks the evaluator to judge one plan."""
+    if isinstance(investigation_plan, dict):
+        goals = investigation_plan.get("goals", [])
+        phases = investigation_plan.get("os_workflows", {}).get("phases", [])
+        plan_summary = f"Plan has {len(goals)} goals and {len(phases)} investigation phases"
+    else:
+        plan_summary = "Investigation plan is in raw text format"
+    
+    system_message = build_evaluator_system_message(
+        validation_status, plan_summary, os_hint
+    )
+    user_message = build_evaluator_user_message(
+        str(investigation_plan), os_hint, user_prompt
+    )
+    
+    return [
+        SystemMessage(content=system_message),
+        HumanMessage(content=user_message)
+    ]
+
+
+async def evaluate_plans(
+    plans: Sequence[Any],
+    validation_status: Any,
+    os_hint: str,
+    user_prompt: str,
+    evaluator_llm_with_output,
+    max_concurrency: int = 4
+) -> List[EvaluatorOutput]:
+    """
+    Evaluate several candidate plans, sending every uncached one in a single ``abatch``.
+    
+    Args:
+        plans: Candidate investigation plans
+        validation_status: Schema validation status shared by the candidates
+        os_hint: Target operating system
+        user_prompt: User's investigation context
+        evaluator_llm_with_output: LLM instance with structured output for evaluation
+        max_concurrency: Maximum evaluator requests in flight at once
+        
+    Returns:
+        One EvaluatorOutput per plan, in the order given
+    """
+    identity = _evaluator_identity(evaluator_llm_with_output)
+    keys = [_evaluation_key(plan, validation_status, os_hint, user_prompt, identity) for plan in plans]
+    results: List[EvaluatorOutput | None] = [_eval_cache.get(key) for key in keys]
+    
+    # Identical candidates share one request
+    pending: Dict[str, Any] = {}
+    for key, plan, result in zip(keys, plans, results):
+        if result is None:
+            pending.setdefault(key, plan)
+        else:
+            _eval_cache.move_to_end(key)
+    if len(pending) < len(plans):
+        print(f"♻️  Reusing evaluation of {len(plans) - len(pending)} identical plan(s)")
+    
+    if pending:
+        verdicts = await evaluator_llm_with_output.abatch(
+            [_evaluator_messages(plan, validation_status, os_hint, user_prompt) for plan in pending.values()],
+            config={"max_concurrency": max_concurrency}
+        )
+        for key, verdict in zip(pending, verdicts):
+            _eval_cache[key] = verdict
+            if len(_eval_cache) > _EVAL_CACHE_SIZE:
+                _eval_cache.popitem(last=False)
+        fresh = dict(zip(pending, verdicts))
+        results = [result if result is not None else fresh[key] for key, result in zip(keys, results)]
+    
+    return results
+
+
+async def evaluator_node(state: ForensicState, evaluator_llm_with_output) -> Dict[str, Any]:
     """
     Evaluator node that assesses the quality and completeness of the investigation plan.
     
@@ -27,9 +134,11 @@ def evaluator_node(state: ForensicState, evaluator_llm_with_output) -> Dict[str,
         print("🔧 Validating Volatility 3 commands and plugins...")
         
         # Get the investigation plan and validation status
-        investigation_plan = state.get("investigation_plan")
-        validation_status = state.get("validation_status")
-        user_prompt = state.get("user_prompt", "")
+        view = ForensicView.from_state(state)
+        investigation_plan = view.investigation_plan
+        validation_status = view.validation_status
+        user_prompt = view.user_prompt or ""
+        os_hint = view.os_hint or 'Unknown'
         
         if not investigation_plan:
             return {
@@ -38,28 +147,9 @@ def evaluator_node(state: ForensicState, evaluator_llm_with_output) -> Dict[str,
                 "user_input_needed": True
             }
         
-        # Build evaluation context
-        plan_summary = ""
-        if isinstance(investigation_plan, dict):
-            goals = investigation_plan.get("goals", [])
-            phases = investigation_plan.get("os_workflows", {}).get("phases", [])
-            plan_summary = f"Plan has {len(goals)} goals and {len(phases)} investigation phases"
-        else:
-            plan_summary = "Investigation plan is in raw text format"
-        
-        system_message = build_evaluator_system_message(
-            validation_status, plan_summary, state.get('os_hint', 'Unknown')
+        eval_result, = await evaluate_plans(
+            [investigation_plan], validation_status, os_hint, user_prompt, evaluator_llm_with_output
         )
-        user_message = build_evaluator_user_message(
-            str(investigation_plan), state.get('os_hint', 'Unknown'), user_prompt
-        )
-        
-        evaluator_messages = [
-            SystemMessage(content=system_message),
-            HumanMessage(content=user_message)
-        ]
-
-        eval_result: EvaluatorOutput = evaluator_llm_with_output.invoke(evaluator_messages)
         
         print(f"✓ Command validation completed")
         print(f"  - All commands valid: {eval_result.success_criteria_met}")
@@ -80,6 +170,21 @@ def evaluator_node(state: ForensicState, evaluator_llm_with_output) -> Dict[str,
         }
 
 
+# (plan validation failed, evaluator verdict, retries exhausted) -> (route, message).
+# The verdict is None when validation failed (it is not consulted) or when the
+# evaluator produced no boolean verdict; unlisted keys end the workflow.
+_RETRY_MESSAGE = "🔄 Retrying plan generation (attempt {attempt}/{max_retries})"
+_ROUTE_TABLE = {
+    (True, None, False): ("planner", _RETRY_MESSAGE),
+    (True, None, True): ("END", "⚠️ Max retries ({max_retries}) reached. Ending with partial plan."),
+    (False, True, False): ("execution", "✅ Success criteria met - proceeding to execution"),
+    (False, True, True): ("execution", "✅ Success criteria met - proceeding to execution"),
+    (False, False, False): ("planner", _RETRY_MESSAGE),
+    (False, False, True): ("END", "⚠️ Max retries ({max_retries}) reached. Commands may need manual review."),
+}
+_UNDEFINED_ROUTE = ("END", "⚠️ Undefined evaluation result - ending workflow")
+
+
 def route_based_on_evaluation(state: ForensicState, max_retries: int = 3) -> str:
     """
     Routing function with retry limits and error handling.
@@ -94,29 +199,11 @@ def route_based_on_evaluation(state: ForensicState, max_retries: int = 3) -> str
     # Track retry attempts
     retry_count = state.get("retry_count", 0)
     
-    # Check for validation failures first
-    validation_status = state.get("validation_status")
-    if validation_status == "failed":
-        if retry_count >= max_retries:
-            print(f"⚠️ Max retries ({max_retries}) reached. Ending with partial plan.")
-            return "END"
-        
-        print(f"🔄 Retrying plan generation (attempt {retry_count + 1}/{max_retries})")
-        return "planner"
-    
-    # Check evaluation results
+    # Validation failures take precedence over the evaluator's verdict
+    validation_failed = state.get("validation_status") == "failed"
     success_criteria_met = state.get("success_criteria_met")
+    verdict = None if validation_failed or not isinstance(success_criteria_met, bool) else success_criteria_met
     
-    if success_criteria_met is True:
-        print("✅ Success criteria met - proceeding to execution")
-        return "execution"
-    elif success_criteria_met is False:
-        if retry_count >= max_retries:
-            print(f"⚠️ Max retries ({max_retries}) reached. Commands may need manual review.")
-            return "END"
-        print(f"🔄 Retrying plan generation (attempt {retry_count + 1}/{max_retries})")
-        return "planner"
-    else:
-        # success_criteria_met is None or undefined
-        print("⚠️ Undefined evaluation result - ending workflow")
-        return "END"
+    route, message = _ROUTE_TABLE.get((validation_failed, verdict, retry_count >= max_retries), _UNDEFINED_ROUTE)
+    print(message.format(attempt=retry_count + 1, max_retries=max_retries))
+    return route
@@ -5,66 +5,120 @@ This module contains the execution functionality that runs
 validated investigation plans using the VolatilityExecutor.
 """
 
+from collections import OrderedDict
 from typing import Dict, Any
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import os
+import threading
 
-from models.state import ForensicState
+from langgraph.types import Command, Send
+
+from models.state import ForensicState, ForensicView
 from config import ForensicsConfig
 
-def execution_node(state: ForensicState) -> Dict[str, Any]:
+# Executors of recent runs, keyed by evidence directory, so concurrent phase
+# tasks share one executor (and its in-flight deduplication). This is only a
+# cache: everything needed to rebuild an executor travels in graph state, so a
+# checkpointed run resumed in another process recreates it. Bounded so runs
+# that never reach finish_execution do not pin their executors forever.
+_MAX_CACHED_EXECUTORS = 8
+_executors: "OrderedDict[str, Any]" = OrderedDict()
+_executors_lock = threading.Lock()
+
+
+def _executor_for(evidence_dir: str, executed_commands: Dict[str, Any]):
     """
-    Execute the validated investigation plan using the enhanced VolatilityExecutor.
+    Return the run's shared executor, rebuilding it from state when it is not cached.
+    
+    Args:
+        evidence_dir: The run's evidence directory
+        executed_commands: Deduplication records persisted in graph state
+    """
+    from volatility_executor import VolatilityExecutor
+    
+    with _executors_lock:
+        executor = _executors.get(evidence_dir)
+        if executor is not None:
+            _executors.move_to_end(evidence_dir)
+            return executor
+        
+        config = ForensicsConfig.from_env()
+        executor = VolatilityExecutor(base_output_dir=evidence_dir, shell_path=config.shell_path)
+        executor.executed_commands = dict(executed_commands or {})
+        _executors[evidence_dir] = executor
+        if len(_executors) > _MAX_CACHED_EXECUTORS:
+            _executors.popitem(last=False)
+        return executor
+
+
+def _failed(update: Dict[str, Any]) -> Command:
+    """Skip the phase fan-out and let finish_execution route the failure."""
+    return Command(update=update, goto="finish_execution")
+
+
+def execution_node(state: ForensicState) -> Command:
+    """
+    Run global triage, then fan the plan's investigation phases out to ``execute_phase``.
+    
+    Each phase becomes its own graph task, so independent phases run in
+    parallel; ``finish_execution`` collates them once they have all finished.
     
     Args:
         state: Current forensic state containing the validated investigation plan
         
     Returns:
-        Dictionary containing execution results, status, and evidence directory
+        Command with the triage results that sends each phase to ``execute_phase``
     """
     try:
         print("🚀 Starting Investigation Plan Execution")
         
+        # Read everything this node needs from state once
+        view = ForensicView.from_state(state)
+        plan, memory_dump_path, os_hint, user_prompt, validation_status = (
+            view.investigation_plan, view.memory_dump_path, view.os_hint, view.user_prompt, view.validation_status
+        )
+        
         # Get validated plan
-        plan = state.get("investigation_plan")
         if not plan:
-            return {
+            return _failed({
                 "execution_status": "failed",
                 "execution_error": "No investigation plan found in state",
                 "execution_results": None
-            }
+            })
         
         # Check if plan passed validation
-        validation_status = state.get("validation_status")
         if validation_status != "passed":
-            return {
+            return _failed({
                 "execution_status": "skipped", 
                 "execution_error": f"Plan validation failed: {validation_status}",
                 "execution_results": None
-            }
+            })
         
         # Import and initialize executor
-        from volatility_executor import VolatilityExecutor, ExecutionStatus
+        from volatility_executor import VolatilityExecutor, ExecutionStatus, canonical_command
         
         # Create evidence directory based on case info
-        memory_dump_path = state.get("memory_dump_path", "unknown_case")
+        memory_dump_path = memory_dump_path or "unknown_case"
         case_id = memory_dump_path.split("/")[-1].replace(".raw", "").replace(".mem", "")
-        evidence_dir = f"{ForensicsConfig.evidence_base_dir}/{case_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        config = ForensicsConfig.from_env()
+        execution_start = datetime.now()
+        evidence_dir = f"{config.evidence_base_dir}/{case_id}_{execution_start.strftime('%Y%m%d_%H%M%S')}"
         
-        executor = VolatilityExecutor(base_output_dir=evidence_dir, shell_path=ForensicsConfig.from_env().shell_path)
+        executor = VolatilityExecutor(base_output_dir=evidence_dir, shell_path=config.shell_path)
         
         # Prepare execution context
         base_context = {
             "case_id": case_id,
             "memory_dump_path": memory_dump_path,
-            "os_hint": state.get("os_hint"),
-            "user_prompt": state.get("user_prompt"),
+            "os_hint": os_hint,
+            "user_prompt": user_prompt,
             "analyst": "memory_forensics_agent",
             "investigation_goals": plan.get("goals", [])
         }
         
         execution_results = {
-            "execution_start": datetime.now().isoformat(),
+            "execution_start": execution_start.isoformat(),
             "case_id": case_id,
             "evidence_directory": evidence_dir,
             "global_triage": [],
@@ -74,7 +128,7 @@ def execution_node(state: ForensicState) -> Dict[str, Any]:
         }
         
         # Track executed commands to avoid duplicates
-        executed_commands = {}  # command -> {"output_file": path, "result": result_dict}
+        executed_commands = {}  # canonical_command(cmd) -> {"status": ..., "output_file": path}
         
         # Execute global triage first
         print("🎯 Executing Global Triage Phase")
@@ -83,102 +137,217 @@ def execution_node(state: ForensicState) -> Dict[str, Any]:
         global_triage_skipped = 0
         
         if "global_triage" in plan:
-            for triage_step in plan["global_triage"]:
-                step_name = triage_step.get("name", "Unknown Triage Step")
-                print(f"  📋 {step_name}")
-                
-                step_context = {**base_context, "phase": "global_triage", "step": step_name}
-                step_results = []
-                
-                for cmd in triage_step.get("commands", []):
-                    global_triage_total += 1
-                    
-                    # Check if command already executed
-                    if cmd in executed_commands:
-                        print(f"    ⏭️  Skipping duplicate: {cmd.split()[-1]}")
-                        # Reuse previous result
-                        prev_result = executed_commands[cmd]
-                        step_results.append({
-                            "command": cmd,
-                            "status": prev_result["status"],
-                            "execution_time": 0.0,  # No execution time for duplicates
-                            "output_file": prev_result["output_file"],
-                            "error_message": None,
-                            "note": "Reused from previous execution"
-                        })
-                        global_triage_skipped += 1
-                        if prev_result["status"] == "success":
-                            global_triage_success += 1
-                        continue
-                    
-                    result = executor.execute_volatility_command(
-                        command=cmd,
-                        context=step_context,
-                        save_output=True,
-                        category="triage"
-                    )
+            def run_triage_command(cmd, step_context):
+                return executor.execute_volatility_command(
+                    command=cmd,
+                    context=step_context,
+                    save_output=True,
+                    category="triage"
+                )
+            
+            # Triage commands only read the dump, so each step's new commands
+            # run concurrently; results are still recorded in plan order
+            with ThreadPoolExecutor(max_workers=max(1, config.triage_parallelism)) as pool:
+                for triage_step in plan["global_triage"]:
+                    step_name = triage_step.get("name", "Unknown Triage Step")
+                    print(f"  📋 {step_name}")
                     
-                    if result.status == ExecutionStatus.SUCCESS:
-                        global_triage_success += 1
+                    step_context = {**base_context, "phase": "global_triage", "step": step_name}
+                    step_results = []
                     
-                    result_dict = {
-                        "command": cmd,
-                        "status": result.status.value,
-                        "execution_time": result.execution_time,
-                        "output_file": result.output_file,
-                        "error_message": result.error_message
-                    }
+                    commands = triage_step.get("commands", [])
+                    # Commands differing only in whitespace or quoting share one run
+                    keys = {cmd: canonical_command(cmd) for cmd in commands}
+                    new_commands = {}
+                    for cmd, key in keys.items():
+                        if key not in executed_commands:
+                            new_commands.setdefault(key, cmd)
+                    futures = {key: pool.submit(run_triage_command, cmd, step_context) for key, cmd in new_commands.items()}
                     
-                    step_results.append(result_dict)
+                    for cmd in commands:
+                        global_triage_total += 1
+                        key = keys[cmd]
+                        
+                        # Check if command already executed
+                        if key in executed_commands:
+                            print(f"    ⏭️  Skipping duplicate: {cmd.split()[-1]}")
+                            # Reuse previous result
+                            prev_result = executed_commands[key]
+                            step_results.append({
+                                "command": cmd,
+                                "status": prev_result["status"],
+                                "execution_time": 0.0,  # No execution time for duplicates
+                                "output_file": prev_result["output_file"],
+                                "error_message": None,
+                                "note": "Reused from previous execution"
+                            })
+                            global_triage_skipped += 1
+                            if prev_result["status"] == "success":
+                                global_triage_success += 1
+                            continue
+                        
+                        result = futures[key].result()
+                        
+                        if result.status == ExecutionStatus.SUCCESS:
+                            global_triage_success += 1
+                        
+                        result_dict = {
+                            "command": cmd,
+                            "status": result.status.value,
+                            "execution_time": result.execution_time,
+                            "output_file": result.output_file,
+                            "duplicate_of": result.duplicate_of,
+                            "error_message": result.error_message
+                        }
+                        
+                        step_results.append(result_dict)
+                        
+                        # Track this command for deduplication
+                        executed_commands[key] = {
+                            "status": result.status.value,
+                            "output_file": result.output_file
+                        }
                     
-                    # Track this command for deduplication
-                    executed_commands[cmd] = {
-                        "status": result.status.value,
-                        "output_file": result.output_file
-                    }
-                
-                execution_results["global_triage"].append({
-                    "step_name": step_name,
-                    "parse_expectations": triage_step.get("parse_expectations"),
-                    "results": step_results
-                })
-        
-        # Pass executed_commands to executor for phase deduplication
+                    execution_results["global_triage"].append({
+                        "step_name": step_name,
+                        "parse_expectations": triage_step.get("parse_expectations"),
+                        "results": step_results
+                    })
+        
+        # Pass executed_commands to executor for phase deduplication, and keep
+        # them in state so phase tasks can rebuild the executor after a resume
         executor.executed_commands = executed_commands
+        execution_results["deduplicated_commands"] = dict(executed_commands)
+        with _executors_lock:
+            _executors[evidence_dir] = executor
+            if len(_executors) > _MAX_CACHED_EXECUTORS:
+                _executors.popitem(last=False)
         
-        # Execute main investigation phases
-        print("\n🔍 Executing Investigation Phases")
-        if "os_workflows" in plan and "phases" in plan["os_workflows"]:
-            for phase in plan["os_workflows"]["phases"]:
-                print(f"\n📂 Starting Phase: {phase.get('name', 'Unknown Phase')}")
-                
-                phase_result = executor.execute_investigation_phase(
-                    phase=phase,
-                    base_context=base_context
-                )
-                
-                execution_results["phases"].append(phase_result)
+        execution_results["triage_counts"] = {
+            "total": global_triage_total,
+            "successful": global_triage_success,
+            "skipped": global_triage_skipped
+        }
+        update = {
+            "execution_results": execution_results,
+            "evidence_directory": evidence_dir
+        }
         
-        # Generate execution summary
-        execution_end = datetime.now()
-        execution_results["execution_end"] = execution_end.isoformat()
+        # Fan the investigation phases out; they share only the read-only dump
+        phases = plan.get("os_workflows", {}).get("phases", []) if "os_workflows" in plan else []
+        if phases:
+            print("\n🔍 Executing Investigation Phases")
+        phase_tasks = [
+            Send("execute_phase", {
+                "phase": phase,
+                "phase_index": index,
+                "evidence_directory": evidence_dir,
+                "base_context": base_context,
+                "executed_commands": execution_results["deduplicated_commands"]
+            })
+            for index, phase in enumerate(phases)
+        ]
+        return Command(update=update, goto=phase_tasks or "finish_execution")
         
-        # Calculate overall statistics
-        total_commands = global_triage_total + sum(
-            phase.get("summary", {}).get("total_commands", 0) 
-            for phase in execution_results["phases"]
-        )
+    except ImportError as e:
+        print(f"❌ Import Error: {e}")
+        return _failed({
+            "execution_status": "failed",
+            "execution_error": f"Failed to import VolatilityExecutor: {e}",
+            "execution_results": None
+        })
         
-        successful_commands = global_triage_success + sum(
-            phase.get("summary", {}).get("successful_commands", 0)
-            for phase in execution_results["phases"]
+    except Exception as e:
+        print(f"❌ Execution Error: {e}")
+        return _failed({
+            "execution_status": "failed", 
+            "execution_error": f"Execution failed: {str(e)}",
+            "execution_results": None
+        })
+
+
+def execute_phase_node(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute one investigation phase dispatched by ``execution_node``.
+    
+    Args:
+        task: Send payload with the phase, its position, and the run's evidence directory
+        
+    Returns:
+        State update appending this phase's result to ``phase_results``
+    """
+    phase = task["phase"]
+    
+    print(f"\n📂 Starting Phase: {phase.get('name', 'Unknown Phase')}")
+    try:
+        executor = _executor_for(task["evidence_directory"], task.get("executed_commands"))
+        phase_result = executor.execute_investigation_phase(
+            phase=phase,
+            base_context=task["base_context"]
         )
+    except Exception as e:
+        print(f"❌ Phase Error: {e}")
+        phase_result = {"phase_name": phase.get("name", "Unknown Phase"), "error": str(e), "steps": [], "summary": {}}
+    
+    return {"phase_results": [{**phase_result, "phase_index": task["phase_index"]}]}
+
+
+def finish_execution_node(state: ForensicState) -> Dict[str, Any]:
+    """
+    Collate the phase results, summarize the run, and set the execution status.
+    
+    Args:
+        state: Forensic state with the triage results and every phase's ``phase_results``
+        
+    Returns:
+        Dictionary containing execution results, status, and evidence directory
+    """
+    execution_results = state.get("execution_results")
+    evidence_dir = state.get("evidence_directory")
+    if execution_results is None or state.get("execution_status") in ("failed", "skipped"):
+        # execution_node already recorded why nothing ran
+        return {}
+    
+    try:
+        from volatility_executor import canonical_command
+        
+        executor = _executor_for(evidence_dir, execution_results.get("deduplicated_commands"))
+        with _executors_lock:
+            _executors.pop(evidence_dir, None)
         
-        total_hits = sum(
-            phase.get("summary", {}).get("total_hits", 0)
+        execution_results = {
+            **execution_results,
+            "phases": [
+                {key: value for key, value in result.items() if key != "phase_index"}
+                for result in sorted(state.get("phase_results") or [], key=lambda r: r["phase_index"])
+            ]
+        }
+        triage_counts = execution_results.pop("triage_counts")
+        global_triage_total = triage_counts["total"]
+        global_triage_success = triage_counts["successful"]
+        global_triage_skipped = triage_counts["skipped"]
+        # Count unique commands from state, so the total survives a resume
+        # into a fresh executor
+        executed_commands = set(execution_results.get("deduplicated_commands") or ())
+        executed_commands.update(
+            canonical_command(result["command"])
             for phase in execution_results["phases"]
+            for step in phase.get("steps", [])
+            for result in step.get("results", [])
         )
         
+        # Generate execution summary
+        execution_end = datetime.now()
+        execution_results["execution_end"] = execution_end.isoformat()
+        
+        # Calculate overall statistics in a single pass over the phases
+        total_commands, successful_commands, total_hits = global_triage_total, global_triage_success, 0
+        for phase in execution_results["phases"]:
+            phase_summary = phase.get("summary", {})
+            total_commands += phase_summary.get("total_commands", 0)
+            successful_commands += phase_summary.get("successful_commands", 0)
+            total_hits += phase_summary.get("total_hits", 0)
+        
         execution_results["summary"] = {
             "total_commands": total_commands,
             "successful_commands": successful_commands,
@@ -187,6 +356,7 @@ def execution_node(state: ForensicState) -> Dict[str, Any]:
             "evidence_directory": evidence_dir,
             "triage_success_rate": global_triage_success / global_triage_total if global_triage_total > 0 else 0,
             "deduplicated_commands": global_triage_skipped + executor.skipped_duplicates,
+            "content_dedup_hits": executor.content_dedup_hits,
             "unique_commands_executed": len(executed_commands)
         }
         
@@ -217,14 +387,6 @@ def execution_node(state: ForensicState) -> Dict[str, Any]:
             "investigation_stage": "execution_completed"
         }
         
-    except ImportError as e:
-        print(f"❌ Import Error: {e}")
-        return {
-            "execution_status": "failed",
-            "execution_error": f"Failed to import VolatilityExecutor: {e}",
-            "execution_results": None
-        }
-        
     except Exception as e:
         print(f"❌ Execution Error: {e}")
         return {
@@ -8,12 +8,39 @@ REFACTORED: Now uses the existing validate_memory_dump function from forensics_t
 to avoid code duplication.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import functools
+import hashlib
+import json
+import mmap
+import os
 import re
 from pathlib import Path
 
+from config import ForensicsConfig
 from models.state import ForensicState
 
+# Detected OS per dump fingerprint, shared across runs
+_OS_CACHE_PATH = Path.home() / ".achilles" / "os_cache.json"
+
+# "OS Type: <os_name>" line in validate_memory_dump output
+_OS_TYPE_RE = re.compile(r'OS Type:\s*(\w+)', re.IGNORECASE)
+# Fallback keywords, checked in order: (keyword, os name)
+_OS_KEYWORDS = (("windows", "windows"), ("linux", "linux"), ("mac", "macos"))
+
+# Container headers that identify the OS from the first bytes of the file
+_OS_FILE_MAGIC = (
+    (b"EMiL", "linux"),       # LiME
+    (b"PAGEDUMP", "windows"),  # 32-bit crash dump
+    (b"PAGEDU64", "windows"),  # 64-bit crash dump
+    (b"hibr", "windows"),      # Hibernation file
+    (b"HIBR", "windows")
+)
+# Kernel banners searched for in raw dumps; the earliest match wins
+_OS_BANNER_RE = re.compile(rb"(Linux version \d)|(Darwin Kernel Version)|(Microsoft ?\(R\) Windows)")
+_OS_BANNER_NAMES = ("linux", "macos", "windows")
+_SNIFF_LIMIT = 256 * 1024 * 1024
+
 
 def detect_os_node(state: ForensicState) -> Dict[str, Any]:
     """
@@ -53,14 +80,9 @@ def detect_os_node(state: ForensicState) -> Dict[str, Any]:
         
         print(f"🔍 Detecting OS type for: {dump_path}")
         
-        # Use the existing validate_memory_dump function
-        # Import here to avoid circular dependencies
-        from forensics_tools import validate_memory_dump
-        
-        validation_result = validate_memory_dump(dump_path)
-        
-        # Parse the result to extract OS
-        os_detected = extract_os_from_validation(validation_result)
+        # Container header first, then the Volatility probes, with a kernel
+        # banner as the last resort
+        os_detected = fast_os_detection(dump_path)
         
         # Return detected OS or unknown
         if os_detected and os_detected != "unknown":
@@ -89,7 +111,7 @@ def extract_os_from_validation(validation_result: str) -> str:
         return "unknown"
     
     # Look for "OS Type: <os_name>" pattern
-    os_match = re.search(r'OS Type:\s*(\w+)', validation_result, re.IGNORECASE)
+    os_match = _OS_TYPE_RE.search(validation_result)
     if os_match:
         os_name = os_match.group(1).lower()
         # Normalize "mac" to "macos"
@@ -97,24 +119,122 @@ def extract_os_from_validation(validation_result: str) -> str:
             os_name = "macos"
         return os_name
     
-    # Fallback: Check for OS keywords in the result
+    # Fallback: Check for OS keywords in the result, in priority order
     result_lower = validation_result.lower()
-    if "windows" in result_lower:
-        return "windows"
-    elif "linux" in result_lower:
-        return "linux"
-    elif "mac" in result_lower or "macos" in result_lower:
-        return "macos"
+    for keyword, os_name in _OS_KEYWORDS:
+        if keyword in result_lower:
+            return os_name
     
     return "unknown"
 
 
+def _sniff_os_header(dump_path: str) -> str:
+    """
+    Identify a dump's OS from its container header, without Volatility.
+    
+    Args:
+        dump_path: Path to memory dump
+        
+    Returns:
+        OS name ("windows", "linux") or "unknown"
+    """
+    try:
+        with open(dump_path, "rb") as f:
+            header = f.read(max(len(magic) for magic, _ in _OS_FILE_MAGIC))
+    except OSError:
+        return "unknown"
+    for magic, os_name in _OS_FILE_MAGIC:
+        if header.startswith(magic):
+            return os_name
+    return "unknown"
+
+
+def _sniff_os_banner(dump_path: str) -> str:
+    """
+    Guess a dump's OS from the first kernel banner in it, without Volatility.
+    
+    Only a guess: the banner may be a stray string (page cache, WSL, a
+    browser buffer) in a dump of another OS.
+    
+    Args:
+        dump_path: Path to memory dump
+        
+    Returns:
+        OS name ("windows", "linux", "macos") or "unknown"
+    """
+    try:
+        with open(dump_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _OS_BANNER_RE.search(mm, 0, _SNIFF_LIMIT)
+    except (OSError, ValueError):  # ValueError: empty file cannot be mapped
+        return "unknown"
+    if match is None:
+        return "unknown"
+    return _OS_BANNER_NAMES[match.lastindex - 1]
+
+
+def _sniff_os_magic(dump_path: str) -> str:
+    """
+    Guess a dump's OS from its container header or a kernel banner, without Volatility.
+    
+    Args:
+        dump_path: Path to memory dump
+        
+    Returns:
+        OS name ("windows", "linux", "macos") or "unknown"
+    """
+    os_name = _sniff_os_header(dump_path)
+    return os_name if os_name != "unknown" else _sniff_os_banner(dump_path)
+
+
+def _dump_cache_key(dump_path: str) -> Optional[str]:
+    """Fingerprint a dump by path, size, mtime and its first 4 KB; None if unreadable."""
+    try:
+        real_path = os.path.realpath(dump_path)
+        st = os.stat(real_path)
+        with open(real_path, "rb") as f:
+            header = f.read(4096)
+    except OSError:
+        return None
+    digest = hashlib.sha256(f"{real_path}:{st.st_size}:{st.st_mtime_ns}".encode())
+    digest.update(header)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_os_cache() -> Dict[str, str]:
+    """Read the on-disk OS cache once per process; a missing or corrupt file is empty."""
+    try:
+        with open(_OS_CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _store_os_cache(key: str, os_name: str) -> None:
+    """Record a detected OS and rewrite the cache file atomically; failures are ignored."""
+    cache = _load_os_cache()
+    cache[key] = os_name
+    try:
+        _OS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _OS_CACHE_PATH.with_name(f"{_OS_CACHE_PATH.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, _OS_CACHE_PATH)
+    except OSError:
+        pass
+
+
 def fast_os_detection(dump_path: str) -> str:
     """
     Quick OS detection helper function.
     
-    This is a convenience function that wraps validate_memory_dump
-    for quick standalone OS detection.
+    A container header identifies the OS outright. Otherwise
+    validate_memory_dump runs the Volatility probes; a kernel banner found in
+    the dump is only used when they cannot decide. detect_os_node uses this
+    too, so both paths share one detection implementation. Header and probe
+    results are cached on disk per dump fingerprint unless
+    ``disable_os_cache`` is set; banner guesses are never cached.
     
     Args:
         dump_path: Path to memory dump
@@ -125,9 +245,29 @@ def fast_os_detection(dump_path: str) -> str:
     if not dump_path or not Path(dump_path).exists():
         return "unknown"
     
-    try:
-        from forensics_tools import validate_memory_dump
-        result = validate_memory_dump(dump_path)
-        return extract_os_from_validation(result)
-    except Exception:
-        return "unknown"
+    # A dump's OS never changes, so reuse the result of an earlier run
+    use_cache = not ForensicsConfig.from_env().disable_os_cache
+    cache_key = _dump_cache_key(dump_path) if use_cache else None
+    if cache_key is not None:
+        cached = _load_os_cache().get(cache_key)
+        if cached:
+            return cached
+    
+    # Reading the header directly is far cheaper than starting Volatility;
+    # the probes only run when it identifies nothing
+    os_detected = _sniff_os_header(dump_path)
+    if os_detected == "unknown":
+        try:
+            from forensics_tools import validate_memory_dump
+            result = validate_memory_dump(dump_path)
+            os_detected = extract_os_from_validation(result)
+        except Exception:
+            os_detected = "unknown"
+    
+    if os_detected == "unknown":
+        # A lone banner string may not belong to the dump's own kernel, so the
+        # guess is used for this run only and not persisted
+        return _sniff_os_banner(dump_path)
+    if cache_key is not None:
+        _store_os_cache(cache_key, os_detected)
+    return os_detected
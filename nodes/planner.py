@@ -9,15 +9,18 @@ from typing import Dict, Any
 import json
 import re
 from langchain_core.messages import SystemMessage, HumanMessage
-from jsonschema import validate as jsonschema_validate, ValidationError
+from jsonschema import ValidationError
 
 from models.state import ForensicState
-from models.schemas import VOL3_PLAN_SCHEMA
+from models.schemas import VOL3_PLAN_SCHEMA, validate_vol3_plan
 from utils.messages import build_planner_system_message, build_planner_user_message
 from utils.validation import validate_plan_quality
 
+# plan_version of the minimal plan returned when the planner LLM fails
+FALLBACK_PLAN_VERSION = "1.0.0-fallback"
 
-def planner_node(state: ForensicState, llm_with_tools) -> Dict[str, Any]:
+
+async def planner_node(state: ForensicState, llm_with_tools) -> Dict[str, Any]:
     """
     Intelligent investigation planning node. Produces a validated plan dict.
     
@@ -49,7 +52,7 @@ def planner_node(state: ForensicState, llm_with_tools) -> Dict[str, Any]:
         print(f"User prompt length: {len(user_text)} chars")
 
         # Call the planner LLM with timeout handling
-        resp = llm_with_tools.invoke(messages)
+        resp = await llm_with_tools.ainvoke(messages)
         plan_text = resp.content if hasattr(resp, "content") else str(resp)
 
         print(f"Received response from LLM...")
@@ -103,7 +106,7 @@ def validate_investigation_plan(state: ForensicState) -> Dict[str, Any]:
             data = json.loads(cleaned)
         
         # Validate against schema first
-        jsonschema_validate(instance=data, schema=VOL3_PLAN_SCHEMA)
+        validate_vol3_plan(data)
         
         # Perform comprehensive quality validation (skip command validation for flexibility)
         try:
@@ -137,7 +140,7 @@ def create_fallback_plan(dump_path: str, os_hint: str | None) -> Dict[str, Any]:
         Fallback investigation plan
     """
     return {
-        "plan_version": "1.0.0-fallback",
+        "plan_version": FALLBACK_PLAN_VERSION,
         "inputs": {"dump_path": dump_path, "os_hint": os_hint},
         "goals": [
             "Identify malicious processes",
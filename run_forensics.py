@@ -17,7 +17,9 @@ sys.path.insert(0, str(current_dir))
 if __name__ == "__main__":
     try:
         import asyncio
+        from config import configure_logging
         from forensics_agent import main
+        configure_logging()
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
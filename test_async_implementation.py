@@ -31,6 +31,7 @@ def test_configuration():
     # Test from_env
     import os
     os.environ['FORENSICS_CHUNK_CONCURRENCY'] = '4'
+    ForensicsConfig.from_env.cache_clear()
     env_config = ForensicsConfig.from_env()
     assert env_config.chunk_concurrency == 4, f"Env concurrency should be 4, got {env_config.chunk_concurrency}"
     print(f"   ✅ Environment concurrency: {env_config.chunk_concurrency}")
@@ -88,9 +89,9 @@ def test_async_methods_exist():
     agent = MemoryForensicsAgent()
     
     # Check for async methods
-    assert hasattr(agent, '_analyze_chunks_parallel'), "Missing _analyze_chunks_parallel method"
-    assert asyncio.iscoroutinefunction(agent._analyze_chunks_parallel), "_analyze_chunks_parallel should be async"
-    print("   ✅ _analyze_chunks_parallel is async")
+    assert hasattr(agent, '_analyze_chunk_task'), "Missing _analyze_chunk_task method"
+    assert asyncio.iscoroutinefunction(agent._analyze_chunk_task), "_analyze_chunk_task should be async"
+    print("   ✅ _analyze_chunk_task is async")
     
     assert hasattr(agent, '_analyze_single_chunk_async'), "Missing _analyze_single_chunk_async method"
     assert asyncio.iscoroutinefunction(agent._analyze_single_chunk_async), "_analyze_single_chunk_async should be async"
@@ -108,8 +109,9 @@ async def test_semaphore_creation():
     config = ForensicsConfig(chunk_concurrency=2)
     agent = MemoryForensicsAgent(config=config)
     
-    # Create a semaphore like in the code
-    semaphore = asyncio.Semaphore(agent.config.chunk_concurrency)
+    # The agent's chunk limit is sized from the config
+    semaphore = agent._chunk_limit()
+    assert semaphore is agent._chunk_limit(), "Chunk semaphore should be reused on the same loop"
     
     # Test acquiring and releasing
     async with semaphore:
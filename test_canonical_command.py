@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the command canonicalization used to deduplicate Volatility runs.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from volatility_executor import canonical_command
+
+
+@pytest.fixture
+def dump(tmp_path):
+    """A dump file plus a symlink to it, both addressed relative to tmp_path."""
+    real = tmp_path / "memory.raw"
+    real.write_bytes(b"\0" * 16)
+    (tmp_path / "link.raw").symlink_to(real)
+    return real
+
+
+def test_dump_path_is_resolved(dump, monkeypatch):
+    monkeypatch.chdir(dump.parent)
+    expected = canonical_command(f"vol -f {dump} windows.pslist")
+
+    assert canonical_command("vol -f memory.raw windows.pslist") == expected
+    assert canonical_command("vol -f ./sub/../memory.raw windows.pslist") == expected
+    assert canonical_command("vol -f link.raw windows.pslist") == expected
+    assert canonical_command("vol --file link.raw windows.pslist") == f"vol --file {dump} windows.pslist"
+
+
+@pytest.mark.parametrize("command", [
+    "vol -q -f {dump} windows.pslist",
+    "vol -f {dump} -q windows.pslist",
+    "vol --quiet -f {dump} windows.pslist",
+    "vol  -f   {dump}   windows.pslist",
+    "vol -f '{dump}' windows.pslist",
+])
+def test_quiet_flags_and_spacing_do_not_matter(dump, command):
+    assert canonical_command(command.format(dump=dump)) == f"vol -f {dump} windows.pslist"
+
+
+def test_plugin_arguments_are_kept(dump):
+    base = canonical_command(f"vol -f {dump} windows.pslist")
+
+    assert canonical_command(f"vol -f {dump} windows.pslist --pid 4") != base
+    assert canonical_command(f"vol -f {dump} windows.psscan") != base
+    assert canonical_command(f"vol -f {dump} windows.pslist") != canonical_command(f"vol3 -f {dump} windows.pslist")
+
+
+def test_relative_paths_follow_the_working_directory(dump, tmp_path, monkeypatch):
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "memory.raw").write_bytes(b"\0")
+
+    monkeypatch.chdir(dump.parent)
+    first = canonical_command("vol -f memory.raw windows.pslist")
+    monkeypatch.chdir(other)
+    second = canonical_command("vol -f memory.raw windows.pslist")
+
+    assert first == f"vol -f {dump} windows.pslist"
+    assert second == f"vol -f {other / 'memory.raw'} windows.pslist"
+
+
+def test_non_volatility_commands_are_only_requoted():
+    assert canonical_command("strings  -n 8 'a b.raw'") == "strings -n 8 'a b.raw'"
+    assert canonical_command("grep -q x y") == "grep -q x y"
+
+
+def test_unbalanced_quotes_fall_back_to_raw_text():
+    assert canonical_command("vol -f 'memory.raw windows.pslist") == "vol -f 'memory.raw windows.pslist"
+
+
+def test_trailing_file_flag_is_kept():
+    assert canonical_command("vol windows.pslist -f") == "vol windows.pslist -f"
+    assert os.path.isabs(canonical_command("vol -f x windows.info").split()[2])
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-mapped chunk results log index used to resume triage.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from forensics_agent import LazyChunkResults, _index_chunk_results_log
+
+
+def record(chunk_id, threat_score):
+    """One results log line as written by _save_chunk_result."""
+    return json.dumps({"chunk_id": chunk_id, "result": {"chunk_id": chunk_id, "threat_score": threat_score}}) + "\n"
+
+
+def load(results_file):
+    return LazyChunkResults(_index_chunk_results_log(str(results_file)))
+
+
+def test_missing_and_empty_logs_index_nothing(tmp_path):
+    assert _index_chunk_results_log(str(tmp_path / "missing.jsonl")) == {}
+    empty = tmp_path / "empty.jsonl"
+    empty.write_bytes(b"")
+    assert _index_chunk_results_log(str(empty)) == {}
+
+
+def test_records_are_located_and_parsed_on_lookup(tmp_path):
+    results_file = tmp_path / "chunk_results.jsonl"
+    results_file.write_text(record("chunk_001", 3.0) + record("chunk_002", 7.5))
+
+    results = load(results_file)
+
+    assert sorted(results) == ["chunk_001", "chunk_002"]
+    assert results["chunk_001"]["threat_score"] == 3.0
+    assert results["chunk_002"]["threat_score"] == 7.5
+
+
+def test_later_record_for_a_chunk_wins(tmp_path):
+    results_file = tmp_path / "chunk_results.jsonl"
+    results_file.write_text(record("chunk_001", 1.0) + record("chunk_002", 2.0) + record("chunk_001", 9.0))
+
+    results = load(results_file)
+
+    assert len(results) == 2
+    assert results["chunk_001"]["threat_score"] == 9.0
+
+
+@pytest.mark.parametrize("torn_tail", [
+    '{"chunk_id": "chunk_003", "result": {"threat',
+    '{"chunk_id": "chunk_0',
+    '{',
+])
+def test_unterminated_last_line_is_skipped(tmp_path, torn_tail):
+    results_file = tmp_path / "chunk_results.jsonl"
+    results_file.write_text(record("chunk_001", 1.0) + record("chunk_002", 2.0) + torn_tail)
+
+    results = load(results_file)
+
+    assert sorted(results) == ["chunk_001", "chunk_002"]
+    assert results["chunk_002"]["threat_score"] == 2.0
+
+
+def test_terminated_but_truncated_record_reads_as_missing(tmp_path):
+    results_file = tmp_path / "chunk_results.jsonl"
+    results_file.write_text(record("chunk_001", 1.0) + '{"chunk_id": "chunk_002", "result": {"thr\n')
+
+    results = load(results_file)
+
+    # Indexed from its id prefix, but unparsable once looked up
+    assert "chunk_002" in results
+    assert results.get("chunk_002") is None
+    assert results.get("chunk_001")["threat_score"] == 1.0
+
+
+def test_blank_and_foreign_lines_are_skipped(tmp_path):
+    results_file = tmp_path / "chunk_results.jsonl"
+    results_file.write_text("\n" + "not json\n" + record("chunk_001", 4.0) + "   \n")
+
+    results = load(results_file)
+
+    assert list(results) == ["chunk_001"]
+    assert results["chunk_001"]["threat_score"] == 4.0
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests that the evaluator's routing table matches the if/elif ladder it replaced.
+"""
+
+import itertools
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from nodes.evaluator import _ROUTE_TABLE, _UNDEFINED_ROUTE, route_based_on_evaluation
+
+MAX_RETRIES = 3
+
+
+def ladder_route(state, max_retries=MAX_RETRIES):
+    """The original route_based_on_evaluation, kept as the reference behaviour."""
+    retry_count = state.get("retry_count", 0)
+
+    validation_status = state.get("validation_status")
+    if validation_status == "failed":
+        if retry_count >= max_retries:
+            print(f"⚠️ Max retries ({max_retries}) reached. Ending with partial plan.")
+            return "END"
+
+        print(f"🔄 Retrying plan generation (attempt {retry_count + 1}/{max_retries})")
+        return "planner"
+
+    success_criteria_met = state.get("success_criteria_met")
+
+    if success_criteria_met is True:
+        print("✅ Success criteria met - proceeding to execution")
+        return "execution"
+    elif success_criteria_met is False:
+        if retry_count >= max_retries:
+            print(f"⚠️ Max retries ({max_retries}) reached. Commands may need manual review.")
+            return "END"
+        print(f"🔄 Retrying plan generation (attempt {retry_count + 1}/{max_retries})")
+        return "planner"
+    else:
+        print("⚠️ Undefined evaluation result - ending workflow")
+        return "END"
+
+
+# One state per table key, plus non-bool verdicts that must hit _UNDEFINED_ROUTE
+KEYED_STATES = {
+    (True, None, False): {"validation_status": "failed", "success_criteria_met": True, "retry_count": 0},
+    (True, None, True): {"validation_status": "failed", "success_criteria_met": None, "retry_count": 3},
+    (False, True, False): {"validation_status": "passed", "success_criteria_met": True, "retry_count": 1},
+    (False, True, True): {"validation_status": "passed", "success_criteria_met": True, "retry_count": 3},
+    (False, False, False): {"validation_status": "passed", "success_criteria_met": False, "retry_count": 2},
+    (False, False, True): {"success_criteria_met": False, "retry_count": 4},
+}
+UNDEFINED_STATES = [
+    {"validation_status": "passed"},
+    {"validation_status": "passed", "success_criteria_met": None},
+    {"success_criteria_met": 1},
+    {"success_criteria_met": 0, "retry_count": 5},
+    {"success_criteria_met": "true"},
+]
+
+
+def test_every_table_key_has_a_case():
+    assert set(KEYED_STATES) == set(_ROUTE_TABLE)
+
+
+@pytest.mark.parametrize("key", list(KEYED_STATES), ids=str)
+def test_table_key_matches_ladder(key, capsys):
+    state = KEYED_STATES[key]
+
+    expected_route = ladder_route(state)
+    expected_output = capsys.readouterr().out
+    route = route_based_on_evaluation(state, MAX_RETRIES)
+
+    assert route == expected_route == _ROUTE_TABLE[key][0]
+    assert capsys.readouterr().out == expected_output
+
+
+@pytest.mark.parametrize("state", UNDEFINED_STATES, ids=str)
+def test_non_bool_verdict_takes_undefined_route(state, capsys):
+    expected_route = ladder_route(state)
+    expected_output = capsys.readouterr().out
+    route = route_based_on_evaluation(state, MAX_RETRIES)
+
+    assert route == expected_route == _UNDEFINED_ROUTE[0]
+    assert capsys.readouterr().out == expected_output == _UNDEFINED_ROUTE[1] + "\n"
+
+
+@pytest.mark.parametrize("validation_status, verdict, retry_count", list(itertools.product(
+    ("failed", "passed", None),
+    (True, False, None, 1, "yes"),
+    (0, 2, 3, 7),
+)))
+def test_table_matches_ladder_exhaustively(validation_status, verdict, retry_count, capsys):
+    state = {"validation_status": validation_status, "success_criteria_met": verdict, "retry_count": retry_count}
+
+    expected_route = ladder_route(state)
+    expected_output = capsys.readouterr().out
+
+    assert route_based_on_evaluation(state, MAX_RETRIES) == expected_route
+    assert capsys.readouterr().out == expected_output
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for the header and kernel-banner OS sniffing that runs before the Volatility probes.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from nodes import os_detection
+from nodes.os_detection import _sniff_os_magic
+
+
+def write_dump(tmp_path, data):
+    dump = tmp_path / "memory.raw"
+    dump.write_bytes(data)
+    return str(dump)
+
+
+@pytest.mark.parametrize("header, expected", [
+    (b"EMiL\x01\x00\x00\x00", "linux"),
+    (b"PAGEDUMP", "windows"),
+    (b"PAGEDU64", "windows"),
+    (b"hibr", "windows"),
+    (b"HIBR", "windows"),
+])
+def test_container_header(tmp_path, header, expected):
+    assert _sniff_os_magic(write_dump(tmp_path, header + b"\0" * 4096)) == expected
+
+
+def test_header_wins_over_a_banner(tmp_path):
+    assert _sniff_os_magic(write_dump(tmp_path, b"EMiL" + b"\0" * 64 + b"Darwin Kernel Version 21.1.0")) == "linux"
+
+
+@pytest.mark.parametrize("banner, expected", [
+    (b"Linux version 5.15.0-91-generic (buildd@lcy02)", "linux"),
+    (b"Darwin Kernel Version 21.1.0: Wed Oct 13 17:33:23 PDT 2021", "macos"),
+    (b"Microsoft (R) Windows Debugger", "windows"),
+    (b"Microsoft(R) Windows (R) Win 7", "windows"),
+])
+def test_kernel_banner(tmp_path, banner, expected):
+    assert _sniff_os_magic(write_dump(tmp_path, b"\0" * 8192 + banner + b"\0" * 8192)) == expected
+
+
+def test_earliest_banner_wins(tmp_path):
+    data = b"\0" * 100 + b"Darwin Kernel Version 21.1.0" + b"\0" * 100 + b"Linux version 5.15.0"
+    assert _sniff_os_magic(write_dump(tmp_path, data)) == "macos"
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"\0" * 4096,
+    b"Linux version x",  # no version digit
+    b"PAGEDUM",  # header cut short
+])
+def test_unrecognized_dumps_are_unknown(tmp_path, data):
+    assert _sniff_os_magic(write_dump(tmp_path, data)) == "unknown"
+
+
+def test_missing_dump_is_unknown(tmp_path):
+    assert _sniff_os_magic(str(tmp_path / "missing.raw")) == "unknown"
+
+
+def test_banner_past_the_sniff_limit_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(os_detection, "_SNIFF_LIMIT", 4096)
+    dump = write_dump(tmp_path, b"\0" * 8192 + b"Linux version 5.15.0")
+
+    assert _sniff_os_magic(dump) == "unknown"
+
+
+@pytest.fixture
+def os_cache(tmp_path, monkeypatch):
+    """Point the on-disk OS cache at tmp_path and return a reader for it."""
+    monkeypatch.setattr(os_detection, "_OS_CACHE_PATH", tmp_path / "os_cache.json")
+    monkeypatch.delenv("FORENSICS_DISABLE_OS_CACHE", raising=False)
+    os_detection._load_os_cache.cache_clear()
+    yield lambda: dict(os_detection._load_os_cache())
+    os_detection._load_os_cache.cache_clear()
+
+
+def fake_probes(monkeypatch, result):
+    """Replace validate_memory_dump, recording the dumps it was asked about."""
+    calls = []
+
+    def validate_memory_dump(dump_path):
+        calls.append(dump_path)
+        return result
+
+    monkeypatch.setitem(sys.modules, "forensics_tools", types.SimpleNamespace(validate_memory_dump=validate_memory_dump))
+    return calls
+
+
+def test_header_result_is_cached_without_probing(tmp_path, os_cache, monkeypatch):
+    calls = fake_probes(monkeypatch, "OS Type: windows")
+    dump = write_dump(tmp_path, b"EMiL" + b"\0" * 64)
+
+    assert os_detection.fast_os_detection(dump) == "linux"
+    assert calls == []
+    assert list(os_cache().values()) == ["linux"]
+
+
+def test_probes_outrank_a_stray_banner(tmp_path, os_cache, monkeypatch):
+    fake_probes(monkeypatch, "Valid Windows memory dump detected!\nOS Type: windows")
+    dump = write_dump(tmp_path, b"\0" * 4096 + b"Linux version 5.15.0" + b"\0" * 4096)
+
+    assert os_detection.fast_os_detection(dump) == "windows"
+    assert list(os_cache().values()) == ["windows"]
+
+
+def test_banner_guess_is_used_but_not_cached(tmp_path, os_cache, monkeypatch):
+    fake_probes(monkeypatch, "Memory dump file located. OS type could not be determined automatically.")
+    dump = write_dump(tmp_path, b"\0" * 4096 + b"Darwin Kernel Version 21.1.0" + b"\0" * 4096)
+
+    assert os_detection.fast_os_detection(dump) == "macos"
+    assert os_cache() == {}
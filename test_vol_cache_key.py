@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk Volatility result cache key.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import forensics_tools
+from forensics_tools import _vol_cache_path, _vol_writes_files
+
+
+@pytest.fixture
+def dump(tmp_path, monkeypatch):
+    """A dump whose name contains "dump", with the cache directory under tmp_path."""
+    monkeypatch.setattr(forensics_tools, "_vol_cache_dir", tmp_path / "cache")
+    dump = tmp_path / "memdump.raw"
+    dump.write_bytes(b"\x01" * 4096)
+    (tmp_path / "link.raw").symlink_to(dump)
+    return dump
+
+
+def key(command):
+    return _vol_cache_path(command.split())
+
+
+def test_key_lives_in_the_cache_dir(dump, tmp_path):
+    path = key(f"vol -f {dump} windows.pslist")
+
+    assert path is not None
+    assert path.parent == tmp_path / "cache"
+    assert path.suffix == ".out"
+
+
+def test_dump_path_spelling_does_not_change_the_key(dump, monkeypatch):
+    expected = key(f"vol -f {dump} windows.pslist")
+    monkeypatch.chdir(dump.parent)
+
+    assert key("vol -f memdump.raw windows.pslist") == expected
+    assert key("vol -f ./link.raw windows.pslist") == expected
+    # vol and vol3 are the same tool
+    assert key(f"vol3 -f {dump} windows.pslist") == expected
+
+
+@pytest.mark.parametrize("other", [
+    "vol -f {dump} windows.psscan",
+    "vol -f {dump} windows.pslist --pid 4",
+])
+def test_different_queries_get_different_keys(dump, other):
+    assert key(other.format(dump=dump)) != key(f"vol -f {dump} windows.pslist")
+
+
+def test_changed_dump_gets_a_new_key(dump):
+    before = key(f"vol -f {dump} windows.pslist")
+    dump.write_bytes(b"\x02" * 8192)
+    os.utime(dump, ns=(0, 1_000_000_000))
+
+    assert key(f"vol -f {dump} windows.pslist") != before
+
+
+@pytest.mark.parametrize("command", [
+    "vol -f {dump} windows.memmap --dump --pid 4",
+    "vol -f {dump} windows.dumpfiles",
+    "vol -f {dump} linux.proc.Maps --dump",
+    "vol -o /tmp/out -f {dump} windows.pslist",
+    "vol --output-dir /tmp/out -f {dump} windows.pslist",
+    "vol --output-dir=/tmp/out -f {dump} windows.pslist",
+])
+def test_file_writing_commands_are_not_cached(dump, command):
+    argv = command.format(dump=dump).split()
+
+    assert _vol_writes_files(argv)
+    assert _vol_cache_path(argv) is None
+
+
+def test_dump_in_the_dump_path_does_not_disable_caching(dump):
+    argv = f"vol --file {dump} windows.pslist".split()
+
+    assert not _vol_writes_files(argv)
+    assert _vol_cache_path(argv) is not None
+
+
+@pytest.mark.parametrize("command", [
+    "vol windows.pslist",
+    "vol -f {missing} windows.pslist",
+])
+def test_uncacheable_without_a_readable_dump(dump, command):
+    assert key(command.format(missing=dump.parent / "missing.raw")) is None
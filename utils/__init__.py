@@ -5,7 +5,7 @@ This package contains utility functions for tokens, validation, messages,
 and other common operations used throughout the system.
 """
 
-from utils.tokens import count_tokens, split_text_by_tokens, estimate_response_tokens
+from utils.tokens import count_tokens, count_tokens_batch, split_text_by_tokens, estimate_response_tokens
 from utils.validation import validate_plan_quality, is_reasonable_command, VolatilityCommandValidator
 from utils.messages import (
     build_planner_system_message,
@@ -14,6 +14,7 @@ from utils.messages import (
     build_evaluator_user_message,
     build_analysis_system_message,
     build_analysis_user_message,
+    build_analysis_user_message_vars,
     build_deeper_analysis_system_message,
     build_deeper_analysis_user_message
 )
@@ -21,6 +22,7 @@ from utils.messages import (
 __all__ = [
     # Token utilities
     'count_tokens',
+    'count_tokens_batch',
     'split_text_by_tokens', 
     'estimate_response_tokens',
     
@@ -36,6 +38,7 @@ __all__ = [
     'build_evaluator_user_message',
     'build_analysis_system_message',
     'build_analysis_user_message',
+    'build_analysis_user_message_vars',
     'build_deeper_analysis_system_message',
     'build_deeper_analysis_user_message'
 ]
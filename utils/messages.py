@@ -5,7 +5,7 @@ This module contains functions for constructing LLM messages and prompts
 used throughout the investigation workflow.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Mapping, Optional, List
 import json
 
 
@@ -39,7 +39,7 @@ def build_planner_system_message(dump_path: str, os_hint: Optional[str]) -> str:
     return base
 
 
-def build_planner_user_message(schema: Dict[str, Any], os_hint: Optional[str], 
+def build_planner_user_message(schema: Mapping[str, Any], os_hint: Optional[str], 
                               user_prompt: Optional[str] = None, 
                               evaluation_feedback: Optional[str] = None,
                               dump_path: Optional[str] = None) -> str:
@@ -78,7 +78,8 @@ def build_planner_user_message(schema: Dict[str, Any], os_hint: Optional[str],
     if evaluation_feedback:
         guidance["evaluation_feedback"] = evaluation_feedback
     
-    return json.dumps(guidance, indent=2)
+    # default=dict serializes the read-only mappings of the frozen schema
+    return json.dumps(guidance, indent=2, default=dict)
 
 
 def build_evaluator_system_message(validation_status: str, plan_summary: str, os_hint: str) -> str:
@@ -220,14 +221,7 @@ REPORT:
 Mark success_criteria_met=True ONLY if ALL {len(commands)} commands are technically valid and executable."""
 
 
-def build_analysis_system_message() -> str:
-    """
-    Build system message for the analysis LLM.
-    
-    Returns:
-        System message string
-    """
-    return """You are an expert memory forensics analyst specializing in threat detection and incident response. 
+ANALYSIS_SYSTEM_MESSAGE = """You are an expert memory forensics analyst specializing in threat detection and incident response. 
 
 Your task is to analyze the results of a Volatility 3 memory forensics investigation and identify:
 
@@ -250,6 +244,77 @@ Your task is to analyze the results of a Volatility 3 memory forensics investiga
 - Memory artifacts (code injection, process hollowing, rootkits)
 - Timeline correlations (sequence of malicious activities)"""
 
+# Placeholders are filled from build_analysis_user_message_vars()
+ANALYSIS_USER_TEMPLATE = """Analyze the memory forensics investigation results below{chunk_context}:
+
+**INVESTIGATION CONTEXT:**
+- Memory Dump: {memory_dump_path}
+- Target OS: {os_hint}
+- Investigation Goals: {user_prompt}
+- Execution Status: {execution_status}
+- Success Rate: {success_rate}
+
+**EXECUTION SUMMARY:**
+- Total Commands: {total_commands}
+- Successful Commands: {successful_commands}
+- Suspicious Hits: {total_suspicious_hits}
+- Evidence Directory: {evidence_directory}
+
+**ANALYSIS CONTEXT:**
+{analysis_context}
+
+**INSTRUCTIONS:**
+Provide a comprehensive analysis focusing on:
+1. Identify all suspicious findings with specific evidence
+2. Calculate overall threat score (0-10) based on severity and confidence
+3. List key indicators of compromise or malicious activity
+4. Recommend specific next steps for investigation or remediation
+5. Provide executive summary suitable for management reporting"""
+
+
+def build_analysis_system_message() -> str:
+    """
+    Build system message for the analysis LLM.
+    
+    Returns:
+        System message string
+    """
+    return ANALYSIS_SYSTEM_MESSAGE
+
+
+def build_analysis_user_message_vars(state: Dict[str, Any], execution_status: str, 
+                                     execution_results: Dict[str, Any], 
+                                     evidence_directory: str, analysis_context: str,
+                                     chunk_info: Optional[str] = None) -> Dict[str, str]:
+    """
+    Build the values that fill ANALYSIS_USER_TEMPLATE.
+    
+    Args:
+        state: Current forensic state
+        execution_status: Status of execution
+        execution_results: Results from execution
+        evidence_directory: Path to evidence directory
+        analysis_context: Context for analysis
+        chunk_info: Information about chunk being analyzed
+        
+    Returns:
+        Template variables keyed by placeholder name
+    """
+    summary = execution_results.get('summary', {})
+    return {
+        "chunk_context": f" (analyzing {chunk_info})" if chunk_info else "",
+        "memory_dump_path": str(state.get('memory_dump_path', 'Unknown')),
+        "os_hint": str(state.get('os_hint', 'Unknown')),
+        "user_prompt": str(state.get('user_prompt', 'General malware analysis')),
+        "execution_status": str(execution_status),
+        "success_rate": f"{summary.get('success_rate', 0):.1%}",
+        "total_commands": str(summary.get('total_commands', 0)),
+        "successful_commands": str(summary.get('successful_commands', 0)),
+        "total_suspicious_hits": str(summary.get('total_suspicious_hits', 0)),
+        "evidence_directory": str(evidence_directory),
+        "analysis_context": analysis_context
+    }
+
 
 def build_analysis_user_message(state: Dict[str, Any], execution_status: str, 
                                execution_results: Dict[str, Any], 
@@ -269,33 +334,10 @@ def build_analysis_user_message(state: Dict[str, Any], execution_status: str,
     Returns:
         User message string
     """
-    chunk_context = f" (analyzing {chunk_info})" if chunk_info else ""
-    
-    return f"""Analyze the memory forensics investigation results below{chunk_context}:
-
-**INVESTIGATION CONTEXT:**
-- Memory Dump: {state.get('memory_dump_path', 'Unknown')}
-- Target OS: {state.get('os_hint', 'Unknown')}
-- Investigation Goals: {state.get('user_prompt', 'General malware analysis')}
-- Execution Status: {execution_status}
-- Success Rate: {execution_results.get('summary', {}).get('success_rate', 0):.1%}
-
-**EXECUTION SUMMARY:**
-- Total Commands: {execution_results.get('summary', {}).get('total_commands', 0)}
-- Successful Commands: {execution_results.get('summary', {}).get('successful_commands', 0)}
-- Suspicious Hits: {execution_results.get('summary', {}).get('total_suspicious_hits', 0)}
-- Evidence Directory: {evidence_directory}
-
-**ANALYSIS CONTEXT:**
-{analysis_context}
-
-**INSTRUCTIONS:**
-Provide a comprehensive analysis focusing on:
-1. Identify all suspicious findings with specific evidence
-2. Calculate overall threat score (0-10) based on severity and confidence
-3. List key indicators of compromise or malicious activity
-4. Recommend specific next steps for investigation or remediation
-5. Provide executive summary suitable for management reporting"""
+    return ANALYSIS_USER_TEMPLATE.format(**build_analysis_user_message_vars(
+        state, execution_status, execution_results, evidence_directory,
+        analysis_context, chunk_info
+    ))
 
 
 def build_deeper_analysis_system_message() -> str:
@@ -5,10 +5,30 @@ This module provides functions for counting tokens to manage LLM context limits
 and implement intelligent chunking strategies.
 """
 
+import functools
+import os
 import tiktoken
 from typing import List
 
 
+@functools.lru_cache(maxsize=None)
+def get_encoding(model: str = "gpt-4o") -> tiktoken.Encoding:
+    """
+    Return the tiktoken encoding for a model, resolved once per model name.
+    
+    Args:
+        model: Model name for encoding selection
+        
+    Returns:
+        Encoding for the model, or cl100k_base if the model is unknown
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Fallback to cl100k_base encoding if model not found
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def count_tokens(text: str, model: str = "gpt-4o") -> int:
     """
     Count tokens in text using tiktoken.
@@ -20,13 +40,27 @@ def count_tokens(text: str, model: str = "gpt-4o") -> int:
     Returns:
         Number of tokens in the text
     """
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-        return len(encoding.encode(text))
-    except KeyError:
-        # Fallback to cl100k_base encoding if model not found
-        encoding = tiktoken.get_encoding("cl100k_base")
-        return len(encoding.encode(text))
+    return len(get_encoding(model).encode(text))
+
+
+def count_tokens_batch(texts: List[str], model: str = "gpt-4o") -> List[int]:
+    """
+    Count tokens for many texts in one call.
+    
+    Uses tiktoken's threaded batch encoder, which releases the GIL while the
+    Rust BPE core runs, instead of one Python-level call per text.
+    
+    Args:
+        texts: Texts to count tokens for
+        model: Model name for encoding selection
+        
+    Returns:
+        Token counts, in the same order as ``texts``
+    """
+    if not texts:
+        return []
+    encoded = get_encoding(model).encode_ordinary_batch(texts, num_threads=os.cpu_count() or 1)
+    return list(map(len, encoded))
 
 
 def split_text_by_tokens(text: str, max_tokens: int, model: str = "gpt-4o") -> List[str]:
@@ -46,9 +80,9 @@ def split_text_by_tokens(text: str, max_tokens: int, model: str = "gpt-4o") -> L
     current_chunk = []
     current_tokens = 0
     
-    for line in lines:
-        line_tokens = count_tokens(line + '\n', model)
-        
+    line_token_counts = count_tokens_batch([line + '\n' for line in lines], model)
+    
+    for line, line_tokens in zip(lines, line_token_counts):
         # If adding this line would exceed the limit, start a new chunk
         if current_tokens + line_tokens > max_tokens and current_chunk:
             chunks.append('\n'.join(current_chunk))
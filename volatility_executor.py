@@ -5,17 +5,79 @@ This module provides comprehensive command execution capabilities for memory for
 investigations, with proper error handling, logging, and context preservation.
 """
 
+import functools
+import os
 import subprocess
 import shlex
 import json
 import time
 import hashlib
+import threading
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime
+from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is used instead
+    orjson = None
+
+
+def _json_line(obj: Dict[str, Any]) -> str:
+    """Serialize ``obj`` as one compact JSON line, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE).decode()
+    return json.dumps(obj) + "\n"
+
+
+def _json_indented_bytes(obj: Dict[str, Any]) -> bytes:
+    """Serialize ``obj`` as 2-space indented UTF-8 JSON, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# Volatility options that only affect progress feedback on stderr
+_VOL_QUIET_FLAGS = frozenset(("-q", "--quiet"))
+
+
+def canonical_command(command: str) -> str:
+    """
+    Normalize a command line for deduplication.
+    
+    Re-joins the shell-split arguments so commands that differ only in
+    whitespace or redundant quoting map to the same key. For Volatility
+    commands the dump path is resolved and quiet flags are dropped, since
+    neither changes the plugin output.
+    """
+    # A relative dump path resolves against the working directory
+    return _canonical_command(command, os.getcwd())
+
+
+@functools.lru_cache(maxsize=1024)
+def _canonical_command(command: str, cwd: str) -> str:
+    try:
+        argv = shlex.split(command)
+    except ValueError:  # unbalanced quotes; dedup on the raw text
+        return command
+    if not argv or argv[0] not in ('vol', 'vol3'):
+        return shlex.join(argv)
+    
+    normalized = []
+    args = iter(argv)
+    for arg in args:
+        if arg in _VOL_QUIET_FLAGS:
+            continue
+        normalized.append(arg)
+        if arg in ('-f', '--file'):
+            dump_path = next(args, None)
+            if dump_path is not None:
+                normalized.append(os.path.realpath(os.path.join(cwd, dump_path)))
+    return shlex.join(normalized)
+
 
 class ExecutionStatus(Enum):
     """Execution status enumeration."""
@@ -39,6 +101,7 @@ class CommandResult:
     file_hash: Optional[str] = None
     output_file: Optional[str] = None
     error_message: Optional[str] = None
+    duplicate_of: Optional[str] = None  # Earlier evidence file with identical output
 
 
 class VolatilityExecutor:
@@ -56,11 +119,25 @@ class VolatilityExecutor:
         self.base_output_dir = Path(base_output_dir)
         self.timeout = timeout
         self.shell_path = shell_path
-        self.execution_log = []
+        # Per-command records are streamed to logs/execution_log.jsonl; only
+        # the aggregates the summary needs are kept in memory
+        self._execution_start: Optional[str] = None
+        self._status_counts: Counter = Counter()
+        self._total_execution_time = 0.0
+        # Commands may run on several threads; serialize log writes
+        self._log_lock = threading.Lock()
         
         # Command deduplication tracking
-        self.executed_commands = {}  # Populated by execution node
+        self.executed_commands = {}  # canonical_command(cmd) -> record; populated by execution node
         self.skipped_duplicates = 0  # Count of skipped duplicate commands
+        # Phases may run concurrently; a command another phase is already
+        # running is waited for and reused rather than started again
+        self._dedup_lock = threading.Lock()
+        self._in_flight: Dict[str, threading.Event] = {}
+        # Output content hash -> evidence file; a command whose output matches
+        # an earlier one reuses that file instead of storing another copy
+        self.output_hashes: Dict[str, str] = {}
+        self.content_dedup_hits = 0
         
         # Create output directory structure
         self.base_output_dir.mkdir(parents=True, exist_ok=True)
@@ -79,6 +156,8 @@ class VolatilityExecutor:
         
         for dir_path in self.evidence_dirs.values():
             dir_path.mkdir(parents=True, exist_ok=True)
+        self._execution_log_file = self.evidence_dirs["logs"] / "execution_log.jsonl"
+        self._restore_log_aggregates()
 
     def execute_volatility_command(
         self, 
@@ -101,7 +180,8 @@ class VolatilityExecutor:
         Returns:
             CommandResult with execution details
         """
-        start_time = time.time()
+        # Durations come from the monotonic clock; the wall clock is read once
+        start_time = time.perf_counter()
         timestamp = datetime.now()
         
         # Security validation
@@ -144,7 +224,7 @@ class VolatilityExecutor:
                 timeout=self.timeout
             )
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             # Determine status
             if result.returncode == 0:
@@ -157,11 +237,26 @@ class VolatilityExecutor:
             # Save output if requested
             output_file = None
             file_hash = None
+            duplicate_of = None
             if save_output and result.stdout.strip():
-                output_file = self._save_command_output(
-                    command, result.stdout, category, timestamp
-                )
                 file_hash = self._calculate_hash(result.stdout)
+                with self._dedup_lock:
+                    duplicate_of = self.output_hashes.get(file_hash)
+                    if duplicate_of is not None:
+                        self.content_dedup_hits += 1
+                if duplicate_of is None:
+                    output_file = self._save_command_output(
+                        command, result.stdout, category, timestamp
+                    )
+                    with self._dedup_lock:
+                        self.output_hashes.setdefault(file_hash, str(output_file))
+                else:
+                    # Every command keeps an evidence file that names it; the
+                    # identical output itself is only stored once
+                    output_file = self._save_command_output(
+                        command, f"Output identical to: {duplicate_of}\nSHA256: {file_hash}\n", category, timestamp
+                    )
+                    print(f"♻️  Output identical to {duplicate_of} - not stored again")
             
             # Create result
             cmd_result = CommandResult(
@@ -174,7 +269,8 @@ class VolatilityExecutor:
                 timestamp=timestamp,
                 file_hash=file_hash,
                 output_file=str(output_file) if output_file else None,
-                error_message=error_message
+                error_message=error_message,
+                duplicate_of=duplicate_of
             )
             
             # Log execution
@@ -185,7 +281,7 @@ class VolatilityExecutor:
             return cmd_result
             
         except subprocess.TimeoutExpired:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             cmd_result = CommandResult(
                 command=command,
                 status=ExecutionStatus.TIMEOUT,
@@ -201,7 +297,7 @@ class VolatilityExecutor:
             return cmd_result
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             cmd_result = CommandResult(
                 command=command,
                 status=ExecutionStatus.FAILED,
@@ -216,6 +312,25 @@ class VolatilityExecutor:
             print(f"❌ Exception: {str(e)}")
             return cmd_result
 
+    def _claim_command(self, cmd: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the recorded result for canonical ``cmd``, or claim it for this thread.
+        
+        Waits for a concurrent phase already running ``cmd``. A ``None`` return
+        means the caller must run the command and then release its claim.
+        """
+        while True:
+            with self._dedup_lock:
+                cached = self.executed_commands.get(cmd)
+                if cached is not None:
+                    self.skipped_duplicates += 1
+                    return cached
+                pending = self._in_flight.get(cmd)
+                if pending is None:
+                    self._in_flight[cmd] = threading.Event()
+                    return None
+            pending.wait()
+    
     def execute_investigation_phase(
         self, 
         phase: Dict[str, Any], 
@@ -232,14 +347,15 @@ class VolatilityExecutor:
             Dictionary with phase execution results
         """
         phase_name = phase.get("name", "Unknown Phase")
-        phase_start = time.time()
+        phase_start = time.perf_counter()
+        phase_started_at = datetime.now()
         
         print(f"\n🎯 Starting Phase: {phase_name}")
         print("=" * 60)
         
         phase_results = {
             "phase_name": phase_name,
-            "start_time": datetime.now().isoformat(),
+            "start_time": phase_started_at.isoformat(),
             "steps": [],
             "summary": {}
         }
@@ -267,10 +383,11 @@ class VolatilityExecutor:
             step_results = []
             for cmd in step.get("commands", []):
                 # Check if this command was already executed (deduplication)
-                if hasattr(self, 'executed_commands') and cmd in self.executed_commands:
+                key = canonical_command(cmd)
+                cached = self._claim_command(key)
+                if cached is not None:
                     print(f"    ⏭️  Skipping duplicate: {cmd.split()[-1]}")
                     # Create a CommandResult from cached data
-                    cached = self.executed_commands[cmd]
                     result = CommandResult(
                         command=cmd,
                         status=ExecutionStatus(cached["status"]),
@@ -282,21 +399,24 @@ class VolatilityExecutor:
                         output_file=cached["output_file"],
                         error_message=None
                     )
-                    self.skipped_duplicates += 1
                 else:
-                    result = self.execute_volatility_command(
-                        command=cmd,
-                        context=step_context,
-                        save_output=True,
-                        category=self._get_category_from_phase(phase_name),
-                    )
-                    
-                    # Track this command for future deduplication
-                    if hasattr(self, 'executed_commands'):
-                        self.executed_commands[cmd] = {
-                            "status": result.status.value,
-                            "output_file": result.output_file
-                        }
+                    try:
+                        result = self.execute_volatility_command(
+                            command=cmd,
+                            context=step_context,
+                            save_output=True,
+                            category=self._get_category_from_phase(phase_name),
+                        )
+                        
+                        # Track this command for future deduplication
+                        with self._dedup_lock:
+                            self.executed_commands[key] = {
+                                "status": result.status.value,
+                                "output_file": result.output_file
+                            }
+                    finally:
+                        with self._dedup_lock:
+                            self._in_flight.pop(key).set()
                 
                 step_results.append(result)
             
@@ -313,7 +433,7 @@ class VolatilityExecutor:
             })
         
         # Phase summary
-        phase_time = time.time() - phase_start
+        phase_time = time.perf_counter() - phase_start
         total_commands = sum(len(step["results"]) for step in phase_results["steps"])
         successful_commands = sum(step["successful_commands"] for step in phase_results["steps"])
         total_hits = sum(step["suspicious_hits"] for step in phase_results["steps"])
@@ -324,7 +444,7 @@ class VolatilityExecutor:
             "successful_commands": successful_commands,
             "success_rate": successful_commands / total_commands if total_commands > 0 else 0,
             "total_hits": total_hits,
-            "end_time": datetime.now().isoformat()
+            "end_time": (phase_started_at + timedelta(seconds=phase_time)).isoformat()
         }
         
         print(f"\n✅ Phase Complete: {successful_commands}/{total_commands} commands successful")
@@ -423,8 +543,19 @@ class VolatilityExecutor:
         
         output_file = output_dir / filename
         
+        # Commands started in the same second on parallel threads can share a
+        # name; claim the file exclusively and add a counter on collision
+        suffix = 0
+        while True:
+            try:
+                f = open(output_file, 'x', encoding='utf-8')
+                break
+            except FileExistsError:
+                suffix += 1
+                output_file = output_dir / f"{timestamp_str}_{safe_cmd}_{suffix}.txt"
+        
         # Write output
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with f:
             f.write(f"Command: {command}\n")
             f.write(f"Timestamp: {timestamp.isoformat()}\n")
             f.write("=" * 60 + "\n")
@@ -445,15 +576,36 @@ class VolatilityExecutor:
             "execution_time": result.execution_time,
             "exit_code": result.exit_code,
             "output_file": result.output_file,
+            "duplicate_of": result.duplicate_of,
             "context": context
         }
         
-        self.execution_log.append(log_entry)
+        line = _json_line(log_entry)
         
-        # Also save to log file
-        log_file = self.evidence_dirs["logs"] / "execution_log.jsonl"
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(log_entry) + "\n")
+        with self._log_lock:
+            if self._execution_start is None:
+                self._execution_start = log_entry["timestamp"]
+            self._status_counts[log_entry["status"]] += 1
+            self._total_execution_time += result.execution_time
+            
+            with open(self._execution_log_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+    def _restore_log_aggregates(self):
+        """Rebuild the summary counters from an existing log, e.g. when a resumed run recreates the executor."""
+        try:
+            with open(self._execution_log_file, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:  # torn final line from an interrupted write
+                        continue
+                    if self._execution_start is None:
+                        self._execution_start = entry.get("timestamp")
+                    self._status_counts[entry.get("status")] += 1
+                    self._total_execution_time += entry.get("execution_time") or 0.0
+        except FileNotFoundError:
+            pass
 
     def _get_category_from_phase(self, phase_name: str) -> str:
         """Map phase name to output category."""
@@ -512,28 +664,31 @@ class VolatilityExecutor:
             "timestamp": result.timestamp.isoformat(),
             "output_file": result.output_file,
             "file_hash": result.file_hash,
+            "duplicate_of": result.duplicate_of,
             "error_message": result.error_message,
             "output_length": len(result.stdout) if result.stdout else 0
         }
 
     def save_execution_summary(self) -> str:
         """Save comprehensive execution summary."""
-        summary_file = self.evidence_dirs["logs"] / f"execution_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
-        summary = {
-            "execution_start": self.execution_log[0]["timestamp"] if self.execution_log else None,
-            "execution_end": datetime.now().isoformat(),
-            "total_commands": len(self.execution_log),
-            "successful_commands": len([log for log in self.execution_log if log["status"] == "success"]),
-            "failed_commands": len([log for log in self.execution_log if log["status"] == "failed"]),
-            "timeout_commands": len([log for log in self.execution_log if log["status"] == "timeout"]),
-            "total_execution_time": sum(log["execution_time"] for log in self.execution_log),
-            "evidence_directories": {k: str(v) for k, v in self.evidence_dirs.items()},
-            "detailed_log": self.execution_log
-        }
+        now = datetime.now()
+        summary_file = self.evidence_dirs["logs"] / f"execution_summary_{now.strftime('%Y%m%d_%H%M%S')}.json"
+        
+        with self._log_lock:
+            summary = {
+                "execution_start": self._execution_start,
+                "execution_end": now.isoformat(),
+                "total_commands": sum(self._status_counts.values()),
+                "successful_commands": self._status_counts["success"],
+                "failed_commands": self._status_counts["failed"],
+                "timeout_commands": self._status_counts["timeout"],
+                "total_execution_time": self._total_execution_time,
+                "evidence_directories": {k: str(v) for k, v in self.evidence_dirs.items()},
+                "detailed_log_file": str(self._execution_log_file)
+            }
         
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        with open(summary_file, 'wb') as f:
+            f.write(_json_indented_bytes(summary))
         
         return str(summary_file)
 